@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+import copy
+
+#class to hold everything that changes while a bracket is built: who's on each seed line in each region, where the
+#regions and the top four seeds' first weekends are played, who has a bid, and which conference winners are known
+#kept in a handful of small flat lists so a whole bracket can be saved and put back by copying them
+class BracketState:
+
+    #param team_names: every team that could make the field
+    #param first_weekend_sites: first weekend sites, once for each top-four seed they'll host
+    #param conference_winners: dict of conference: team that has won its tournament, or "" if nobody has yet
+    def __init__(self, team_names, first_weekend_sites, conference_winners):
+        self.team_ids = {team: index for index, team in enumerate(team_names)}
+        self.grid = [[""]*17 for region_num in range(0, 4)]      #[region][seed]: team, or "team1/team2" for a play-in. seed 0 is unused
+        self.sites = [[""]*5 for region_num in range(0, 4)]      #[region][seed]: first weekend site of a top-four seed
+        self.region_names = ["", "", "", ""]                     #regional site of each region
+        self.seeds = [-1]*len(team_names)                        #[team id]: seed, or -1 if not placed
+        self.regions = [-1]*len(team_names)                      #[team id]: region, or -1 if not placed
+        self.auto_bids = [False]*len(team_names)
+        self.at_large_bids = [False]*len(team_names)
+        self.first_weekend_sites = list(first_weekend_sites)     #sites nobody has taken yet
+        self.first_weekend_hosts = dict()                        #women's first weekend site: team hosting it
+        self.conference_winners = dict(conference_winners)
+        return
+
+    #returns: a copy of this state that can be changed without touching this one
+    def copy(self):
+        state = copy.copy(self)
+        state.grid = [list(region) for region in self.grid]
+        state.sites = [list(region_sites) for region_sites in self.sites]
+        state.region_names = list(self.region_names)
+        state.seeds = list(self.seeds)
+        state.regions = list(self.regions)
+        state.auto_bids = list(self.auto_bids)
+        state.at_large_bids = list(self.at_large_bids)
+        state.first_weekend_sites = list(self.first_weekend_sites)
+        state.first_weekend_hosts = dict(self.first_weekend_hosts)
+        state.conference_winners = dict(self.conference_winners)
+        return state
+
+    #put this state back the way a saved one was, reusing this one's lists
+    #param state: BracketState to copy from, e.g. one saved before anything was placed
+    def restore(self, state):
+        for region, saved_region in zip(self.grid, state.grid):
+            region[:] = saved_region
+        for region_sites, saved_region_sites in zip(self.sites, state.sites):
+            region_sites[:] = saved_region_sites
+        self.region_names[:] = state.region_names
+        self.seeds[:] = state.seeds
+        self.regions[:] = state.regions
+        self.auto_bids[:] = state.auto_bids
+        self.at_large_bids[:] = state.at_large_bids
+        self.first_weekend_sites[:] = state.first_weekend_sites
+        self.first_weekend_hosts.clear()
+        self.first_weekend_hosts.update(state.first_weekend_hosts)
+        self.conference_winners.clear()
+        self.conference_winners.update(state.conference_winners)
+
+    #put a team, or both teams in a play-in, on a seed line in a region
+    #param team: name of team, or "team1/team2"
+    #param region_num: region (0-3)
+    #param seed_num: seed (1-16)
+    def place(self, team, region_num, seed_num):
+        self.grid[region_num][seed_num] = team
+        for spot_team in team.split("/"):
+            self.seeds[self.team_ids[spot_team]] = seed_num
+            self.regions[self.team_ids[spot_team]] = region_num
+
+    #take whoever is on a seed line in a region back out of the bracket
+    #param region_num: region (0-3)
+    #param seed_num: seed (1-16)
+    def remove(self, region_num, seed_num):
+        if self.grid[region_num][seed_num]:
+            self.unplace(self.grid[region_num][seed_num])
+        self.grid[region_num][seed_num] = ""
+
+    #mark a team, or both teams in a play-in, as not placed without touching the grid
+    #param team: name of team, or "team1/team2"
+    def unplace(self, team):
+        for spot_team in team.split("/"):
+            self.seeds[self.team_ids[spot_team]] = -1
+            self.regions[self.team_ids[spot_team]] = -1
+
+    #returns: a team's seed, or -1 if it hasn't been placed
+    def get_seed(self, team):
+        return self.seeds[self.team_ids[team]]
+
+    #returns: a team's region, or -1 if it hasn't been placed
+    def get_region(self, team):
+        return self.regions[self.team_ids[team]]
+
+    def give_auto_bid(self, team):
+        self.auto_bids[self.team_ids[team]] = True
+
+    def give_at_large_bid(self, team):
+        self.at_large_bids[self.team_ids[team]] = True
+
+    def has_auto_bid(self, team):
+        return self.auto_bids[self.team_ids[team]]
+
+    def has_at_large_bid(self, team):
+        return self.at_large_bids[self.team_ids[team]]
@@ -2,35 +2,37 @@
 
 from itertools import permutations
 from datetime import date
-import math
+import numpy
+from bracketstate import BracketState
 
 AUTO_MAXES = {"2020": 32, "2021": 31, "2022": 32, "2023": 32, "2024": 32, "2025": 31, "2026": 31}
-TEAM_COORDINATES_FILE = "lib/team_locations.txt"
+LOWEST_REORG_SEED = 5           #the top four lines take their first weekend sites with them, so they're only reorganized alone
+MAX_PLACEMENT_NODES = 2000      #placements to try when reorganizing before moving a team down a seed instead
 
 #class to build a bracket from resume ratings of college basketball teams
 class Builder:
 
-    def __init__(self, m, year, teams, verbose, of, fws, fwr, rr, et, iss, it, cw, rtd, fu, mc):
+    def __init__(self, m, year, teams, verbose, of, fws, fwr, rr, et, iss, it, cw, rtd, fu, mc, sd):
         self.mens = m
         self.year = year
         self.teams = teams
         self.verbose = verbose
         self.outputfile = of
-        self.first_weekend_sites = fws
         self.first_weekend_rankings = fwr
         self.region_rankings = rr
         self.eliminated_teams = et
         self.ineligible_sites = iss
         self.ineligible_teams = it
-        self.conference_winners = cw
         self.reverse_team_dict = rtd
-        self.first_weekend_coords = dict()
         self.future = fu
         self.monte_carlo = mc
+        self.site_distances = sd
+        self.state = BracketState(list(teams), fws, cw)
         return
 
     #seed and print the field, including a bubble section
-    def select_seed_and_print_field(self):
+    #param seed_list: SeedList from the scoring pass, which gets the field and the bubble filled in
+    def select_seed_and_print_field(self, seed_list):
         curr_seed = 1
         num_curr_seed = 1
         curr_seed_max = 4
@@ -40,45 +42,61 @@ class Builder:
         bubble_string = "BUBBLE: \n"
         AUTO_MAX = AUTO_MAXES[self.year]
         AT_LARGE_MAX = 68 - AUTO_MAX
+        self.ranking = seed_list
+        self.ranking.field = list()
+        self.ranking.bubble = list()
+        conference_winners = self.state.conference_winners
         
-        for team in sorted(self.teams, key=lambda x: self.teams[x].score, reverse=True):
+        ranked = self.ranking.top
+        team_index = 0
+        while team_index < len(ranked):
+            team = ranked[team_index]
+            team_index += 1
+            #past the top of the list, only auto bids are left to hand out unless the at-larges and bubble aren't full yet
+            if team_index == len(self.ranking.top):
+                if at_large_bids < AT_LARGE_MAX or bubble_count < 8:
+                    ranked = ranked + self.ranking.get_rest()
+                else:
+                    ranked = ranked + self.ranking.get_rest(lambda x: x not in self.eliminated_teams and \
+                            x not in self.ineligible_teams and conference_winners[self.teams[x].conference] in ["", x])
             if team == "New-Haven":
                 continue
             at_large_bid = False
             if team in self.ineligible_teams:
                 continue
-            if team in self.eliminated_teams or (self.conference_winners[self.teams[team].conference] and \
-                    self.conference_winners[self.teams[team].conference] != team):
+            if team in self.eliminated_teams or (conference_winners[self.teams[team].conference] and \
+                    conference_winners[self.teams[team].conference] != team):
                 #teams under .500 are ineligible for at-large bids
                 if self.teams[team].record_pct < 0.5 and not self.future:
                     continue
                 if at_large_bids < AT_LARGE_MAX:
                     at_large_bids += 1
                     at_large_bid = True
-                    self.teams[team].at_large_bid = True
+                    self.state.give_at_large_bid(team)
                 elif bubble_count < 4:
                     bubble_string += (self.teams[team].team_out + " - First Four Out\n")
                     bubble_count += 1
-                    self.teams[team].seed = "FFO"
+                    self.ranking.bubble.append(team)
                     continue
                 elif bubble_count < 8:
                     bubble_string += (self.teams[team].team_out + " - Next Four Out\n")
                     bubble_count += 1
-                    self.teams[team].seed = "NFO"
+                    self.ranking.bubble.append(team)
                     continue
                 else:
                     continue
             else:
                 if self.teams[team].conference != "Independent" and \
-                        ((self.teams[team].conference in self.conference_winners and \
-                        self.conference_winners[self.teams[team].conference] == team) or \
-                        (self.conference_winners[self.teams[team].conference] == "" and \
+                        ((self.teams[team].conference in conference_winners and \
+                        conference_winners[self.teams[team].conference] == team) or \
+                        (conference_winners[self.teams[team].conference] == "" and \
                         team not in self.eliminated_teams and auto_bids < AUTO_MAX)):
                     auto_bids += 1
-                    self.conference_winners[self.teams[team].conference] = team
-                    self.teams[team].auto_bid = True
+                    conference_winners[self.teams[team].conference] = team
+                    self.state.give_auto_bid(team)
                 else:
                     continue
+            self.ranking.field.append(team)
             if not self.monte_carlo:
                 print("(" + str(curr_seed) + ") " + self.teams[team].team_out, end="")
             if at_large_bid:
@@ -106,13 +124,31 @@ class Builder:
         if not self.monte_carlo:
             print()
             print(bubble_string)
+        self.build_meeting_counts()
+
+    #count how many times each pair of teams in the field has met, so the bracket rules don't have to go through schedules
+    #meeting_counts[i, j] is how many of team i's games were against team j, and bit j of rematches[i] is set if there were any
+    def build_meeting_counts(self):
+        field = self.ranking.field
+        self.field_ids = {team: index for index, team in enumerate(field)}
+        self.meeting_counts = numpy.zeros((len(field), len(field)), dtype=numpy.int8)
+        self.rematches = [0]*len(field)
+        for team_id, team in enumerate(field):
+            opponents = [game.opponent for game in self.teams[team].games]
+            #by the time a monte carlo simulation builds its bracket, every future game has been played
+            if self.future or self.monte_carlo:
+                opponents += [game['opponent'] for game in self.teams[team].future_games]
+            for opponent in opponents:
+                if opponent in self.field_ids:
+                    self.meeting_counts[team_id, self.field_ids[opponent]] += 1
+                    self.rematches[team_id] |= 1 << self.field_ids[opponent]
 
     #get the maximum length of a line when printing the bracket (two team names + their seeds + some buffer)
     def get_max_len(self):
         l = []
         for coords in [[0, 1], [3, 2]]:
             for seed in range(1, 17):
-                l.append(len(self.regions[coords[0]][seed]) + len(self.regions[coords[1]][seed]))
+                l.append(len(self.state.grid[coords[0]][seed]) + len(self.state.grid[coords[1]][seed]))
         return 30 + max(l)
 
     #return a nicer-looking representation of a team's name, if one is present
@@ -129,35 +165,35 @@ class Builder:
     #param seed: seed of the teams to print
     def construct_line(self, max_len, region_1, region_2, seed):
         line = ""
-        team_1 = self.get_team_out(self.regions[region_1][seed])
-        team_2 = self.get_team_out(self.regions[region_2][seed])
-        if (seed == 16) or ("/" not in team_1 and self.teams[self.regions[region_1][seed]].auto_bid):
+        team_1 = self.get_team_out(self.state.grid[region_1][seed])
+        team_2 = self.get_team_out(self.state.grid[region_2][seed])
+        if (seed == 16) or ("/" not in team_1 and self.state.has_auto_bid(self.state.grid[region_1][seed])):
             team_1 += "*"
-        if (seed == 16) or ("/" not in team_2 and self.teams[self.regions[region_2][seed]].auto_bid):
+        if (seed == 16) or ("/" not in team_2 and self.state.has_auto_bid(self.state.grid[region_2][seed])):
             team_2 += "*"
-        max_site_len = max([len(x) for x in self.first_weekend_name_to_num])
+        max_site_len = max([len(x) for region_sites in self.state.sites for x in region_sites])
         line += " "*max_site_len + "(" + str(seed) + ") " + team_1 + \
                 " "*(max_len - (len(team_1) + len(team_2)) - (len(str(seed)) + 3)*2) + \
                 " (" + str(seed) + ") " + team_2 + "\n"
         if seed == 13:
-            region_1_name = self.region_num_to_name[region_1]
-            region_2_name = self.region_num_to_name[region_2]
+            region_1_name = self.state.region_names[region_1]
+            region_2_name = self.state.region_names[region_2]
             line += " "*(20 + max_site_len) + region_1_name + " "*max([max_len - (len(region_1_name) + len(region_2_name) + 40), 5]) + region_2_name
         elif seed == 16:
-            site_1 = self.first_weekend_num_to_name[region_1][1]
-            site_2 = self.first_weekend_num_to_name[region_2][1]
+            site_1 = self.state.sites[region_1][1]
+            site_2 = self.state.sites[region_2][1]
             line += site_1 + " "*(max_site_len - len(site_1) + 1) + " "*max_len + site_2
         elif seed == 12: 
-            site_1 = self.first_weekend_num_to_name[region_1][4]
-            site_2 = self.first_weekend_num_to_name[region_2][4]
+            site_1 = self.state.sites[region_1][4]
+            site_2 = self.state.sites[region_2][4]
             line += site_1 + " "*(max_site_len - len(site_1) + 1) + " "*max_len + site_2
         elif seed == 11: 
-            site_1 = self.first_weekend_num_to_name[region_1][3]
-            site_2 = self.first_weekend_num_to_name[region_2][3]
+            site_1 = self.state.sites[region_1][3]
+            site_2 = self.state.sites[region_2][3]
             line += site_1 + " "*(max_site_len - len(site_1) + 1) + " "*max_len + site_2
         elif seed == 10:
-            site_1 = self.first_weekend_num_to_name[region_1][2]
-            site_2 = self.first_weekend_num_to_name[region_2][2]
+            site_1 = self.state.sites[region_1][2]
+            site_2 = self.state.sites[region_2][2]
             line += site_1 + " "*(max_site_len - len(site_1) + 1) + " "*max_len + site_2
         return line
 
@@ -174,8 +210,8 @@ class Builder:
         
         team_conference = self.teams[team].conference
         if self.mens and seed_num > 4:   #men's teams can't play at their home court
-            first_weekend_site = self.first_weekend_num_to_name[region_num][self.get_host_seed(seed_num)]
-            region_site = self.region_num_to_name[region_num]
+            first_weekend_site = self.state.sites[region_num][self.get_host_seed(seed_num)]
+            region_site = self.state.region_names[region_num]
             for site in [first_weekend_site, region_site]:
                 #TODO I don't think women can play at their regional site either...
                 if team in self.ineligible_sites[site]:
@@ -188,13 +224,10 @@ class Builder:
             for test_team in self.conferences[team_conference][:3]:
                 if test_team == team:
                     continue
-                try:
-                    if self.teams[test_team].region == region_num and self.teams[test_team].seed <= 4:
-                        if self.verbose:
-                            print("multiple top four teams can't all go here", region_num, self.conferences[team_conference])
-                        return False
-                except AttributeError:      #there are two teams from this conference in the play-ins
-                    continue
+                if self.state.get_region(test_team) == region_num and self.state.get_seed(test_team) <= 4:
+                    if self.verbose:
+                        print("multiple top four teams can't all go here", region_num, self.conferences[team_conference])
+                    return False
 
         #two teams from the same conference cannot meet before the...
             #...regional final (Elite 8) if they've played 3 times
@@ -203,20 +236,11 @@ class Builder:
         for test_team in self.conferences[team_conference]:
             if test_team == team:
                 continue
-            try:
-                if self.teams[test_team].region != region_num or self.teams[test_team].region == -1:
-                    continue
-            except AttributeError:      #there are two teams from this conference in the play-ins
+            if self.state.get_region(test_team) != region_num:    #includes teams that haven't been placed yet
                 continue
-            game_count = 0
-            for game in self.teams[test_team].games:
-                if game.opponent == team:
-                    game_count += 1
-            if self.future:
-                for game in self.teams[test_team].future_games:
-                    if game['opponent'] == team:
-                        game_count += 1
-            if self.teams[test_team].seed + seed_num == 17: #first round matchup
+            test_seed = self.state.get_seed(test_team)
+            game_count = self.meeting_counts[self.field_ids[test_team], self.field_ids[team]]
+            if test_seed + seed_num == 17: #first round matchup
                 if self.verbose:
                     print("teams are meeting too early in this region", region_num, team, test_team)
                 return False
@@ -226,32 +250,26 @@ class Builder:
             #The team object doesn't have that information.
             if game_count >= 2:     #sweet 16 matchup
                 for seed_set in [[1, 16, 8, 9], [5, 12, 4, 13], [6, 11, 3, 14], [7, 10, 2, 15]]:
-                    if self.teams[test_team].seed in seed_set and seed_num in seed_set and not for_play_in \
-                            and self.teams[test_team].seed != seed_num:
+                    if test_seed in seed_set and seed_num in seed_set and not for_play_in \
+                            and test_seed != seed_num:
                         if self.verbose:
                             print("teams are meeting tooo early in this region", region_num, team, test_team)
                         return False
             if game_count >= 3:     #elite 8 matchup
                 for seed_set in [[1, 16, 8, 9, 5, 12, 4, 13], [6, 11, 3, 14, 7, 10, 2, 15]]:
-                    if self.teams[test_team].seed in seed_set and seed_num in seed_set and not for_play_in \
-                            and self.teams[test_team].seed != seed_num:
+                    if test_seed in seed_set and seed_num in seed_set and not for_play_in \
+                            and test_seed != seed_num:
                         if self.verbose:
                             print("teams are meeting toooo early in this region", region_num, team, test_team)
                         return False
 
         #Want to avoid regular season rematches in the first round
-        if 17 - seed_num in self.regions[region_num]:
-            for game in self.teams[team].games:
-                if game.opponent == self.regions[region_num][17 - seed_num]:
-                    if self.verbose:
-                        print("regular season rematch in the first round")
-                    return False
-        if self.future and 17 - seed_num in self.regions[region_num]:
-            for game in self.teams[team].future_games:
-                if game['opponent'] == self.regions[region_num][17 - seed_num]:
-                    if self.verbose:
-                        print("regular season rematch in the first round")
-                    return False
+        opponent = self.state.grid[region_num][17 - seed_num]
+        if opponent in self.field_ids:
+            if self.rematches[self.field_ids[team]] >> self.field_ids[opponent] & 1:
+                if self.verbose:
+                    print("regular season rematch in the first round")
+                return False
 
         return True
 
@@ -262,23 +280,15 @@ class Builder:
     def delete_and_save_seed(self, seed_num):
         teams_to_fix = list()
         sites = list()
-        for region_num, region in enumerate(self.regions):
-            if seed_num in region:
-                save_team = region[seed_num]
+        for region_num in range(0, 4):
+            save_team = self.state.grid[region_num][seed_num]
+            if save_team:
                 teams_to_fix.append(save_team)
-                if "/" in save_team:
-                    self.teams[save_team.split("/")[0]].region = -1
-                    self.teams[save_team.split("/")[1]].region = -1
-                    self.teams[save_team.split("/")[0]].seed = -1
-                    self.teams[save_team.split("/")[1]].seed = -1
-                else:
-                    self.teams[save_team].region = -1
-                    self.teams[save_team].seed = -1
-                del region[seed_num]
+                self.state.remove(region_num, seed_num)
                 if seed_num < 5:
-                    if seed_num in self.first_weekend_num_to_name[region_num]:
-                        sites.append([save_team, region_num, self.first_weekend_num_to_name[region_num][seed_num]])
-                        del self.first_weekend_num_to_name[region_num][seed_num]
+                    if self.state.sites[region_num][seed_num]:
+                        sites.append([save_team, region_num, self.state.sites[region_num][seed_num]])
+                        self.state.sites[region_num][seed_num] = ""
         #if the seed wasn't fully filled out, put placeholders in
         while len(teams_to_fix) < 4:
             teams_to_fix.append("")
@@ -309,25 +319,15 @@ class Builder:
         for region_num in range(0, 4):
             team = perm[region_num]
             if not team:
-                if seed_num in self.first_weekend_num_to_name[region_num]:
-                    del self.first_weekend_num_to_name[region_num][seed_num]
-                if seed_num in self.regions[region_num]:
-                    del self.regions[region_num][seed_num]
+                if seed_num < 5:
+                    self.state.sites[region_num][seed_num] = ""
+                self.state.remove(region_num, seed_num)
                 continue
-            self.regions[region_num][seed_num] = team
-            if "/" in team:
-                self.teams[team.split("/")[0]].region = region_num
-                self.teams[team.split("/")[1]].region = region_num
-                self.teams[team.split("/")[0]].seed = seed_num
-                self.teams[team.split("/")[1]].seed = seed_num
-            else:
-                self.teams[team].region = region_num
-                self.teams[team].seed = seed_num
+            self.state.place(team, region_num, seed_num)
             if seed_num < 5:
                 for team_site in sites:
                     if team_site[0] == team:
-                        self.first_weekend_num_to_name[region_num][seed_num] = team_site[2]
-                        self.first_weekend_name_to_num[team_site[2]][self.first_weekend_name_to_num[team_site[2]].index([team_site[1], seed_num])] = [region_num, seed_num]
+                        self.state.sites[region_num][seed_num] = team_site[2]
                         team_site[1] = region_num
             if self.verbose:
                 print("Placed (" + str(seed_num) + ") " + team + ": region (" + str(region_num) + ")")
@@ -350,33 +350,24 @@ class Builder:
         order = list()
         if seed_num < 5:
             for site in self.region_rankings[team]:
-                order.append(self.region_name_to_num[site])
+                order.append(self.state.region_names.index(site))
         else:
             #construct list of possible sites
             host_seed = self.get_host_seed(seed_num)
-            possible_sites = list()
-            for index, region in enumerate(self.first_weekend_num_to_name):
-                try:
-                    possible_sites.append(region[host_seed])
-                except KeyError:
-                    print(team, seed_num)
-                    print(self.regions)
-                    print(self.first_weekend_num_to_name)
-                    raise KeyError
+            possible_sites = [region_sites[host_seed] for region_sites in self.state.sites]
+            if "" in possible_sites:
+                print(team, seed_num)
+                print(self.state.grid)
+                print(self.state.sites)
+                raise KeyError
             if self.mens:
                 for site in self.first_weekend_rankings[team]:
                     while site in possible_sites:
                         order.append(possible_sites.index(site))
                         possible_sites[possible_sites.index(site)] = ""
             else:   #womens
-                site_distances = dict()
-                for site in self.first_weekend_coords:
-                    distance = math.sqrt((self.teams[team].latitude - self.first_weekend_coords[site][0])**2 + \
-                            (self.teams[team].longitude - self.first_weekend_coords[site][1])**2)
-                    site_distances[site] = distance
-                site_order = list()
-                for site in sorted(site_distances, key=lambda x: site_distances[x]):
-                    site_order.append(site)
+                hosts = self.state.first_weekend_hosts
+                site_order = sorted(hosts, key=lambda site: self.site_distances.get_host_distance(team, hosts[site]))
                 for site in site_order:
                     while site in possible_sites:
                         order.append(possible_sites.index(site))
@@ -388,13 +379,11 @@ class Builder:
     #returns: list of four numbers corresponding to the four region scores
     def get_region_scores(self, sorted_teams):
         scores = list()
-        for region in self.regions:
+        for region in self.state.grid:
             region_score = 0
-            for seed in region:
-                if seed == "score":
-                    continue
-                region_score += sorted_teams.index(region[seed])
-            region["score"] = region_score
+            for team in region[1:]:
+                if team:
+                    region_score += sorted_teams.index(team)
             scores.append(region_score)
         return scores
 
@@ -406,7 +395,7 @@ class Builder:
         while max(scores) > min(scores) + 5:
             if self.verbose:
                 print("have to rearrange regions, one is too strong/weak")
-            if 4 not in self.regions[0]:
+            if not self.state.grid[0][4]:
                 #couldn't find one that worked. eh. we tried.
                 self.save_and_print_perm(4, bad_perms[0], sites)
                 break
@@ -424,8 +413,6 @@ class Builder:
                 bad_perms = [bad_perms[0]]
                 continue
             scores = self.get_region_scores(sorted_teams)
-        for region in self.regions:
-            del region["score"]
 
     #create matchups for the two play-in games. avoid matching up two teams from a conference if possible
     #param teams: a list of four team names in the play-in
@@ -451,7 +438,7 @@ class Builder:
             self.place_team(region_num, seeds[0], matchup_1)
             if self.verbose:
                 print("Placed (" + str(seeds[0]) + ") " + matchup_1 + \
-                    ": region (" + str(region_num) + ") " + self.region_num_to_name[region_num])
+                    ": region (" + str(region_num) + ") " + self.state.region_names[region_num])
 
         region_order = self.get_region_order(matchups[1][0], seeds[2])
         save_team_2, region_num = self.find_team_spot(matchup_2, \
@@ -461,7 +448,7 @@ class Builder:
             self.place_team(region_num, seeds[2], matchup_2)
             if self.verbose:
                 print("Placed (" + str(seeds[2]) + ") " + matchup_2 + \
-                    ": region (" + str(region_num) + ") " + self.region_num_to_name[region_num])
+                    ": region (" + str(region_num) + ") " + self.state.region_names[region_num])
                 print()
         if len(save_team_1) and len(save_team_2):
             return tuple([save_team_1, save_team_2])
@@ -469,17 +456,6 @@ class Builder:
             return save_team_1
         return save_team_2
 
-    def replace_from_sites(self, seed_num, sites):
-        for team in sites:
-            team_name = team[0]
-            region_num = team[1]
-            site_name = team[2]
-            self.regions[region_num][seed_num] = team_name
-            self.first_weekend_name_to_num[site_name].append([region_num, seed_num])
-            self.first_weekend_num_to_name[region_num][seed_num] = site_name
-            self.teams[team_name].region = region_num
-            self.teams[team_name].seed = seed_num
- 
     #find a place in the bracket where a team can fit
     #param team: string of team to place
     #param region_num: region number (0-3) to try to place the team in
@@ -504,29 +480,22 @@ class Builder:
                 print('edited region to', region_num)
 
             #find a region that doesn't have this seed in it (or, if switching is on, try to switch that team for current team)
-            while seed_num in self.regions[region_num]:
+            while self.state.grid[region_num][seed_num]:
                 if self.verbose:
                     print('already this seed in', str(region_num))
-                new_team = self.regions[region_num][seed_num]
+                new_team = self.state.grid[region_num][seed_num]
                 if "/" in new_team:
                     new_for_play_in = True
                 else:
                     new_for_play_in = False
                 if check_switch and self.check_rules(team, region_num, seed_num, for_play_in) and \
                         self.check_rules(new_team, orig_region_num, seed_num, new_for_play_in):
-                    self.regions[orig_region_num][seed_num] = new_team
-                    if new_for_play_in:
-                        self.teams[new_team.split('/')[0]].region = orig_region_num
-                        self.teams[new_team.split('/')[1]].region = orig_region_num
-                    else:
-                        self.teams[new_team].region = orig_region_num
+                    self.state.place(new_team, orig_region_num, seed_num)
                     if seed_num < 5:
-                        site = self.first_weekend_num_to_name[region_num][seed_num]
-                        self.first_weekend_num_to_name[orig_region_num][seed_num] = site
-                        del self.first_weekend_num_to_name[region_num][seed_num]
-                        self.first_weekend_name_to_num[site][self.first_weekend_name_to_num[site].index([region_num, seed_num])] = [orig_region_num, seed_num]
+                        self.state.sites[orig_region_num][seed_num] = self.state.sites[region_num][seed_num]
+                        self.state.sites[region_num][seed_num] = ""
                     if self.verbose:
-                        print("Switched (" + str(seed_num) + ") " + new_team + " to: region (" + str(orig_region_num) + ") " + self.region_num_to_name[orig_region_num])
+                        print("Switched (" + str(seed_num) + ") " + new_team + " to: region (" + str(orig_region_num) + ") " + self.state.region_names[orig_region_num])
                     bad_regions = set()
                     break
                 bad_regions.add(region_num)
@@ -549,140 +518,158 @@ class Builder:
                 region_num = orig_region_num
                 continue
 
-            #if we have tried to switch teams, try every permutation for the current seed
+            #if we have tried to switch teams, solve for the current seed line (and the lines above it if we have to)
             if len(bad_regions) == 4 and check_switch == True:
                 if self.verbose:
-                    print("can't make just one switch to fix this. Let's try to brute force it.")
-                reorg_seed = seed_num
-                teams_to_fix, sites = self.delete_and_save_seed(seed_num)
-                if team not in teams_to_fix:
-                    teams_to_fix[-1] = team
-                if "/" in team:
-                    for play_in_team in team.split("/"):
-                        self.teams[play_in_team].region = -1
-                        self.teams[play_in_team].seed = -1
-                else:
-                    self.teams[team].region = -1
-                    self.teams[team].seed = -1
-                found_perm = False
-                for perm in permutations(teams_to_fix):
-                    if self.check_perm(perm, seed_num, team, for_play_in):
-                        self.save_and_print_perm(seed_num, perm, sites)
-                        region_num = perm.index(team)
-                        found_perm = True
-                        break
-
-                #if no permutation works, work backward through the seed list trying every permutation of those seeds as well as ours
-                if not found_perm:
-                    found_perm, save_team, region_num = self.try_reorganize(team, seed_num, reorg_seed, teams_to_fix, \
-                            sites, for_play_in)
-                    if save_team:
-                        break
+                    print("can't make just one switch to fix this. Let's solve for it.")
+                save_team, region_num = self.solve_placement(team, seed_num, for_play_in)
+                break
         return save_team, region_num
 
-    #recurse up the seed list, trying to brute-force a fix to fit all of the teams in the bracket
-    def try_reorganize(self, team, seed_num, reorg_seed, teams_to_fix, sites, for_play_in):
-        tries = 0
-        curr_reorg_max = 3  #lowest-numbered seed to try reorganizing
-        while True:
-            reorg_seed -= 1
-            if reorg_seed < curr_reorg_max:
-                #run through it 100 times
-                tries += 1
-                if tries <= 100:
-                    #don't want to mess up region positioning if possible
-                    if self.verbose:
-                        print("Retrying from beginning")
-                    reorg_seed = seed_num
-                else:
-                    tries = 0
-                    curr_reorg_max -= 1     #can start trying to reorganize with lower seeds as we go
-                    if curr_reorg_max < 3:
-                        save_team = [team, seed_num]
-                        if self.verbose:
-                            print("moving", team, "down from", seed_num)
-                        for fixing_count, fixing_team in enumerate(teams_to_fix):
-                            if fixing_team and fixing_team != team:
-                                self.regions[fixing_count][seed_num] = fixing_team
-                        return False, save_team, -1
-            if reorg_seed == curr_reorg_max:    #we've gone as far as we can go
-                if self.verbose:
-                    print("Moving", team, "down from", seed_num)
-                if seed_num < 5:
-                    self.replace_from_sites(seed_num, sites)
-                else:
-                    index = 3
-                    while index > 0:
-                        if teams_to_fix[index]:
-                            teams_to_fix[index] = ""
-                            break
-                        index -= 1
-                    for perm in permutations(teams_to_fix):
-                        if self.verbose:
-                            print(perm)
-                        if self.check_perm(perm, seed_num, team, for_play_in):
-                            self.save_and_print_perm(seed_num, perm, [])
-                            return False, [team, seed_num], -1
-                    
-                    #oops, we messed up the bracket such that we can't fit the original teams back in. hopefully we can fix it.
-                    found_perm, second_save_team, region_num = self.try_reorganize(teams_to_fix[0], seed_num, reorg_seed, teams_to_fix, \
-                            sites, for_play_in)
-                    if found_perm:
-                        return False, [team, seed_num], -1
-                    raise IndexError
+    #fit a team that greedy placement and switching couldn't, by solving for its seed line and then for more and more
+    #of the lines above it at once. each try is a backtracking search over those lines' (seed, region) slots, bottom line
+    #first. after every placement the slots left are checked ahead, so a dead end is dropped as soon as some team on a line
+    #has nowhere left to go instead of after every arrangement of the lines above it has been tried
+    #param team: string of team to place
+    #param seed_num: seed at which to place the team
+    #param for_play_in: whether this team is actually two teams that are matched up in a play-in game
+    #returns: [team, seed_num] and -1 if the team has to move down a seed, otherwise () and the region it was placed in
+    def solve_placement(self, team, seed_num, for_play_in):
+        top_seed = seed_num if seed_num < LOWEST_REORG_SEED else LOWEST_REORG_SEED
+        #the lines as they stand now, and the first weekend site each top-four seed takes with it when it moves
+        original = dict()
+        team_sites = dict()
+        for line_seed in range(top_seed, seed_num + 1):
+            original[line_seed] = [region[line_seed] for region in self.state.grid]
+            for region_num, line_team in enumerate(original[line_seed]):
+                if line_team and line_seed < 5 and self.state.sites[region_num][line_seed]:
+                    team_sites[line_team] = self.state.sites[region_num][line_seed]
+        saved_sites = [list(region_sites) for region_sites in self.state.sites]
+        nodes = 0
+
+        def assign(line_team, region_num, line_seed):
+            if line_team:
+                self.place_team(region_num, line_seed, line_team)
+                if line_team in team_sites:
+                    self.state.sites[region_num][line_seed] = team_sites[line_team]
+
+        def unassign(line_team, region_num, line_seed):
+            if line_team:
+                self.state.remove(region_num, line_seed)
+                if line_team in team_sites:
+                    self.state.sites[region_num][line_seed] = ""
+
+        def fits(line_team, region_num, line_seed):
+            play_in = for_play_in and line_team and (line_team == team or "/" in line_team)
+            if not self.check_rules(line_team, region_num, line_seed, play_in):
+                return False
+            #a top-four seed brings its site along, so the lower seeds it hosts have to be able to play there
+            if self.mens and line_team in team_sites:
+                for hosted_seed in range(5, 17):
+                    if self.get_host_seed(hosted_seed) != line_seed or not self.state.grid[region_num][hosted_seed]:
+                        continue
+                    for hosted_team in self.state.grid[region_num][hosted_seed].split("/"):
+                        if hosted_team in self.ineligible_sites[team_sites[line_team]]:
+                            return False
+            return True
+
+        #every team left on a line still needs its own empty slot on that line
+        def can_match(slot_domains, used):
+            if not slot_domains:
+                return True
+            return any(can_match(slot_domains[1:], used | {x}) for x in slot_domains[0] if x not in used)
+
+        def search(slots, pools, domains, index, chosen):
+            nonlocal nodes
+            if index == len(slots):
+                return True
+            line_seed, region_num = slots[index]
+            tried = set()
+            for value in domains[index]:
+                line_team = pools[line_seed][value]
+                if line_team in tried:
                     continue
-                return False, [team, seed_num], -1
+                tried.add(line_team)
+                nodes += 1
+                if nodes > MAX_PLACEMENT_NODES:
+                    return False
+                assign(line_team, region_num, line_seed)
+                chosen[index] = value
+                #the rules don't always look both ways, so the teams already in this region have to be fine with the new one
+                if not all(fits(pools[slots[prev_index][0]][chosen[prev_index]], region_num, slots[prev_index][0]) \
+                        for prev_index in range(0, index) if slots[prev_index][1] == region_num):
+                    unassign(line_team, region_num, line_seed)
+                    continue
+                #this team is off the market for the rest of its line, and the rest of its region has a new neighbor
+                next_domains = list(domains)
+                for next_index in range(index + 1, len(slots)):
+                    next_seed, next_region = slots[next_index]
+                    if next_seed == line_seed:
+                        next_domains[next_index] = [x for x in domains[next_index] if x != value]
+                    elif next_region == region_num:
+                        next_domains[next_index] = [x for x in domains[next_index] \
+                                if fits(pools[next_seed][x], next_region, next_seed)]
+                if all(can_match([next_domains[next_index] for next_index in range(index + 1, len(slots)) \
+                        if slots[next_index][0] == pool_seed], frozenset()) for pool_seed in pools) and \
+                        search(slots, pools, next_domains, index + 1, chosen):
+                    return True
+                unassign(line_team, region_num, line_seed)
+            return False
+
+        #start with just this team's line, then pull in one more line above it each time that doesn't work
+        for first_seed in range(seed_num, top_seed - 1, -1):
+            pools = dict()
+            for line_seed in range(seed_num, first_seed - 1, -1):
+                pools[line_seed] = [line_team for line_team in original[line_seed] if line_team]
+                while len(pools[line_seed]) < 4:
+                    pools[line_seed].append("")
+                for region_num, line_team in enumerate(original[line_seed]):
+                    unassign(line_team, region_num, line_seed)
+            if team not in pools[seed_num]:
+                pools[seed_num][-1] = team
+            self.state.unplace(team)
+            slots = [(line_seed, region_num) for line_seed in pools for region_num in range(0, 4)]
+            domains = [[x for x in range(0, 4) if fits(pools[line_seed][x], region_num, line_seed)] \
+                    for line_seed, region_num in slots]
             if self.verbose:
-                print('trying the next seed up', reorg_seed)
-            other_teams_to_fix, other_sites = self.delete_and_save_seed(reorg_seed)
-            perm_to_save = list()
-            for other_perm in permutations(other_teams_to_fix):
-                if self.check_perm(other_perm, reorg_seed, "", for_play_in):
-                    self.save_and_print_perm(reorg_seed, other_perm, other_sites)
-                    perm_to_save = other_perm
-                    for perm in permutations(teams_to_fix):
-                        if self.check_perm(perm, seed_num, team, for_play_in):
-                            self.save_and_print_perm(seed_num, perm, sites)
-                            region_num = perm.index(team)
-                            return True, [], region_num
-            #if nothing worked, save the most recent successful try for this seed and recurse up the seed list
-            #this also allows us to loop back through the seeds and have different results
-            if perm_to_save:
-                self.save_and_print_perm(reorg_seed, perm_to_save, other_sites)
-            else:
-                print(self.regions)
-                print(teams_to_fix, seed_num)
-                print(other_teams_to_fix, reorg_seed)
-                raise IndexError
-        return True, [], region_num
+                print("solving seeds", first_seed, "through", seed_num, pools)
+            if all(can_match([domain for slot, domain in zip(slots, domains) if slot[0] == pool_seed], frozenset()) \
+                    for pool_seed in pools) and search(slots, pools, domains, 0, [None]*len(slots)):
+                if self.verbose:
+                    for line_seed in pools:
+                        print("Placed (" + str(line_seed) + ")", [region[line_seed] for region in self.state.grid])
+                return (), self.state.get_region(team.split("/")[0])
+            for region_sites, saved_region_sites in zip(self.state.sites, saved_sites):
+                region_sites[:] = saved_region_sites
+            for line_seed in pools:
+                for region_num, line_team in enumerate(original[line_seed]):
+                    assign(line_team, region_num, line_seed)
+            if nodes > MAX_PLACEMENT_NODES:
+                break
+
+        if self.verbose:
+            print("Moving", team, "down from", seed_num)
+        return [team, seed_num], -1
 
     #actually place a team in the bracket after finding a spot for it
     #param region_num: region in which to place the team
     #param seed_num: seed at which to place the team
     #param team: string of team name
     def place_team(self, region_num, seed_num, team):
-        self.regions[region_num][seed_num] = team
-        if "/" in team:
-            self.teams[team.split('/')[0]].region = region_num
-            self.teams[team.split('/')[0]].seed = seed_num
-            self.teams[team.split('/')[1]].region = region_num
-            self.teams[team.split('/')[1]].seed = seed_num
-        else:
-            self.teams[team].region = region_num
-            self.teams[team].seed = seed_num
+        self.state.place(team, region_num, seed_num)
 
     #find the first region (according to a team's preferences) that has an empty spot
     #param seed_num: seed at which to place the team
     #param region_num: region in which to attempt to place the team
     #param region_order: order of a team's preferences
     def get_region_num(self, seed_num, region_num, region_order):
-        while seed_num in self.regions[region_num]:
+        while self.state.grid[region_num][seed_num]:
             if seed_num > 1:
                 try:
                     region_num = region_order[region_order.index(region_num)+1]
                 except IndexError:
                     print(seed_num, region_order, region_num)
-                    print(self.regions)
+                    print(self.state.grid)
                     raise IndexError
             else:
                 region_num = (region_num + 1) % 4
@@ -696,10 +683,9 @@ class Builder:
     #choose a regional site that a #1 seed will play at
     def choose_regional(self, team, seed_num, region_num):
         for site_name in self.region_rankings[team]:
-            if site_name not in self.region_name_to_num and \
-                    (not self.first_weekend_sites or team not in self.ineligible_sites[site_name]):
-                self.region_name_to_num[site_name] = region_num
-                self.region_num_to_name[region_num] = site_name
+            if site_name not in self.state.region_names and \
+                    (not self.state.first_weekend_sites or team not in self.ineligible_sites[site_name]):
+                self.state.region_names[region_num] = site_name
                 if self.verbose:
                     print(site_name, "chosen for", region_num)
                 break
@@ -708,77 +694,48 @@ class Builder:
     def choose_first_weekend(self, team, region_num, seed_num, team_index):
         if self.mens:
             for site_name in self.first_weekend_rankings[team]:
-                if site_name in self.first_weekend_sites and team not in self.ineligible_sites[site_name]:
+                if site_name in self.state.first_weekend_sites and team not in self.ineligible_sites[site_name]:
                     if self.verbose:
                         print("Choosing", site_name)
-                    self.first_weekend_sites.remove(site_name)
-                    if site_name in self.first_weekend_name_to_num:
-                        self.first_weekend_name_to_num[site_name].append([region_num, seed_num])
-                    else:
-                        self.first_weekend_name_to_num[site_name] = [[region_num, seed_num]]
-                    self.first_weekend_num_to_name[region_num][seed_num] = site_name
+                    self.state.first_weekend_sites.remove(site_name)
+                    self.state.sites[region_num][seed_num] = site_name
                     break
-            if seed_num not in self.first_weekend_num_to_name[region_num]:
+            if not self.state.sites[region_num][seed_num]:
                 if self.verbose:
                     print("no remaining sites work for", team)
                 #couldn't choose a site bc the only site left is one where a team is ineligible to play at
-                sorted_teams = sorted(self.teams, key=lambda x: self.teams[x].score, reverse=True)
-                remaining_site = self.first_weekend_sites[0]
+                sorted_teams = self.ranking.field
+                remaining_site = self.state.first_weekend_sites[0]
                 check_team_index = team_index
                 #grab previously-placed team. thanks for making this difficult, BYU
                 while True:
                     check_team_index -= 1
-                    team_to_switch = self.teams[sorted_teams[check_team_index]]
+                    team_to_switch = sorted_teams[check_team_index]
                     if self.verbose:
-                        print("try to switch with", team_to_switch.team_out)
-                    if self.teams[sorted_teams[check_team_index]].seed < 1: #team hasn't been placed
+                        print("try to switch with", self.teams[team_to_switch].team_out)
+                    if self.state.get_seed(team_to_switch) < 1: #team hasn't been placed
                         continue
-                    team_switch_site = self.first_weekend_num_to_name[team_to_switch.region][team_to_switch.seed]
-                    if team_switch_site in self.first_weekend_sites: #we already know the team can't go there
+                    team_switch_site = self.state.sites[self.state.get_region(team_to_switch)][self.state.get_seed(team_to_switch)]
+                    if team_switch_site in self.state.first_weekend_sites: #we already know the team can't go there
                         continue
                     if team in self.ineligible_sites[team_switch_site]: #BYU, you can't go here either
                         continue
-                    self.do_site_switch(team_to_switch, team_switch_site, self.first_weekend_sites[0], region_num, seed_num)
+                    self.do_site_switch(team_to_switch, team_switch_site, remaining_site, region_num, seed_num)
                     break
 
         else:   #womens
             site_name = self.get_team_out(team)
-            self.first_weekend_name_to_num[site_name] = [[region_num, seed_num]]
-            self.first_weekend_num_to_name[region_num][seed_num] = site_name
-            f = open(TEAM_COORDINATES_FILE)
-            for line in f:
-                site_team = line[:line.find("[")]
-                if site_team == team:
-                    latitude = float(line[line.find("[")+1:line.find(" N, ")-1])
-                    longitude = float(line[line.find(" N, ")+4:line.find(" W]")-1])
-                    break
-            self.first_weekend_coords[site_name] = [latitude, longitude]
+            self.state.sites[region_num][seed_num] = site_name
+            self.state.first_weekend_hosts[site_name] = team
                
     def do_site_switch(self, team_to_switch, team_switch_site, remaining_site, region_num, seed_num):
-        self.first_weekend_num_to_name[region_num][seed_num] = team_switch_site
-        coord_index = 0
-        switch_site_list = self.first_weekend_name_to_num[team_switch_site]
-        while coord_index < len(switch_site_list):
-            if switch_site_list[coord_index][0] == team_to_switch.region and switch_site_list[coord_index][1] == team_to_switch.seed:
-                del self.first_weekend_name_to_num[team_switch_site][coord_index]
-                break
-            coord_index += 1
-        self.first_weekend_name_to_num[team_switch_site].append([region_num, seed_num])
-                
-        self.first_weekend_num_to_name[team_to_switch.region][team_to_switch.seed] = remaining_site
-        if remaining_site not in self.first_weekend_name_to_num:
-            self.first_weekend_name_to_num[remaining_site] = [[team_to_switch.region, team_to_switch.seed]]
-        else:
-            self.first_weekend_name_to_num[remaining_site].append([team_to_switch.region, team_to_switch.seed])
+        self.state.sites[region_num][seed_num] = team_switch_site
+        self.state.sites[self.state.get_region(team_to_switch)][self.state.get_seed(team_to_switch)] = remaining_site
 
     #create a bracket based on the ordered team scores
+    #fills in self.state, which has to start out empty. monte carlo simulations restore it to an empty one each time
     def build_bracket(self):
-        self.regions = [dict(), dict(), dict(), dict()]
-        self.region_num_to_name = dict()
-        self.region_name_to_num = dict()
         region_order = list()
-        self.first_weekend_num_to_name = [dict(), dict(), dict(), dict()]
-        self.first_weekend_name_to_num = dict()
         auto_count = 0
         at_large_count = 0
         self.conferences = dict()
@@ -793,14 +750,14 @@ class Builder:
         AT_LARGE_MAX = 68 - AUTO_MAX
 
         #traverse seed list, placing teams in bracket as you go
-        sorted_teams = sorted(self.teams, key=lambda x: self.teams[x].score, reverse=True)
+        sorted_teams = self.ranking.field
         team_index = 0
         while team_index < len(sorted_teams):
             team = sorted_teams[team_index]
             team_conference = self.teams[team].conference
             for_play_in = False
             placing_saved_team = False
-            if not (self.teams[team].auto_bid or self.teams[team].at_large_bid):
+            if not (self.state.has_auto_bid(team) or self.state.has_at_large_bid(team)):
                 team_index += 1
                 continue
             
@@ -811,17 +768,17 @@ class Builder:
                 seed_count = 0
                 seed_num += 1
                 for region_num in [0, 1, 2, 3]:
-                    if seed_num in self.regions[region_num]:
+                    if self.state.grid[region_num][seed_num]:
                         seed_count += 1
                 for seed in at_large_play_in_seeds:
                     if seed == seed_num:
                         play_in_count += 1
-                if self.teams[team].at_large_bid and (not saved_teams or saved_teams[0][0] != team):
+                if self.state.has_at_large_bid(team) and (not saved_teams or saved_teams[0][0] != team):
                     seed_count += play_in_count // 2
                 else:
                     seed_count += (play_in_count + 1) // 2
             #print(team, seed_num, at_large_count, auto_count)
-            #print(self.regions)
+            #print(self.state.grid)
 
             if seed_num > 1:
                 region_order = self.get_region_order(team, seed_num)
@@ -829,8 +786,8 @@ class Builder:
                     region_num = region_order[0]
                 except IndexError:
                     print(team, seed_num)
-                    print(self.regions)
-                    print(self.first_weekend_num_to_name)
+                    print(self.state.grid)
+                    print(self.state.sites)
                     raise IndexError
             else:
                 region_num = team_index
@@ -864,14 +821,14 @@ class Builder:
                     self.place_team(region_num, seed_num, team)
                 continue
             #save play-in teams to be placed all together
-            elif self.teams[team].at_large_bid and at_large_count >= AT_LARGE_MAX - 4 and (not placing_saved_team):
+            elif self.state.has_at_large_bid(team) and at_large_count >= AT_LARGE_MAX - 4 and (not placing_saved_team):
                 self.save_play_in_team(at_large_play_in_teams, at_large_play_in_seeds, team, seed_num)
                 if at_large_count == AT_LARGE_MAX - 1:
                     #print("placing", at_large_play_in_teams, at_large_play_in_seeds)
                     save_team = self.place_play_in(at_large_play_in_teams, at_large_play_in_seeds)
                     if len(save_team):
                         if self.verbose:
-                            print("problems with", save_team, self.regions)
+                            print("problems with", save_team, self.state.grid)
                         if type(save_team) == tuple:    #couldn't place either play-in matchup in the bracket
                             saved_teams.append(save_team[0])
                             saved_teams.append(save_team[1])
@@ -883,7 +840,7 @@ class Builder:
                 team_index += 1
                 continue
             
-            elif self.teams[team].auto_bid and auto_count >= AUTO_MAX - 4:
+            elif self.state.has_auto_bid(team) and auto_count >= AUTO_MAX - 4:
                 self.save_play_in_team(auto_play_in_teams, auto_play_in_seeds, team, seed_num)
                 if auto_count == AUTO_MAX - 1:
                     self.place_play_in(auto_play_in_teams, auto_play_in_seeds)
@@ -898,15 +855,15 @@ class Builder:
             save_team, region_num = self.find_team_spot(team, region_num, seed_num, region_order, for_play_in)
 
             if not placing_saved_team:
-                if self.teams[team].auto_bid:
+                if self.state.has_auto_bid(team):
                     auto_count += 1
-                if self.teams[team].at_large_bid:
+                if self.state.has_at_large_bid(team):
                     at_large_count += 1
             #if the team can't be placed at the current seed, save it
             if len(save_team) and save_team[0] == team:
-                for region in self.regions:
-                    if seed_num in region and region[seed_num] == team:
-                        del region[seed_num]
+                for region_num in range(0, 4):
+                    if self.state.grid[region_num][seed_num] == team:
+                        self.state.grid[region_num][seed_num] = ""
                 team_index += 1
                 saved_teams.append(save_team)
                 save_team = list()
@@ -924,7 +881,7 @@ class Builder:
             
             if self.verbose:
                 print("Placed (" + str(seed_num) + ") " + team + \
-                        ": region (" + str(region_num) + ") " + self.region_num_to_name[region_num])
+                        ": region (" + str(region_num) + ") " + self.state.region_names[region_num])
                 print()
 
             if not len(save_team) or team != save_team[0]:
@@ -938,17 +895,29 @@ class Builder:
             #if team_index == 16:
                 #self.ensure_region_balance(sorted_teams)
 
-        try:
-            max_len = self.get_max_len()
-        except KeyError:
-            print(self.regions)
+        if any("" in region[1:] for region in self.state.grid):
+            print(self.state.grid)
             raise KeyError
+        max_len = self.get_max_len()
         if not self.monte_carlo:
+            self.publish_bracket()
             print()
             for region_nums in [[0, 1], [3, 2]]:
                 for seed_num in [1, 16, 8, 9, 5, 12, 4, 13, 6, 11, 3, 14, 7, 10, 2, 15]:
                     print(self.construct_line(max_len, region_nums[0], region_nums[1], seed_num))
     
+    #copy each team's seed and bid onto its Team object, for the outputs outside the builder. monte carlo only does this for its last simulation
+    def publish_bracket(self):
+        for team in self.ranking.field:
+            self.teams[team].seed = self.state.get_seed(team)
+            self.teams[team].auto_bid = self.state.has_auto_bid(team)
+            self.teams[team].at_large_bid = self.state.has_at_large_bid(team)
+        for index, team in enumerate(self.ranking.bubble):
+            if index < 4:
+                self.teams[team].seed = "FFO"
+            else:
+                self.teams[team].seed = "NFO"
+
     def projection_type(self):
         if self.future:
             return "Projected Selection Sunday Bracket"
@@ -1022,7 +991,7 @@ class Builder:
                 f.write('  </div>\n')
                 f.write('  <div class="region_column column2">\n')
             f.write('    <div class="table_container" id="region' + str(region_num) + '">\n')
-            f.write('      <h2 class="region_header">' + self.region_num_to_name[region_num] + '</h2>\n')
+            f.write('      <h2 class="region_header">' + self.state.region_names[region_num] + '</h2>\n')
             f.write('      <table class="region_table">\n')
             if region_num in [0, 3]:
                 f.write('        <colgroup><col class="siteleftcol"><col class="seedcol"><col class="logocol"><col></colgroup>\n')
@@ -1037,15 +1006,15 @@ class Builder:
                 if region_num in [0, 3]:
                     f.write('<td>')
                     if seed_num in [8, 4, 3, 2]:
-                        f.write(self.first_weekend_num_to_name[region_num][site_seed_lines[seed_num]])
+                        f.write(self.state.sites[region_num][site_seed_lines[seed_num]])
                     f.write('</td>')
-                team = self.regions[region_num][seed_num]
+                team = self.state.grid[region_num][seed_num]
                 f.write('<td>(' + str(seed_num) + ')</td>')
                 
                 if "/" not in team:
                     f.write('<td><img class="team_logo" src=assets/' + team + '.png></img></td><td><a href="' + \
                             team_pages_path + '/' + team + '.html">' + self.get_team_out(team) + '</a>')
-                    if self.teams[team].auto_bid:
+                    if self.state.has_auto_bid(team):
                         f.write("*")
                     f.write(" (" + self.teams[team].record + ")</td>")
                 else:
@@ -1054,17 +1023,17 @@ class Builder:
                     f.write('<td><img class="tiny_logo" src=assets/' + team1 + '.png></img>' + \
                             '<img class="tiny_logo" src=assets/' + team2 + '.png></img></td><td><a href="' + \
                             team_pages_path + '/' + team1 + '.html">' + self.get_team_out(team1) + '</a>')
-                    if self.teams[team1].auto_bid:
+                    if self.state.has_auto_bid(team1):
                         f.write("*")
                     f.write(" (" + self.teams[team1].record + ')/<a href="' + team_pages_path + '/' + \
                             team2 + '.html">' + self.get_team_out(team2) + '</a>')
-                    if self.teams[team2].auto_bid:
+                    if self.state.has_auto_bid(team2):
                         f.write("*")
                     f.write(" (" + self.teams[team2].record + ")</td>")
                 if region_num in [1, 2]:
                     f.write('<td>')
                     if seed_num in [8, 4, 3, 2]:
-                        f.write(self.first_weekend_num_to_name[region_num][site_seed_lines[seed_num]])
+                        f.write(self.state.sites[region_num][site_seed_lines[seed_num]])
                     f.write('</td>')
                 f.write('</tr>\n')
 
@@ -1080,8 +1049,8 @@ class Builder:
         at_large_counter = 0
         bubble_counter = 0
         AT_LARGE_MAX = 68 - AUTO_MAXES[self.year]
-        for team in sorted(self.teams, key=lambda x: self.teams[x].score, reverse=True):
-            if self.teams[team].at_large_bid:
+        for team in self.ranking.field + self.ranking.bubble:
+            if self.state.has_at_large_bid(team):
                 at_large_counter += 1
                 if at_large_counter > AT_LARGE_MAX - 8:
                     f.write('<td><img class="team_logo" src=assets/' + team + '.png></img></td><td><a href="' + \
@@ -1092,7 +1061,7 @@ class Builder:
                     elif at_large_counter == AT_LARGE_MAX:
                         f.write('</tr>\n')
                         f.write('      <tr class="gray_row bubble_row"><td><h4>First Four Out</h4></td>')
-            elif not self.teams[team].auto_bid and team not in self.ineligible_teams:
+            elif not self.state.has_auto_bid(team) and team not in self.ineligible_teams:
                 bubble_counter += 1
                 f.write('<td><img class="team_logo" src=assets/' + team + '.png></img></td><td><a href="' + \
                         team_pages_path + '/' + team + '.html">' + self.get_team_out(team) + '</a> (' + self.teams[team].record + ')</td>')
@@ -1116,7 +1085,7 @@ class Builder:
                 for teamindex, team in enumerate(self.conferences[conference]):
                     if len(rows) == teamindex:
                         rows.append(['']*columns)
-                    rows[teamindex][confindex] = (team, self.teams[team].seed)
+                    rows[teamindex][confindex] = (team, self.state.get_seed(team))
         f.write('</tr>\n')
         for index, row in enumerate(rows):
             if index % 2:
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+import sys
+
+#class to hold one conference's tournament bracket, worked out from its format string once per run
+#so each simulation just plays the games instead of re-reading ctourn_formats.json and re-parsing the format
+class ConferenceTournament:
+
+    #param tourn_format: format from ctourn_formats.json, e.g. "R8H4H2H" or "4N8N8N4N2N"
+    #   each round is the number of teams playing in it ("T" for 10) and where it's played. an "R" up front means the bracket reseeds
+    #param ineligible_teams: teams who can't take the auto bid. it goes to the best seeded eligible team if one of them wins
+    #param decided: dict of round index: teams who have already won their game in that round, from BRACKET_RESULTS
+    #param set_bracket: teams in seed order if the bracket has been announced, otherwise None
+    def __init__(self, tourn_format, ineligible_teams, decided, set_bracket=None):
+        self.ineligible_teams = set(ineligible_teams)
+        self.set_bracket = None     #team: position in the announced bracket
+        if set_bracket is not None:
+            self.set_bracket = {team: index for index, team in enumerate(set_bracket)}
+        self.reseed = tourn_format[0] == "R"
+        if self.reseed:
+            tourn_format = tourn_format[1:]
+        rounds = list()
+        while tourn_format:
+            if tourn_format[0] == "T":
+                rounds.append((10, tourn_format[1]))
+            else:
+                rounds.append((int(tourn_format[0]), tourn_format[1]))
+            tourn_format = tourn_format[2:]
+        self.num_teams = 1
+        for cur_round_teams, _ in reversed(rounds):
+            if cur_round_teams == self.num_teams * 2:
+                self.num_teams *= 2
+            else:
+                self.num_teams += cur_round_teams//2
+
+        #each round's location, teams already through, and (higher seed, lower seed) games
+        #the seeds are slots in a fixed bracket, or places in what's left of the seed list in a reseeding one
+        self.rounds = list()
+        num_eliminated_teams = 0
+        for round_index, (cur_round_teams, round_location) in enumerate(rounds):
+            higher_seed = self.num_teams - (cur_round_teams - 1) - num_eliminated_teams
+            lower_seed = self.num_teams - num_eliminated_teams
+            matchups = list()
+            for _ in range(cur_round_teams//2):
+                matchups.append((higher_seed, lower_seed))
+                higher_seed += 1
+                lower_seed -= 1
+            self.rounds.append((round_location, set(decided.get(round_index, [])), matchups))
+            num_eliminated_teams += cur_round_teams//2
+        return
+
+    #hand the auto bid to the tournament winner, or the best eligible seed if the winner can't take it
+    #param winner: team that won the tournament
+    #param seeds: teams in the tournament, best seed first
+    def get_auto_bid_team(self, winner, seeds):
+        if winner not in self.ineligible_teams:
+            return winner
+        index = 0
+        while seeds[index] in self.ineligible_teams:
+            index += 1
+        return seeds[index]
+
+    #play the tournament once
+    #param seeds: teams in the tournament, best seed first
+    #param team_kenpoms: dict of team: {"rating": X}
+    #param rng: numpy random generator
+    #returns: team that gets the auto bid
+    def simulate(self, seeds, team_kenpoms, scorer, rng):
+        seed_to_team = dict()
+        for index, team in enumerate(seeds):
+            seed_to_team[index + 1] = team
+        seeds_to_use = list(seeds)
+        for round_location, decided, matchups in self.rounds:
+            if self.reseed:
+                teams = [(seeds_to_use[higher_seed-1], seeds_to_use[lower_seed-1]) for higher_seed, lower_seed in matchups]
+            else:
+                teams = [(seed_to_team[higher_seed], seed_to_team[lower_seed]) for higher_seed, lower_seed in matchups]
+            for (higher_seed, _), (team_1, team_2) in zip(matchups, teams):
+                if team_1 in decided:
+                    team_1_wins = True
+                elif team_2 in decided:
+                    team_1_wins = False
+                else:
+                    win_prob = scorer.get_win_prob(team_kenpoms[team_1]["rating"], team_kenpoms[team_2]["rating"], round_location)
+                    team_1_wins = rng.random() < win_prob
+                if self.reseed:
+                    seeds_to_use.remove(team_2 if team_1_wins else team_1)
+                elif not team_1_wins:
+                    seed_to_team[higher_seed] = team_2
+        if self.reseed:
+            if len(seeds_to_use) != 1:
+                print("wuh oh")
+                sys.exit()
+            return self.get_auto_bid_team(seeds_to_use[0], seeds)
+        return self.get_auto_bid_team(seed_to_team[1], seeds)
+
+    #work out each team's exact odds of getting the auto bid, instead of sampling them
+    #a fixed bracket is tracked slot by slot, a reseeding one by every set of teams that could still be alive
+    #param seeds: teams in the tournament, best seed first
+    #param team_kenpoms: dict of team: {"rating": X}
+    #returns: dict of team: probability of getting the auto bid
+    def get_auto_bid_odds(self, seeds, team_kenpoms, scorer):
+        win_probs = dict()
+        def get_game_prob(team_1, team_2, decided, location):
+            if team_1 in decided:
+                return 1
+            if team_2 in decided:
+                return 0
+            if (team_1, team_2, location) not in win_probs:
+                win_probs[(team_1, team_2, location)] = scorer.get_win_prob(team_kenpoms[team_1]["rating"], \
+                        team_kenpoms[team_2]["rating"], location)
+            return win_probs[(team_1, team_2, location)]
+
+        if self.reseed:
+            #the seed list stays in order as teams drop out
+            alive = {tuple(seeds): 1}
+            for round_location, decided, matchups in self.rounds:
+                next_alive = dict()
+                for seeds_to_use, alive_prob in alive.items():
+                    outcomes = [(set(), alive_prob)]
+                    for higher_seed, lower_seed in matchups:
+                        team_1 = seeds_to_use[higher_seed-1]
+                        team_2 = seeds_to_use[lower_seed-1]
+                        win_prob = get_game_prob(team_1, team_2, decided, round_location)
+                        outcomes = [(losers | {loser}, prob * loser_prob) for losers, prob in outcomes \
+                                for loser, loser_prob in [(team_2, win_prob), (team_1, 1 - win_prob)] if loser_prob]
+                    for losers, prob in outcomes:
+                        survivors = tuple(team for team in seeds_to_use if team not in losers)
+                        next_alive[survivors] = next_alive.get(survivors, 0) + prob
+                alive = next_alive
+            title_odds = dict()
+            for seeds_to_use, prob in alive.items():
+                if len(seeds_to_use) != 1:
+                    print("wuh oh")
+                    sys.exit()
+                title_odds[seeds_to_use[0]] = prob
+        else:
+            #each slot's odds of being held by each team. the winner of a game takes the higher seed's slot
+            seed_to_team = dict()
+            for index, team in enumerate(seeds):
+                seed_to_team[index + 1] = {team: 1}
+            for round_location, decided, matchups in self.rounds:
+                for higher_seed, lower_seed in matchups:
+                    slot_odds = dict()
+                    for team_1, prob_1 in seed_to_team[higher_seed].items():
+                        for team_2, prob_2 in seed_to_team[lower_seed].items():
+                            win_prob = get_game_prob(team_1, team_2, decided, round_location)
+                            slot_odds[team_1] = slot_odds.get(team_1, 0) + prob_1*prob_2*win_prob
+                            slot_odds[team_2] = slot_odds.get(team_2, 0) + prob_1*prob_2*(1 - win_prob)
+                    seed_to_team[higher_seed] = slot_odds
+            title_odds = seed_to_team[1]
+
+        auto_bid_odds = dict()
+        for team, prob in title_odds.items():
+            team = self.get_auto_bid_team(team, seeds)
+            auto_bid_odds[team] = auto_bid_odds.get(team, 0) + prob
+        return auto_bid_odds
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+
+from game import Game
+import numpy
+
+LOCATIONS = ["H", "A", "N"]
+LOCATION_CODES = {"H": 0, "A": 1, "N": 2}
+REVERSE_LOCATION_CODES = numpy.array([1, 0, 2], dtype=numpy.int8)    #location code of the same game from the opponent's side
+SIMULATED_MONTH = 10    #simulated games are all dated 10-10, well outside the season
+SIMULATED_DAY = 10
+NO_TEAM = -1    #opponent id for Non Div I teams and anyone else who isn't in the league
+
+#class to hold every game in the league in flat NumPy arrays, one row per game per team
+#each team's games sit in one contiguous block, so team i's played games are rows game_start[i] to game_start[i+1]
+#games simulated by the monte carlo go in a separate journal on top of the real season, which is emptied between simulations
+class GameStore:
+
+    #param teams: dict of team names to Team objects, with their games (and future games, if any) loaded
+    def __init__(self, teams):
+        self.team_names = list(teams)
+        self.team_ids = {team: index for index, team in enumerate(self.team_names)}
+        self.build_played_games(teams)
+        self.build_future_games(teams)
+        self.build_matchups()
+        self.build_simulation_journal()
+        #from here on the store is the source of truth, so hand each team a view of its rows
+        for team in self.team_names:
+            teams[team].games = self.get_games(team)
+            if hasattr(teams[team], "future_games"):
+                teams[team].future_games = self.get_future_games(team)
+        return
+
+    #look up an opponent's id
+    #param opponent: name of the opponent
+    #returns: the opponent's id, or NO_TEAM if they aren't in the league
+    def get_team_id(self, opponent):
+        return self.team_ids.get(opponent, NO_TEAM)
+
+    #fill the arrays of games that have already been played
+    #param teams: dict of team names to Team objects
+    def build_played_games(self, teams):
+        opponents, locations, team_scores, opp_scores, months, days, conference_games = [], [], [], [], [], [], []
+        self.other_opponents = dict()   #row: name of an opponent with no id
+        self.game_start = numpy.zeros(len(self.team_names) + 1, dtype=numpy.int32)
+        for index, team in enumerate(self.team_names):
+            for game in teams[team].games:
+                opp_id = self.get_team_id(game.opponent)
+                if opp_id == NO_TEAM:
+                    self.other_opponents[len(opponents)] = game.opponent
+                opponents.append(opp_id)
+                locations.append(LOCATION_CODES[game.location])
+                team_scores.append(game.team_score)
+                opp_scores.append(game.opp_score)
+                months.append(int(game.date[:2]))
+                days.append(int(game.date[3:]))
+                conference_games.append(game.conference_game)
+            self.game_start[index + 1] = len(opponents)
+        self.team = numpy.repeat(numpy.arange(len(self.team_names), dtype=numpy.int16), numpy.diff(self.game_start))
+        self.opponent = numpy.array(opponents, dtype=numpy.int16)
+        self.location = numpy.array(locations, dtype=numpy.int8)
+        self.team_score = numpy.array(team_scores, dtype=numpy.int16)
+        self.opp_score = numpy.array(opp_scores, dtype=numpy.int16)
+        self.month = numpy.array(months, dtype=numpy.int8)
+        self.day = numpy.array(days, dtype=numpy.int8)
+        self.conference_game = numpy.array(conference_games, dtype=bool)
+        wins = self.team_score > self.opp_score
+        num_teams = len(self.team_names)
+        self.played_wins = numpy.bincount(self.team, weights=wins, minlength=num_teams).astype(int)
+        self.played_losses = numpy.bincount(self.team, weights=~wins, minlength=num_teams).astype(int)
+        self.conference_wins = numpy.bincount(self.team, weights=wins & self.conference_game, minlength=num_teams).astype(int)
+        self.conference_losses = numpy.bincount(self.team, weights=~wins & self.conference_game, \
+                minlength=num_teams).astype(int)
+        #each team's wins and losses against every other team, from its own rows, for breaking ties
+        known = self.opponent != NO_TEAM
+        pairs = self.team[known].astype(int)*num_teams + self.opponent[known]
+        self.played_head_to_head_wins = numpy.bincount(pairs, weights=wins[known], \
+                minlength=num_teams*num_teams).reshape(num_teams, num_teams).astype(int)
+        self.played_head_to_head_losses = numpy.bincount(pairs, weights=~wins[known], \
+                minlength=num_teams*num_teams).reshape(num_teams, num_teams).astype(int)
+        return
+
+    #fill the arrays of games that are still on the schedule
+    #param teams: dict of team names to Team objects
+    def build_future_games(self, teams):
+        opponents, locations, months, days, conference_games = [], [], [], [], []
+        self.future_details = list()            #(time, channel) for each row, only needed for printing schedules
+        self.other_future_opponents = dict()    #row: name of an opponent with no id
+        self.future_start = numpy.zeros(len(self.team_names) + 1, dtype=numpy.int32)
+        for index, team in enumerate(self.team_names):
+            for game in getattr(teams[team], "future_games", list()):
+                opp_id = self.get_team_id(game["opponent"])
+                if opp_id == NO_TEAM:
+                    self.other_future_opponents[len(opponents)] = game["opponent"]
+                opponents.append(opp_id)
+                locations.append(LOCATION_CODES[game["location"]])
+                months.append(int(game["date"][:2]))
+                days.append(int(game["date"][3:]))
+                conference_games.append(game["conference_game"])
+                self.future_details.append((game.get("time", ""), game.get("channel", "")))
+            self.future_start[index + 1] = len(opponents)
+        self.future_team = numpy.repeat(numpy.arange(len(self.team_names), dtype=numpy.int16), numpy.diff(self.future_start))
+        self.future_opponent = numpy.array(opponents, dtype=numpy.int16)
+        self.future_location = numpy.array(locations, dtype=numpy.int8)
+        self.future_month = numpy.array(months, dtype=numpy.int8)
+        self.future_day = numpy.array(days, dtype=numpy.int8)
+        self.future_conference_game = numpy.array(conference_games, dtype=bool)
+        return
+
+    #pair up the two sides of each game left on the schedule, so it can be simulated once for both teams
+    #a game whose other side can't be found (e.g. the two schedules disagree on the location) is its own matchup
+    #games against teams outside the league can't be simulated without a rating, so they aren't matchups at all
+    def build_matchups(self):
+        self.future_matchup = numpy.full(len(self.future_opponent), -1, dtype=numpy.int32)    #row: id of its matchup
+        matchup_rows, mirror_rows = [], []
+        unpaired = dict()   #(team id, opponent id, location code): rows still waiting for the other side
+        for row, (team, opponent, location) in enumerate(zip(self.future_team.tolist(), self.future_opponent.tolist(), \
+                self.future_location.tolist())):
+            if opponent == NO_TEAM:
+                continue
+            waiting = unpaired.get((opponent, team, int(REVERSE_LOCATION_CODES[location])))
+            if waiting:
+                matchup = self.future_matchup[waiting.pop(0)]
+                mirror_rows[matchup] = row
+            else:
+                matchup = len(matchup_rows)
+                matchup_rows.append(row)
+                mirror_rows.append(-1)
+                unpaired.setdefault((team, opponent, location), list()).append(row)
+            self.future_matchup[row] = matchup
+        self.matchup_row = numpy.array(matchup_rows, dtype=numpy.int32)      #matchup: row of the side that created it
+        self.matchup_mirror = numpy.array(mirror_rows, dtype=numpy.int32)    #matchup: row of the other side, or -1
+        self.matchup_team = self.future_team[self.matchup_row].astype(int)
+        self.matchup_opponent = self.future_opponent[self.matchup_row].astype(int)
+        self.matchup_location = self.future_location[self.matchup_row]
+        self.matchup_conference_game = self.future_conference_game[self.matchup_row]
+        return
+
+    #set up the journal of simulated games: every matchup from the first team's side, then every matchup from the other side
+    #only the results change from one simulation to the next
+    def build_simulation_journal(self):
+        self.sim_team = numpy.concatenate([self.matchup_team, self.matchup_opponent]).astype(numpy.int16)
+        self.sim_opponent = numpy.concatenate([self.matchup_opponent, self.matchup_team]).astype(numpy.int16)
+        self.sim_location = numpy.concatenate([self.matchup_location, REVERSE_LOCATION_CODES[self.matchup_location]])
+        self.sim_win = numpy.zeros(len(self.sim_team), dtype=bool)
+        self.sim_count = 0
+        self.version = 0    #goes up every time the journal changes, so anything built from the games knows to rebuild
+        return
+
+    #throw out every simulated game, leaving just the real season. the journal is reused, so there's nothing to copy
+    def reset_simulation(self):
+        self.sim_count = 0
+        self.version += 1
+
+    #fill the journal with one simulation of the rest of the regular season
+    #param wins: boolean array, one entry per matchup, true if the matchup's first team won
+    def record_simulated_season(self, wins):
+        num_matchups = len(self.matchup_row)
+        self.sim_win[:num_matchups] = wins
+        self.sim_win[num_matchups:] = ~wins
+        self.sim_count = 2*num_matchups
+        self.version += 1
+
+    #every team's record in many simulations of the rest of the regular season at once, real games included
+    #param outcomes: boolean array with one row per simulation and one column per matchup, true if the first team won
+    #returns: arrays of wins, losses, conference wins and conference losses, one row per simulation and one column per team id
+    def get_simulated_records(self, outcomes):
+        num_sims = len(outcomes)
+        num_teams = len(self.team_names)
+        #give each (simulation, team) pair its own bin, so one bincount adds up every simulation
+        offsets = numpy.arange(num_sims)[:, numpy.newaxis]*num_teams
+        team_bins = (offsets + self.matchup_team).ravel()
+        opp_bins = (offsets + self.matchup_opponent).ravel()
+        team_wins = outcomes.ravel()
+        conference_games = numpy.tile(self.matchup_conference_game, num_sims)
+        def scatter(team_weights, opp_weights):
+            return (numpy.bincount(team_bins, weights=team_weights, minlength=num_sims*num_teams) + \
+                    numpy.bincount(opp_bins, weights=opp_weights, minlength=num_sims*num_teams)).reshape(num_sims, num_teams).astype(int)
+        return self.played_wins + scatter(team_wins, ~team_wins), \
+                self.played_losses + scatter(~team_wins, team_wins), \
+                self.conference_wins + scatter(team_wins & conference_games, ~team_wins & conference_games), \
+                self.conference_losses + scatter(~team_wins & conference_games, team_wins & conference_games)
+
+    #rows of a team's played games
+    def get_slice(self, team):
+        index = self.team_ids[team]
+        return slice(self.game_start[index], self.game_start[index + 1])
+
+    #rows of a team's future games
+    def get_future_slice(self, team):
+        index = self.team_ids[team]
+        return slice(self.future_start[index], self.future_start[index + 1])
+
+    #name of the opponent in a row of the played games
+    def get_opponent_name(self, row):
+        if self.opponent[row] == NO_TEAM:
+            return self.other_opponents[row]
+        return self.team_names[self.opponent[row]]
+
+    #name of the opponent in a row of the future games
+    def get_future_opponent_name(self, row):
+        if self.future_opponent[row] == NO_TEAM:
+            return self.other_future_opponents[row]
+        return self.team_names[self.future_opponent[row]]
+
+    #every game of the season so far, played or simulated
+    #returns: arrays of team ids, opponent ids, location codes, wins, months and days, one entry per game
+    def get_season_games(self):
+        count = self.sim_count
+        return numpy.concatenate([self.team, self.sim_team[:count]]), \
+                numpy.concatenate([self.opponent, self.sim_opponent[:count]]), \
+                numpy.concatenate([self.location, self.sim_location[:count]]), \
+                numpy.concatenate([self.team_score > self.opp_score, self.sim_win[:count]]), \
+                numpy.concatenate([self.month.astype(int), numpy.full(count, SIMULATED_MONTH)]), \
+                numpy.concatenate([self.day.astype(int), numpy.full(count, SIMULATED_DAY)])
+
+    #every team's wins and losses against every other team, real games plus the simulated ones in the journal
+    #returns: arrays of wins and losses, with one row and one column per team id, from the row team's side
+    def get_head_to_head(self):
+        num_teams = len(self.team_names)
+        pairs = self.sim_team[:self.sim_count].astype(int)*num_teams + self.sim_opponent[:self.sim_count]
+        sim_wins = self.sim_win[:self.sim_count]
+        def scatter(weights):
+            return numpy.bincount(pairs, weights=weights, minlength=num_teams*num_teams).reshape(num_teams, num_teams).astype(int)
+        return self.played_head_to_head_wins + scatter(sim_wins), self.played_head_to_head_losses + scatter(~sim_wins)
+
+    #build the Game objects for a team's played games
+    #param team: name of the team
+    #returns: set of Game objects, one per row
+    def get_games(self, team):
+        games = set()
+        for row in range(self.game_start[self.team_ids[team]], self.game_start[self.team_ids[team] + 1]):
+            games.add(Game(self.get_opponent_name(row), LOCATIONS[self.location[row]], int(self.team_score[row]), \
+                    int(self.opp_score[row]), "%02d-%02d" % (self.month[row], self.day[row]), \
+                    bool(self.conference_game[row])))
+        return games
+
+    #build the schedule entries for a team's future games
+    #param team: name of the team
+    #returns: list of dicts in the same form as the scraped schedules
+    def get_future_games(self, team):
+        future_games = list()
+        for row in range(self.future_start[self.team_ids[team]], self.future_start[self.team_ids[team] + 1]):
+            opponent = self.get_future_opponent_name(row)
+            future_games.append({"date": "%02d-%02d" % (self.future_month[row], self.future_day[row]), \
+                    "location": LOCATIONS[self.future_location[row]], "opponent": opponent, \
+                    "conference_game": bool(self.future_conference_game[row]), \
+                    "channel": self.future_details[row][1], "time": self.future_details[row][0]})
+        return future_games
+
+    #total size of the arrays, in bytes
+    def get_nbytes(self):
+        return sum(array.nbytes for array in [self.game_start, self.team, self.opponent, self.location, \
+                self.team_score, self.opp_score, self.month, self.day, self.conference_game, self.future_start, \
+                self.future_team, self.future_opponent, self.future_location, self.future_month, self.future_day, \
+                self.future_conference_game, self.future_matchup, self.matchup_row, self.matchup_mirror, \
+                self.matchup_team, self.matchup_opponent, self.matchup_location, self.matchup_conference_game, self.sim_team, self.sim_opponent, self.sim_location, self.sim_win, \
+                self.played_head_to_head_wins, self.played_head_to_head_losses])
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+from ratelimiter import RateLimiter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import requests
+import threading
+import time
+
+MAX_RETRIES = 4
+BACKOFF_FACTOR = 0.5        #waits 0.5s, 1s, 2s, 4s between retries
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+REQUEST_TIMEOUT = 30        #seconds
+
+#class to send every scraper's requests through one pooled, keep-alive session
+#retries flaky responses with exponential backoff and keeps count of how long requests are taking
+class HTTPClient:
+
+    #param max_rate: maximum requests per second to send to any one host (0 for no limit)
+    #param pool_size: number of connections to keep open to each host
+    def __init__(self, max_rate, pool_size):
+        self.rate_limiter = RateLimiter(max_rate)
+        retry = Retry(total=MAX_RETRIES, backoff_factor=BACKOFF_FACTOR, status_forcelist=RETRY_STATUSES, \
+                allowed_methods=["GET"], raise_on_status=False)
+        adapter = HTTPAdapter(pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.failure_count = 0
+        self.total_time = 0
+        self.slowest_time = 0
+        self.slowest_url = ""
+        return
+
+    #fetch a url, retrying if the site is having trouble
+    #param url: url to fetch
+    #param stream: if true, don't download the body until it's iterated over
+    #param headers: extra request headers, e.g. for conditional GETs
+    #returns: the response, or None if the site couldn't be reached at all
+    def get(self, url, stream=False, headers=None):
+        self.rate_limiter.wait(url)
+        start = time.monotonic()
+        try:
+            response = self.session.get(url, stream=stream, headers=headers, timeout=REQUEST_TIMEOUT)
+        except requests.exceptions.RequestException as e:
+            print("couldn't reach", url, "-", e)
+            response = None
+        elapsed = time.monotonic() - start
+        with self.lock:
+            self.request_count += 1
+            if response is None or response.status_code >= 400:
+                self.failure_count += 1
+            self.total_time += elapsed
+            if elapsed > self.slowest_time:
+                self.slowest_time = elapsed
+                self.slowest_url = url
+        return response
+
+    #print how many requests have been sent and how long they took
+    def print_stats(self):
+        if not self.request_count:
+            return
+        print(self.request_count, "requests,", self.failure_count, "failed,", \
+                "avg", str(round(self.total_time/self.request_count, 3)) + "s,", \
+                "slowest", str(round(self.slowest_time, 3)) + "s", "(" + self.slowest_url + ")")
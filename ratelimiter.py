@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+
+from urllib.parse import urlparse
+import threading
+import time
+
+#class to keep concurrent scrapers from hammering any one website
+#spaces out requests to the same host so there are at most max_rate of them per second
+class RateLimiter:
+
+    def __init__(self, max_rate):
+        self.max_rate = max_rate
+        self.next_slot = dict()
+        self.lock = threading.Lock()
+        return
+
+    #block until it's this request's turn to hit the host in the given url
+    #param url: url about to be requested
+    def wait(self, url):
+        if not self.max_rate:
+            return
+        host = urlparse(url).netloc
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + 1/self.max_rate
+        if slot > now:
+            time.sleep(slot - now)
@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 
 from team import SELECTION_SUNDAY_DATES
+from gamestore import LOCATION_CODES, REVERSE_LOCATION_CODES, SIMULATED_MONTH, SIMULATED_DAY, NO_TEAM
 import sys
 import math
 import requests
 import os
 from datetime import date
 import json
+import numpy
+from seedlist import SeedList
 
 WEIGHTS = {
         "LOSS_WEIGHT": 0,
@@ -30,6 +33,17 @@ WEIGHTS = {
 SCRAPE_DATE_FILE = "scrapedate.txt"
 TEAM_MEN_URL_START = "https://www.warrennolan.com/basketball/2026/team-clubhouse?team="
 TEAM_WOMEN_URL_START = "https://www.warrennolan.com/basketballw/2026/team-clubhouse?team="
+QUADRANT_CUTOFFS = [[30, 75, 160], [75, 135, 260], [50, 100, 200]]    #worst NET in Q1, Q2, Q3 for H, A, N games
+QUAD_1A_CUTOFFS = {"H": 10, "N": 20, "A": 35}   #worst NET that's a full Quad 1A win; partial credit for the next 10
+HOME_ADVANTAGES = [3, -3, 0]    #points added to the spread for H, A, N games
+WIN_PROB_LADDER = [(25, 0.98, 0.02), (30, 0.99, 0.01), (35, 0.995, 0.005)]  #spread under this: favorite's and underdog's win prob
+#each category's weight and the Team attribute its score is kept in, in the order a team's score adds them up
+CATEGORY_WEIGHTS = [("LOSS_WEIGHT", "loss_score"), ("NET_WEIGHT", "NET_score"), ("POWER_WEIGHT", "power_score"), \
+        ("Q1_WEIGHT", "Q1_score"), ("Q2_WEIGHT", "Q2_score"), ("Q3_WEIGHT", "Q3_score"), \
+        ("RESULTS_BASED_WEIGHT", "results_based_score"), ("Q4_WEIGHT", "Q4_score"), ("ROAD_WEIGHT", "road_score"), \
+        ("NEUTRAL_WEIGHT", "neutral_score"), ("TOP_10_WEIGHT", "top10_score"), ("TOP_25_WEIGHT", "top25_score"), \
+        ("SOS_WEIGHT", "SOS_score"), ("NONCON_SOS_WEIGHT", "NCSOS_score"), ("AWFUL_LOSS_WEIGHT", "awful_loss_score"), \
+        ("BAD_LOSS_WEIGHT", "bad_loss_score")]
 
 #class to generate resume ratings from scraped data about college basketball teams
 class Scorer:
@@ -42,6 +56,11 @@ class Scorer:
         self.mens = m
         self.tracker = t
         self.monte_carlo = mc
+        self.scored_games = None    #the game arrays and opponent NETs the game scores were last built from
+        self.scored_NETs = None
+        self.game_totals = None     #each team's game tallies, from the last build_game_scores
+        self.scored_version = -1    #game store version the game scores were last built from
+        self.score_cache = dict()   #(category, team): (inputs, score), for the categories that don't come from games
         if self.mens:
             self.schedule_datadir = "data/men/" + self.year + "/schedules/"
         else:
@@ -112,37 +131,12 @@ class Scorer:
             days_left = (selection_sunday - today_date).days
         return season_days, days_left
 
-    #calculate score for a team's winning percentage (scale: 1.000 = 1.000, 0.000 = 0.600)
-    #param team: Team object to calculate score for
-    def get_loss_score(self, team, team_obj):
-        if self.tracker:
-            try:
-                return team_obj.loss_score
-            except AttributeError:
-                pass
-        return self.calculate_loss_score(team, team_obj)
-
-    def calculate_loss_score(self, team, team_obj):
-        record = team_obj.record.split("-")
-        num_wins, num_losses = int(record[0]), int(record[1])
-        if self.future and not self.monte_carlo:
-            for game in team_obj.future_games:
-                win_prob = self.get_win_prob(self.team_kenpoms[team]["rating"], self.team_kenpoms[game['opponent']]["rating"], game['location'])
-                num_wins += win_prob
-                num_losses += (1 - win_prob)
-        try:
-            team_obj.loss_score = ((num_wins/(num_wins + num_losses)) - 0.6)/0.4
-        except ZeroDivisionError:   #team did not play any games. COVID, ain't it crazy
-            team_obj.loss_score = 0
-        return team_obj.loss_score
-
     def get_results_based_score(self, team, team_obj, season_days, days_left):
-        if self.tracker:
-            try:
-                return team_obj.resume_score
-            except AttributeError:
-                pass
-        return self.calculate_results_based_score(team, team_obj, season_days, days_left)
+        inputs = (team_obj.results_based, season_days, days_left)
+        if self.future and not self.monte_carlo:
+            inputs += (self.team_kenpoms[team]["rank"],)
+        return self.get_cached_score("results_based_score", team, team_obj, inputs, \
+                lambda: self.calculate_results_based_score(team, team_obj, season_days, days_left))
 
     def calculate_results_based_score(self, team, team_obj, season_days, days_left):
         RES_weight = min(1, (season_days - days_left)/(season_days - 30))
@@ -159,12 +153,12 @@ class Scorer:
     #calculate score for a team's NET rank  (scale: 1.000 = 1, 0.000 = 60)
     #param team: Team object to calculate score for
     def get_NET_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        if self.tracker:
-            try:
-                return team_obj.NET_score
-            except AttributeError:
-                pass
-        return self.calculate_NET_score(team, team_obj, simmed_kenpoms, net_estimates)
+        if self.monte_carlo or self.future:
+            inputs = net_estimates[team]
+        else:
+            inputs = team_obj.NET
+        return self.get_cached_score("NET_score", team, team_obj, inputs, \
+                lambda: self.calculate_NET_score(team, team_obj, simmed_kenpoms, net_estimates))
 
     def calculate_NET_score(self, team, team_obj, simmed_kenpoms, net_estimates):
         if self.monte_carlo:
@@ -178,12 +172,12 @@ class Scorer:
     #calculate score for a team's predictive rating (scale: 1.000 = 1, 0.000 = 60)
     #param team: Team object to calculate score for
     def get_power_score(self, team, team_obj, simmed_kenpoms):
-        if self.tracker:
-            try:
-                return team_obj.power_score
-            except AttributeError:
-                pass
-        return self.calculate_power_score(team, team_obj, simmed_kenpoms)
+        if self.monte_carlo:
+            inputs = simmed_kenpoms[team]["rank"]
+        else:
+            inputs = team_obj.predictive
+        return self.get_cached_score("power_score", team, team_obj, inputs, \
+                lambda: self.calculate_power_score(team, team_obj, simmed_kenpoms))
 
     def calculate_power_score(self, team, team_obj, simmed_kenpoms):
         if self.monte_carlo:
@@ -192,682 +186,52 @@ class Scorer:
             team_obj.power_score = (-math.log(team_obj.predictive + 19, 2)/2 + 3.16)
         return team_obj.power_score
 
-    #calculate score for a team's record in quadrant 1 (scale: 0.800 = 1, 0.000 = .000)
-    #param team: Team object to calculate score for
-    def get_Q1_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        if self.tracker:
-            try:
-                return team_obj.Q1_score
-            except AttributeError:
-                pass
-        return self.calculate_Q1_score(team, team_obj, simmed_kenpoms, net_estimates)
-
-    def calculate_Q1_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        if self.future and not self.monte_carlo:
-            wins = 0
-            losses = 0
-            for game in team_obj.games:
-                if "Non Div I" in game.opponent:
-                    opp_NET = 365
-                else:
-                    opp_NET = net_estimates[game.opponent]
-                game_quad = self.get_quadrant(opp_NET, game.location)
-                if game.win:
-                    if game_quad == 1:
-                        wins += 1
-                else:
-                    losses += 1
-            for game in team_obj.future_games:
-                try:
-                    opp_NET = net_estimates[game['opponent']]
-                except KeyError: #Until New Haven makes the NET
-                    opp_NET = 365
-                game_quad = self.get_quadrant(opp_NET, game['location'])
-                win_prob = self.get_win_prob(self.team_kenpoms[team]["rating"], self.team_kenpoms[game['opponent']]["rating"], game['location'])
-                if game_quad == 1:
-                    wins += win_prob
-                losses += (1 - win_prob)
-        else:
-            wins = 0
-            losses = 0
-            for game in team_obj.games:
-                if self.monte_carlo:
-                    if "Non Div I" in game.opponent:
-                        game_quad = 4
-                    else:
-                        opp_NET = net_estimates[game.opponent]
-                        game_quad = self.get_quadrant(opp_NET, game.location)
-                else:
-                    if "Non Div I" in game.opponent:
-                        game_quad = 4
-                    else:
-                        game_quad = self.get_quadrant(self.teams[game.opponent].NET, game.location)
-                if game.win:
-                    if game_quad == 1:
-                        wins += 1
-                else:
-                    losses += 1
-        try:
-            q1_pct = wins/(wins + losses)
-        except ZeroDivisionError:
-            q1_pct = 0
-        team_obj.Q1_score = q1_pct/0.8
-        return team_obj.Q1_score
-
-    #calculate score for a team's record in quadrant 2 (scale: 1.000 = 1, 0.000 = .500)
-    #param team: Team object to calculate score for
-    def get_Q2_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        if self.tracker:
-            try:
-                return team_obj.Q2_score
-            except AttributeError:
-                pass
-        return self.calculate_Q2_score(team, team_obj, simmed_kenpoms, net_estimates)
-
-    def calculate_Q2_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        if self.future and not self.monte_carlo:
-            wins = 0
-            losses = 0
-            for game in team_obj.games:
-                if "Non Div I" in game.opponent:
-                    opp_NET = 365
-                else:
-                    opp_NET = net_estimates[game.opponent]
-                game_quad = self.get_quadrant(opp_NET, game.location)
-                if game.win:
-                    if game_quad <= 2:
-                        wins += 1
-                else:
-                    if game_quad >= 2:
-                        losses += 1
-            for game in team_obj.future_games:
-                try:
-                    opp_NET = net_estimates[game['opponent']]
-                except KeyError: #Until New Haven makes the NET
-                    opp_NET = 365
-                game_quad = self.get_quadrant(opp_NET, game['location'])
-                win_prob = self.get_win_prob(self.team_kenpoms[team]["rating"], self.team_kenpoms[game['opponent']]["rating"], game['location'])
-                if game_quad <= 2:
-                    wins += win_prob
-                if game_quad >= 2:
-                    losses += (1 - win_prob)
-        else:
-            wins = 0
-            losses = 0
-            for game in team_obj.games:
-                if self.monte_carlo:
-                    if "Non Div I" in game.opponent:
-                        game_quad = 4
-                    else:
-                        opp_NET = net_estimates[game.opponent]
-                        game_quad = self.get_quadrant(opp_NET, game.location)
-                else:
-                    if "Non Div I" in game.opponent:
-                        game_quad = 4
-                    else:
-                        game_quad = self.get_quadrant(self.teams[game.opponent].NET, game.location)
-                if game.win:
-                    if game_quad <= 2:
-                        wins += 1
-                else:
-                    if game_quad >= 2:
-                        losses += 1
-        try:
-            q2_pct = wins/(wins + losses)
-        except ZeroDivisionError:
-            q2_pct = 0
-        team_obj.Q2_score = (q2_pct-0.5)/0.5
-        return team_obj.Q2_score
-
-    #calculate score for a team's record in quadrant 3 (scale: 1.000 = 1, 0.000 = .800)
-    #param team: Team object to calculate score for
-    def get_Q3_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        if self.tracker:
-            try:
-                return team_obj.Q3_score
-            except AttributeError:
-                pass
-        return self.calculate_Q3_score(team, team_obj, simmed_kenpoms, net_estimates)
-
-    def calculate_Q3_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        if self.future and not self.monte_carlo:
-            wins = 0
-            losses = 0
-            for game in team_obj.games:
-                if "Non Div I" in game.opponent:
-                    opp_NET = 365
-                else:
-                    opp_NET = net_estimates[game.opponent]
-                game_quad = self.get_quadrant(opp_NET, game.location)
-                if game.win:
-                    if game_quad <= 3:
-                        wins += 1
-                else:
-                    if game_quad >= 3:
-                        losses += 1
-            for game in team_obj.future_games:
-                try:
-                    opp_NET = net_estimates[game['opponent']]
-                except KeyError: #Until New Haven makes the NET
-                    opp_NET = 365
-                game_quad = self.get_quadrant(opp_NET, game['location'])
-                win_prob = self.get_win_prob(self.team_kenpoms[team]["rating"], self.team_kenpoms[game['opponent']]["rating"], game['location'])
-                if game_quad <= 3:
-                    wins += win_prob
-                if game_quad >= 3:
-                    losses += (1 - win_prob)
-        else:
-            wins = 0
-            losses = 0
-            for game in team_obj.games:
-                if self.monte_carlo:
-                    if "Non Div I" in game.opponent:
-                        game_quad = 4
-                    else:
-                        opp_NET = net_estimates[game.opponent]
-                        game_quad = self.get_quadrant(opp_NET, game.location)
-                else:
-                    if "Non Div I" in game.opponent:
-                        game_quad = 4
-                    else:
-                        game_quad = self.get_quadrant(self.teams[game.opponent].NET, game.location)
-                if game.win:
-                    if game_quad <= 3:
-                        wins += 1
-                else:
-                    if game_quad >= 3:
-                        losses += 1
-
-        try:
-            q3_pct = wins/(wins + losses)
-        except ZeroDivisionError:
-            q3_pct = 0
-        team_obj.Q3_score = (q3_pct-0.8)/0.2
-        return team_obj.Q3_score
-
-    #calculate score for a team's record in quadrant 4 (scale: 1.000 = 1, 0.000 = .950)
-    #param team: Team object to calculate score for
-    def get_Q4_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        if self.tracker:
-            try:
-                return team_obj.Q4_score
-            except AttributeError:
-                pass
-        return self.calculate_Q4_score(team, team_obj, simmed_kenpoms, net_estimates)
-
-    def calculate_Q4_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        if self.future and not self.monte_carlo:
-            wins = 0
-            losses = 0
-            for game in team_obj.games:
-                if "Non Div I" in game.opponent:
-                    opp_NET = 365
-                else:
-                    opp_NET = net_estimates[game.opponent]
-                game_quad = self.get_quadrant(opp_NET, game.location)
-                if game.win:
-                    wins += 1
-                else:
-                    if game_quad == 4:
-                        losses += 1
-            for game in team_obj.future_games:
-                try:
-                    opp_NET = net_estimates[game['opponent']]
-                except KeyError: #Until New Haven makes the NET
-                    opp_NET = 365
-                game_quad = self.get_quadrant(opp_NET, game['location'])
-                win_prob = self.get_win_prob(self.team_kenpoms[team]["rating"], self.team_kenpoms[game['opponent']]["rating"], game['location'])
-                wins += win_prob
-                if game_quad == 4:
-                    losses += (1 - win_prob)
-        else:
-            wins = 0
-            losses = 0
-            for game in team_obj.games:
-                if self.monte_carlo:
-                    if "Non Div I" in game.opponent:
-                        game_quad = 4
-                    else:
-                        opp_NET = net_estimates[game.opponent]
-                        game_quad = self.get_quadrant(opp_NET, game.location)
-                else:
-                    if "Non Div I" in game.opponent:
-                        game_quad = 4
-                    else:
-                        game_quad = self.get_quadrant(self.teams[game.opponent].NET, game.location)
-                if game.win:
-                    wins += 1
-                else:
-                    if game_quad == 4:
-                        losses += 1
-
-        try:
-            q4_pct = wins/(wins + losses)
-        except ZeroDivisionError:
-            q4_pct = 0
-        if q4_pct >= 0.95:
-            team_obj.Q4_score = (q4_pct-0.95)/0.05
-        else:   #limit how bad multiple Q4 losses can hurt you
-            team_obj.Q4_score = (q4_pct-0.95)/0.3
-        return team_obj.Q4_score
-
-    #calculate score for a team's road wins (scale: 1.000 = 5, 0.000 = 0)
-        #sliding scale. #1-#50: full win. #51-#99: decreases win count by 0.02 for each rank down.
-    #param team: Team object to calculate score for
-    def get_road_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        if self.tracker:
-            try:
-                return team_obj.road_score
-            except AttributeError:
-                pass
-        return self.calculate_road_score(team, team_obj, simmed_kenpoms, net_estimates)
-
-    def calculate_road_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        good_road_wins = 0
-        if self.future and not self.monte_carlo:
-            for game in team_obj.games:
-                if game.win and game.location == "A":
-                    if "Non Div I" in game.opponent:
-                        opp_NET = 365
-                    else:
-                        opp_NET = net_estimates[game.opponent]
-                    if opp_NET <= 50:
-                        good_road_wins += 1
-                    elif opp_NET <= 100:
-                        good_road_wins += (100 - opp_NET)/50
-            for game in team_obj.future_games:
-                if game['location'] == "A":
-                    opp_NET = net_estimates[game['opponent']]
-                    win_prob = self.get_win_prob(self.team_kenpoms[team]["rating"], self.team_kenpoms[game['opponent']]["rating"], game['location'])
-                    if opp_NET <= 50:
-                        good_road_wins += win_prob
-                    elif opp_NET <= 100:
-                        good_road_wins += (100 - opp_NET)*win_prob/50
-        else:
-            for game in team_obj.games:
-                if game.win and game.location == "A":
-                    if self.monte_carlo:
-                        if "Non Div I" in game.opponent:
-                            opp_NET = 365
-                        else:
-                            opp_NET = net_estimates[game.opponent]
-                    else:
-                        if "Non Div I" in game.opponent:
-                            opp_NET = 365
-                        else:
-                            opp_NET = self.teams[game.opponent].NET
-                    if opp_NET <= 50:
-                        good_road_wins += 1
-                    elif opp_NET <= 100:
-                        good_road_wins += (100 - opp_NET)/50
-        team_obj.road_score = good_road_wins/5
-        return team_obj.road_score
-
-    #calculate score for a team's neutral court wins (scale: 1.000 = 5, 0.000 = 0)
-        #sliding scale. #1-#50: full win. #51-#99: decreases win count by 0.02 for each rank down.
-        #also, sliding penalty for conference tournament games. this is done for accuracy, not cause I like it.
-    #param team: Team object to calculate score for
-    def get_neutral_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        if self.tracker:
-            try:
-                return team_obj.neutral_score
-            except AttributeError:
-                pass
-        return self.calculate_neutral_score(team, team_obj, simmed_kenpoms, net_estimates)
-
-    def calculate_neutral_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        good_neutral_wins = 0
-        if self.future and not self.monte_carlo:
-            for game in team_obj.games:
-                if game.win and game.location == "N":
-                    conf_tourn_multiplier = 1
-                    date_info = game.date.split('-')
-                    date_month, date_num = int(date_info[0]), int(date_info[1])
-                    if date_month == 3:
-                        if date_num > SELECTION_SUNDAY_DATES[self.year] - 7:
-                            conf_tourn_multiplier = (SELECTION_SUNDAY_DATES[self.year] - date_num)/7
-                    if "Non Div I" in game.opponent:
-                        opp_NET = 365
-                    else:
-                        opp_NET = net_estimates[game.opponent]
-                    if opp_NET <= 50:
-                        good_neutral_wins += conf_tourn_multiplier * 1
-                    elif opp_NET <= 100:
-                        good_neutral_wins += conf_tourn_multiplier * (100 - opp_NET)/50
-            for game in team_obj.future_games:
-                if game['location'] == "N":
-                    opp_NET = net_estimates[game['opponent']]
-                    win_prob = self.get_win_prob(self.team_kenpoms[team]["rating"], self.team_kenpoms[game['opponent']]["rating"], game['location'])
-                    if opp_NET <= 50:
-                        good_neutral_wins += win_prob
-                    elif opp_NET <= 100:
-                        good_neutral_wins += (100 - opp_NET)*win_prob/50
-        else:
-            for game in team_obj.games:
-                if game.win and game.location == "N":
-                    conf_tourn_multiplier = 1
-                    date_info = game.date.split('-')
-                    date_month, date_num = int(date_info[0]), int(date_info[1])
-                    if date_month == 3:
-                        if date_num > SELECTION_SUNDAY_DATES[self.year] - 7:
-                            conf_tourn_multiplier = (SELECTION_SUNDAY_DATES[self.year] - date_num)/7
-                    if self.monte_carlo:
-                        if "Non Div I" in game.opponent:
-                            opp_NET = 365
-                        else:
-                            opp_NET = net_estimates[game.opponent]
-                    else:
-                        if "Non Div I" in game.opponent:
-                            opp_NET = 365
-                        else:
-                            opp_NET = self.teams[game.opponent].NET
-                    if opp_NET <= 50:
-                        good_neutral_wins += conf_tourn_multiplier * 1
-                    elif opp_NET <= 100:
-                        good_neutral_wins += conf_tourn_multiplier * (100 - opp_NET)/50
-        team_obj.neutral_score = good_neutral_wins/5
-        return team_obj.neutral_score
-
-    #calculate score for a team's top 10 wins (scale: 1.000 = 3, 0.000 = 0)
-        #sliding scale. #1-#5: full win. #6-#14: decreases win count by 0.1 for each rank down.
-        #also, sliding penalty for conference tournament games. this is done for accuracy, not cause I like it.
-    #param team: Team object to calculate score for
-    def get_top10_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        if self.tracker:
-            try:
-                return team_obj.top10_score
-            except AttributeError:
-                pass
-        return self.calculate_top10_score(team, team_obj, simmed_kenpoms, net_estimates)
-
-    def calculate_top10_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        top_10_wins = 0
-        if self.future and not self.monte_carlo:
-            for game in team_obj.games:
-                if game.win:
-                    conf_tourn_multiplier = 1
-                    date_info = game.date.split('-')
-                    date_month, date_num = int(date_info[0]), int(date_info[1])
-                    if date_month == 3:
-                        if date_num > SELECTION_SUNDAY_DATES[self.year] - 7:
-                            conf_tourn_multiplier = (SELECTION_SUNDAY_DATES[self.year] - date_num)/7
-                    if "Non Div I" in game.opponent:
-                        opp_NET = 365
-                    else:
-                        opp_NET = net_estimates[game.opponent]
-                    if opp_NET <= 5:
-                        top_10_wins += conf_tourn_multiplier * 1
-                    elif opp_NET <= 15:
-                        top_10_wins += conf_tourn_multiplier * (15 - opp_NET)/10
-            for game in team_obj.future_games:
-                try:
-                    opp_NET = net_estimates[game['opponent']]
-                except KeyError: #Until New Haven makes the NET
-                    opp_NET = 365
-                win_prob = self.get_win_prob(self.team_kenpoms[team]["rating"], self.team_kenpoms[game['opponent']]["rating"], game['location'])
-                if opp_NET <= 5:
-                    top_10_wins += win_prob
-                elif opp_NET <= 15:
-                    top_10_wins += (15 - opp_NET)*win_prob/10
-        else:
-            for game in team_obj.games:
-                if game.win:
-                    conf_tourn_multiplier = 1
-                    date_info = game.date.split('-')
-                    date_month, date_num = int(date_info[0]), int(date_info[1])
-                    if date_month == 3:
-                        if date_num > SELECTION_SUNDAY_DATES[self.year] - 7:
-                            conf_tourn_multiplier = (SELECTION_SUNDAY_DATES[self.year] - date_num)/7
-                    if self.monte_carlo:
-                        if "Non Div I" in game.opponent:
-                            opp_NET = 365
-                        else:
-                            opp_NET = net_estimates[game.opponent]
-                    else:
-                        if "Non Div I" in game.opponent:
-                            opp_NET = 365
-                        else:
-                            opp_NET = self.teams[game.opponent].NET
-                    if opp_NET <= 5:
-                        top_10_wins += conf_tourn_multiplier * 1
-                    elif opp_NET <= 15:
-                        top_10_wins += conf_tourn_multiplier * (15 - opp_NET)/10
-
-        team_obj.top10_score = top_10_wins/3
-        return team_obj.top10_score
-
-    #calculate score for a team's top 25 wins (Quad 1A) (scale: 1.000 = 5, 0.000 = 0)
-        #sliding scale. Quad 1A is 1-15 (H), 1-25 (N), 1-40 (A). win count decreases by 0.1 for each rank down when within 5 of end.
-        #also, sliding penalty for conference tournament games. this is done for accuracy, not cause I like it.
-    #param team: Team object to calculate score for
-    def get_top25_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        if self.tracker:
-            try:
-                return team_obj.top25_score
-            except AttributeError:
-                pass
-        return self.calculate_top25_score(team, team_obj, simmed_kenpoms, net_estimates)
-
-    def calculate_top25_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        top_25_wins = 0
-        if self.future and not self.monte_carlo:
-            for game in team_obj.games:
-                if game.win:
-                    if "Non Div I" in game.opponent:
-                        opp_NET = 365
-                    else:
-                        opp_NET = net_estimates[game.opponent]
-                    conf_tourn_multiplier = 1
-                    date_info = game.date.split('-')
-                    date_month, date_num = int(date_info[0]), int(date_info[1])
-                    if date_month == 3:
-                        if date_num > SELECTION_SUNDAY_DATES[self.year] - 7:
-                            conf_tourn_multiplier = (SELECTION_SUNDAY_DATES[self.year] - date_num)/7
-                    if game.location == "H":
-                        if opp_NET <= 10:
-                            top_25_wins += conf_tourn_multiplier * 1
-                        elif opp_NET <= 20:
-                            top_25_wins += conf_tourn_multiplier * (20 - opp_NET)/10
-                    elif game.location == "N":
-                        if opp_NET <= 20:
-                            top_25_wins += conf_tourn_multiplier * 1
-                        elif opp_NET <= 30:
-                            top_25_wins += conf_tourn_multiplier * (30 - opp_NET)/10
-                    elif game.location == "A":
-                        if opp_NET <= 35:
-                            top_25_wins += conf_tourn_multiplier * 1
-                        elif opp_NET <= 45:
-                            top_25_wins += conf_tourn_multiplier * (45 - opp_NET)/10
-            for game in team_obj.future_games:
-                try:
-                    opp_NET = net_estimates[game['opponent']]
-                except KeyError: #Until New Haven makes the NET
-                    opp_NET = 365
-                win_prob = self.get_win_prob(self.team_kenpoms[team]["rating"], self.team_kenpoms[game['opponent']]["rating"], game['location'])
-                if game['location'] == "H":
-                    if opp_NET <= 10:
-                        top_25_wins += win_prob
-                    elif opp_NET <= 20:
-                        top_25_wins += win_prob * (20 - opp_NET)/10
-                elif game['location'] == "N":
-                    if opp_NET <= 20:
-                        top_25_wins += win_prob
-                    elif opp_NET <= 30:
-                        top_25_wins += win_prob * (30 - opp_NET)/10
-                elif game['location'] == "A":
-                    if opp_NET <= 35:
-                        top_25_wins += win_prob
-                    elif opp_NET <= 45:
-                        top_25_wins += win_prob * (45 - opp_NET)/10
-        else:
-            for game in team_obj.games:
-                if game.win:
-                    if self.monte_carlo:
-                        if "Non Div I" in game.opponent:
-                            opp_NET = 365
-                        else:
-                            opp_NET = net_estimates[game.opponent]
-                    else:
-                        if "Non Div I" in game.opponent:
-                            opp_NET = 365
-                        else:
-                            opp_NET = self.teams[game.opponent].NET
-                    conf_tourn_multiplier = 1
-                    date_info = game.date.split('-')
-                    date_month, date_num = int(date_info[0]), int(date_info[1])
-                    if date_month == 3:
-                        if date_num > SELECTION_SUNDAY_DATES[self.year] - 7:
-                            conf_tourn_multiplier = (SELECTION_SUNDAY_DATES[self.year] - date_num)/7
-                    if game.location == "H":
-                        if opp_NET <= 10:
-                            top_25_wins += conf_tourn_multiplier * 1
-                        elif opp_NET <= 20:
-                            top_25_wins += conf_tourn_multiplier * (20 - opp_NET)/10
-                    elif game.location == "N":
-                        if opp_NET <= 20:
-                            top_25_wins += conf_tourn_multiplier * 1
-                        elif opp_NET <= 30:
-                            top_25_wins += conf_tourn_multiplier * (30 - opp_NET)/10
-                    elif game.location == "A":
-                        if opp_NET <= 35:
-                            top_25_wins += conf_tourn_multiplier * 1
-                        elif opp_NET <= 45:
-                            top_25_wins += conf_tourn_multiplier * (45 - opp_NET)/10
-
-        team_obj.top25_score = top_25_wins/5
-        return team_obj.top25_score
-
     #calculate score for a team's strength of schedule (scale: 1.000 = 1, 0.000 = 150)
     #param team: Team object to calculate score for
     def get_SOS_score(self, team, team_obj):
         #TODO: could calculate a future estimate here. Might be good.
-        try:
-            return team_obj.SOS_score
-        except AttributeError:
-            if team_obj.NET_SOS < 151:
-                team_obj.SOS_score = (151 - team_obj.NET_SOS)/150
-            else:   #limit how bad a really bad schedule can hurt you
-                team_obj.SOS_score = (151 - team_obj.NET_SOS)/300
-            return team_obj.SOS_score
+        return self.get_cached_score("SOS_score", team, team_obj, team_obj.NET_SOS, \
+                lambda: self.calculate_SOS_score(team_obj))
+
+    def calculate_SOS_score(self, team_obj):
+        if team_obj.NET_SOS < 151:
+            team_obj.SOS_score = (151 - team_obj.NET_SOS)/150
+        else:   #limit how bad a really bad schedule can hurt you
+            team_obj.SOS_score = (151 - team_obj.NET_SOS)/300
+        return team_obj.SOS_score
 
     #calculate score for a team's nonconference strength of schedule (scale: 1.000 = 1, 0.000 = 150)
     #param team: Team object to calculate score for
     def get_NCSOS_score(self, team, team_obj):
-        try:
-            return team_obj.NCSOS_score
-        except AttributeError:
-            if team_obj.noncon_SOS < 151:
-                team_obj.NCSOS_score = (151 - team_obj.noncon_SOS)/150
-            else:   #limit how bad a really bad noncon schedule can hurt you
-                team_obj.NCSOS_score = (151 - team_obj.noncon_SOS)/450
-            return team_obj.NCSOS_score
-
-    #calculate score for a team's awful (NET > 200) losses (scale: 1.000 = 0, 0.000 = 1)
-        #sliding scale. loss count increases by 0.02 for each rank down past 175. #225 and worse are a full loss.
-    #param team: Team object to calculate score for
-    def get_awful_loss_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        if self.tracker:
-            try:
-                return team_obj.awful_loss_score
-            except AttributeError:
-                pass
-        return self.calculate_awful_loss_score(team, team_obj, simmed_kenpoms, net_estimates)
-
-    def calculate_awful_loss_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        awful_losses = 0
-        if self.future and not self.monte_carlo:
-            for game in team_obj.games:
-                if "Non Div I" in game.opponent:
-                    opp_NET = 365
-                else:
-                    opp_NET = net_estimates[game.opponent]
-                if not game.win:
-                    if opp_NET > 225:
-                        awful_losses += 1
-                    elif opp_NET > 175:
-                        awful_losses += (opp_NET - 175)/50
-            for game in team_obj.future_games:
-                try:
-                    opp_NET = net_estimates[game['opponent']]
-                except KeyError: #Until New Haven makes the NET
-                    opp_NET = 365
-                win_prob = self.get_win_prob(self.team_kenpoms[team]["rating"], self.team_kenpoms[game['opponent']]["rating"], game['location'])
-                if opp_NET > 225:
-                    awful_losses += (1 - win_prob)
-                elif opp_NET > 175:
-                    awful_losses += (opp_NET - 175)*(1 - win_prob)/50
-        else:
-            for game in team_obj.games:
-                if self.monte_carlo:
-                    if "Non Div I" in game.opponent:
-                        opp_NET = 365
-                    else:
-                        opp_NET = net_estimates[game.opponent]
-                else:
-                    if "Non Div I" in game.opponent:
-                        opp_NET = 365
-                    else:
-                        opp_NET = self.teams[game.opponent].NET
-                if not game.win:
-                    if opp_NET > 225:
-                        awful_losses += 1
-                    elif opp_NET > 175:
-                        awful_losses += (opp_NET - 175)/50
+        return self.get_cached_score("NCSOS_score", team, team_obj, team_obj.noncon_SOS, \
+                lambda: self.calculate_NCSOS_score(team_obj))
+
+    def calculate_NCSOS_score(self, team_obj):
+        if team_obj.noncon_SOS < 151:
+            team_obj.NCSOS_score = (151 - team_obj.noncon_SOS)/150
+        else:   #limit how bad a really bad noncon schedule can hurt you
+            team_obj.NCSOS_score = (151 - team_obj.noncon_SOS)/450
+        return team_obj.NCSOS_score
+
+    #reuse a team's score in a category if nothing it's calculated from has changed since the last time, otherwise calculate it again
+    #param category: Team attribute the score is kept in
+    #param inputs: everything the score is calculated from
+    #param calculate: function to calculate the score, which stores it on the team
+    def get_cached_score(self, category, team, team_obj, inputs, calculate):
+        cached = self.score_cache.get((category, team))
+        if cached is not None and cached[0] == inputs:
+            setattr(team_obj, category, cached[1])
+            return cached[1]
+        score = calculate()
+        self.score_cache[(category, team)] = (inputs, score)
+        return score
+
+    #throw out cached scores so they're calculated from scratch next time, e.g. after a team's data is reloaded
+    def clear_score_cache(self):
+        self.score_cache = dict()
+        self.scored_games = None
+        self.game_totals = None
 
-        team_obj.awful_loss_score = (1 - awful_losses)
-        return team_obj.awful_loss_score
-
-    #calculate score for a team's bad (sub-Q1) losses (scale: 1.000 = 0, 0.000 = 5)
-    #param team: Team object to calculate score for
-    def get_bad_loss_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        if self.tracker:
-            try:
-                return team_obj.bad_loss_score
-            except AttributeError:
-                pass
-        return self.calculate_bad_loss_score(team, team_obj, simmed_kenpoms, net_estimates)
-
-    def calculate_bad_loss_score(self, team, team_obj, simmed_kenpoms, net_estimates):
-        bad_losses = 0
-        if self.future and not self.monte_carlo:
-            for game in team_obj.games:
-                if not game.win:
-                    if "Non Div I" in game.opponent:
-                        opp_NET = 365
-                    else:
-                        opp_NET = net_estimates[game.opponent]
-                    game_quad = self.get_quadrant(opp_NET, game.location)
-                    if game_quad > 1:
-                        bad_losses += 1
-            for game in team_obj.future_games:
-                try:
-                    opp_NET = net_estimates[game['opponent']]
-                except KeyError: #Until New Haven makes the NET
-                    opp_NET = 365
-                game_quad = self.get_quadrant(opp_NET, game['location'])
-                win_prob = self.get_win_prob(self.team_kenpoms[team]["rating"], self.team_kenpoms[game['opponent']]["rating"], game['location'])
-                if game_quad >= 2:
-                    bad_losses += (1 - win_prob) 
-        else:
-            for game in team_obj.games:
-                if self.monte_carlo:
-                    if "Non Div I" in game.opponent:
-                        opp_NET = 365
-                    else:
-                        opp_NET = net_estimates[game.opponent]
-                else:
-                    if "Non Div I" in game.opponent:
-                        opp_NET = 365
-                    else:
-                        opp_NET = self.teams[game.opponent].NET
-                if not game.win:
-                    game_quad = self.get_quadrant(opp_NET, game.location)
-                    if game_quad >= 2:
-                        bad_losses += 1 
-
-        team_obj.bad_loss_score = (1 - bad_losses/5)
-        return team_obj.bad_loss_score
-    
     def get_weights(self, weightfile):
         with open(weightfile, "r") as f:
             for line in f.read().split("\n"):
@@ -877,42 +241,240 @@ class Scorer:
                 WEIGHTS[weight_name] = float(weight_val)
         return WEIGHTS
 
+    #win probability for one game
+    #param team_kenpom, opp_kenpom: each team's rating
+    #param location: 'H', 'A' or 'N', from the team's point of view
     def get_win_prob(self, team_kenpom, opp_kenpom, location):
-        team_spread_neutral = team_kenpom - opp_kenpom
+        return self.get_win_probs(team_kenpom, opp_kenpom, LOCATION_CODES[location])
+
+    #win probabilities for many games at once
+    #works on plain numbers too, so a single game goes through exactly the same math
+    #param team_ratings, opp_ratings: arrays of each team's rating
+    #param locations: array of location codes, from the team's point of view
+    #returns: array of win probabilities
+    def get_win_probs(self, team_ratings, opp_ratings, locations):
+        team_spread_neutral = team_ratings - opp_ratings
         if self.mens:
             team_spread_neutral = team_spread_neutral*0.675  #average possessions: 67.5
-        if location == 'H':
-            spread = team_spread_neutral + 3
-        elif location == 'N':
-            spread = team_spread_neutral
-        elif location == 'A':
-            spread = team_spread_neutral - 3
-
-        if abs(spread) <= 21:
-            return -0.00002609*spread*spread*spread + 0.00002466*spread*spread + 0.033206*spread + 0.5
-        elif spread > 21:
-            if spread < 25:
-                return 0.98
-            if spread < 30:
-                return 0.99
-            if spread < 35:
-                return 0.995
-            return 0.999
-        elif spread < -21:
-            if spread > -25:
-                return 0.02
-            if spread > -30:
-                return 0.01
-            if spread > -35:
-                return 0.005
+        if isinstance(locations, numpy.ndarray):
+            spread = team_spread_neutral + numpy.array(HOME_ADVANTAGES)[locations]
+        else:
+            spread = team_spread_neutral + HOME_ADVANTAGES[locations]
+        cubic = -0.00002609*spread*spread*spread + 0.00002466*spread*spread + 0.033206*spread + 0.5
+
+        if not isinstance(spread, numpy.ndarray):
+            if abs(spread) <= 21:
+                return cubic
+            for cutoff, favorite_prob, underdog_prob in WIN_PROB_LADDER:
+                if spread > 0 and spread < cutoff:
+                    return favorite_prob
+                if spread < 0 and spread > -cutoff:
+                    return underdog_prob
+            if spread > 0:
+                return 0.999
             return 0.001
 
+        #past a 21 point spread, step down a ladder instead
+        favorite_probs = numpy.full(numpy.shape(spread), 0.999)
+        underdog_probs = numpy.full(numpy.shape(spread), 0.001)
+        for cutoff, favorite_prob, underdog_prob in reversed(WIN_PROB_LADDER):
+            favorite_probs = numpy.where(spread < cutoff, favorite_prob, favorite_probs)
+            underdog_probs = numpy.where(spread > -cutoff, underdog_prob, underdog_probs)
+        return numpy.where(numpy.abs(spread) <= 21, cubic, numpy.where(spread > 0, favorite_probs, underdog_probs))
+
     def get_NET_estimate(self, curr_NET, curr_KenPom, season_days, days_left):
         # estimated NET begins as all KenPom and builds more actual NET in as the season progresses until 30 days, all becomes NET
         NET_weight = min(1, (season_days - days_left)/(season_days - 30))
         NET_estimate = (NET_weight*curr_NET) + (1 - NET_weight)*curr_KenPom
         return NET_estimate
 
+    #calculate every game-based category for every team at once, from the game store's arrays
+    #stores each category's score on its Team object, the way the categories computed one team at a time are
+    #a team's game scores only depend on its own games and its opponents' NETs, so after the first call only the teams with a
+    #game whose result or opponent's NET has changed get rescored
+    #param net_estimates: estimated NET of each team (future and monte carlo modes)
+    def build_game_scores(self, net_estimates):
+        store = self.game_store
+        num_teams = len(store.team_names)
+        if self.future or self.monte_carlo:
+            team_NETs = numpy.array([net_estimates[team] for team in store.team_names], dtype=float)
+        else:
+            team_NETs = numpy.array([self.teams[team].NET for team in store.team_names], dtype=float)
+        #nothing to do if no game has changed and neither has anybody's NET, e.g. when the tracker tries new weights
+        if self.scored_games is not None and (self.monte_carlo or not self.future) and self.scored_version == store.version \
+                and numpy.array_equal(team_NETs, self.scored_NETs):
+            return
+        self.scored_version = store.version
+        team_ids, opp_ids, locations, wins, months, days = store.get_season_games()
+        opp_NETs = numpy.where(opp_ids == NO_TEAM, 365, team_NETs[opp_ids])
+
+        rescore = numpy.ones(num_teams, dtype=bool)
+        #future games' expected results depend on ratings too, so future mode always rescores everyone
+        if self.scored_games is not None and (self.monte_carlo or not self.future):
+            old_team_ids, old_opp_ids, old_wins, old_opp_NETs = self.scored_games
+            if numpy.array_equal(team_ids, old_team_ids) and numpy.array_equal(opp_ids, old_opp_ids):
+                changed = (wins != old_wins) | (opp_NETs != old_opp_NETs)
+                rescore = numpy.bincount(team_ids[changed], minlength=num_teams) > 0
+        self.scored_games = (team_ids, opp_ids, wins, opp_NETs)
+        self.scored_NETs = team_NETs
+        if not rescore.any():
+            return
+
+        rows = rescore[team_ids]
+        team_ids = team_ids[rows]
+        tallies = self.get_game_tallies(opp_NETs[rows], locations[rows], wins[rows], months[rows], days[rows])
+
+        if self.future and not self.monte_carlo:
+            #add the expected result of each game left on the schedule
+            future_team_ids = store.future_team
+            future_locations = store.future_location
+            future_opp_ids = store.future_opponent
+            future_NETs = numpy.where(future_opp_ids == NO_TEAM, 365, team_NETs[future_opp_ids])
+            future_quads = self.get_quadrants(future_NETs, future_locations)
+            ratings = numpy.array([self.team_kenpoms[team]["rating"] for team in store.team_names], dtype=float)
+            opp_ratings = ratings[future_opp_ids]
+            for row, opponent in store.other_future_opponents.items():
+                opp_ratings[row] = self.team_kenpoms[opponent]["rating"]
+            win_probs = self.get_win_probs(ratings[future_team_ids], opp_ratings, future_locations)
+            loss_probs = 1 - win_probs
+            future_zeros = numpy.zeros(len(future_team_ids))
+            future_tallies = {
+                "wins": win_probs,
+                "losses": loss_probs,
+                "Q1_wins": numpy.where(future_quads == 1, win_probs, future_zeros),
+                "Q1_losses": loss_probs,
+                "Q2_wins": numpy.where(future_quads <= 2, win_probs, future_zeros),
+                "Q2_losses": numpy.where(future_quads >= 2, loss_probs, future_zeros),
+                "Q3_wins": numpy.where(future_quads <= 3, win_probs, future_zeros),
+                "Q3_losses": numpy.where(future_quads >= 3, loss_probs, future_zeros),
+                "Q4_wins": win_probs,
+                "Q4_losses": numpy.where(future_quads == 4, loss_probs, future_zeros),
+                "road_wins": numpy.where(future_locations == LOCATION_CODES["A"], numpy.where(future_NETs <= 50, win_probs, \
+                        numpy.where(future_NETs <= 100, (100 - future_NETs)*win_probs/50, future_zeros)), future_zeros),
+                "neutral_wins": numpy.where(future_locations == LOCATION_CODES["N"], numpy.where(future_NETs <= 50, win_probs, \
+                        numpy.where(future_NETs <= 100, (100 - future_NETs)*win_probs/50, future_zeros)), future_zeros),
+                "top10_wins": numpy.where(future_NETs <= 5, win_probs, \
+                        numpy.where(future_NETs <= 15, (15 - future_NETs)*win_probs/10, future_zeros)),
+                "top25_wins": self.get_quad_1A_wins(future_NETs, future_locations, win_probs),
+                "awful_losses": numpy.where(future_NETs > 225, loss_probs, \
+                        numpy.where(future_NETs > 175, (future_NETs - 175)*loss_probs/50, future_zeros)),
+                "bad_losses": numpy.where(future_quads >= 2, loss_probs, future_zeros)
+            }
+            team_ids = numpy.concatenate([team_ids, future_team_ids])
+            for tally in tallies:
+                tallies[tally] = numpy.concatenate([tallies[tally], future_tallies[tally]])
+
+        #bincount adds each team's games up in order, same as looping through them would
+        #a team being rescored has all of its games in the tallies, so its totals come out the same as a full rescore
+        totals = {tally: numpy.bincount(team_ids, weights=tallies[tally], minlength=num_teams) for tally in tallies}
+        if self.game_totals is None:
+            self.game_totals = totals
+        else:
+            for tally in totals:
+                self.game_totals[tally][rescore] = totals[tally][rescore]
+        category_scores = self.get_category_scores({tally: totals[tally][rescore] for tally in totals})
+        rescored_teams = [team for team, rescored in zip(store.team_names, rescore) if rescored]
+        for category in category_scores:
+            for team, score in zip(rescored_teams, category_scores[category].tolist()):
+                setattr(self.teams[team], category, score)
+
+    #each game's contribution to every game-based category
+    #param opp_NETs, locations, wins, months, days: arrays with one entry per game, from the team's point of view
+    #returns: dict of tally name: array with one entry per game
+    def get_game_tallies(self, opp_NETs, locations, wins, months, days):
+        selection_sunday = SELECTION_SUNDAY_DATES[self.year]
+        losses = ~wins
+        quads = self.get_quadrants(opp_NETs, locations)
+        #sliding penalty for conference tournament games. this is done for accuracy, not cause I like it.
+        multipliers = numpy.where((months == 3) & (days > selection_sunday - 7), (selection_sunday - days)/7, 1)
+        zeros = numpy.zeros(len(opp_NETs))
+        return {
+            "wins": wins*1.0,
+            "losses": losses*1.0,
+            "Q1_wins": (wins & (quads == 1))*1.0,
+            "Q1_losses": losses*1.0,
+            "Q2_wins": (wins & (quads <= 2))*1.0,
+            "Q2_losses": (losses & (quads >= 2))*1.0,
+            "Q3_wins": (wins & (quads <= 3))*1.0,
+            "Q3_losses": (losses & (quads >= 3))*1.0,
+            "Q4_wins": wins*1.0,
+            "Q4_losses": (losses & (quads == 4))*1.0,
+            #road and neutral: #1-#50: full win. #51-#99: decreases win count by 0.02 for each rank down.
+            "road_wins": numpy.where(wins & (locations == LOCATION_CODES["A"]), \
+                    numpy.where(opp_NETs <= 50, 1, numpy.where(opp_NETs <= 100, (100 - opp_NETs)/50, zeros)), zeros),
+            "neutral_wins": numpy.where(wins & (locations == LOCATION_CODES["N"]), \
+                    numpy.where(opp_NETs <= 50, multipliers, \
+                    numpy.where(opp_NETs <= 100, multipliers*(100 - opp_NETs)/50, zeros)), zeros),
+            #top 10: #1-#5: full win. #6-#14: decreases win count by 0.1 for each rank down.
+            "top10_wins": numpy.where(wins, numpy.where(opp_NETs <= 5, multipliers, \
+                    numpy.where(opp_NETs <= 15, multipliers*(15 - opp_NETs)/10, zeros)), zeros),
+            #top 25 (Quad 1A): 1-15 (H), 1-25 (N), 1-40 (A). win count decreases by 0.1 for each rank down when within 5 of end.
+            "top25_wins": numpy.where(wins, self.get_quad_1A_wins(opp_NETs, locations, multipliers), zeros),
+            #awful: loss count increases by 0.02 for each rank down past 175. #225 and worse are a full loss.
+            "awful_losses": numpy.where(losses, numpy.where(opp_NETs > 225, 1, \
+                    numpy.where(opp_NETs > 175, (opp_NETs - 175)/50, zeros)), zeros),
+            "bad_losses": (losses & (quads >= 2))*1.0
+        }
+
+    #turn each team's game tallies into its game-based category scores
+    #param totals: dict of tally name: array with one entry per team
+    #returns: dict of category name: array of scores, one per team
+    def get_category_scores(self, totals):
+        num_teams = len(totals["wins"])
+        pcts = dict()
+        for tally in ["", "Q1_", "Q2_", "Q3_", "Q4_"]:
+            games = totals[tally + "wins"] + totals[tally + "losses"]
+            pcts[tally] = numpy.divide(totals[tally + "wins"], games, out=numpy.zeros(num_teams), where=games != 0)
+        return {
+            #winning percentage (scale: 1.000 = 1.000, 0.000 = 0.600)
+            "loss_score": numpy.where(totals["wins"] + totals["losses"] != 0, (pcts[""] - 0.6)/0.4, 0),
+            #record in quadrant 1 (scale: 0.800 = 1, 0.000 = .000)
+            "Q1_score": pcts["Q1_"]/0.8,
+            #record in quadrant 2 (scale: 1.000 = 1, 0.000 = .500)
+            "Q2_score": (pcts["Q2_"] - 0.5)/0.5,
+            #record in quadrant 3 (scale: 1.000 = 1, 0.000 = .800)
+            "Q3_score": (pcts["Q3_"] - 0.8)/0.2,
+            #record in quadrant 4 (scale: 1.000 = 1, 0.000 = .950). limit how bad multiple Q4 losses can hurt you
+            "Q4_score": numpy.where(pcts["Q4_"] >= 0.95, (pcts["Q4_"] - 0.95)/0.05, (pcts["Q4_"] - 0.95)/0.3),
+            #road wins (scale: 1.000 = 5, 0.000 = 0)
+            "road_score": totals["road_wins"]/5,
+            #neutral court wins (scale: 1.000 = 5, 0.000 = 0)
+            "neutral_score": totals["neutral_wins"]/5,
+            #top 10 wins (scale: 1.000 = 3, 0.000 = 0)
+            "top10_score": totals["top10_wins"]/3,
+            #top 25 wins (scale: 1.000 = 5, 0.000 = 0)
+            "top25_score": totals["top25_wins"]/5,
+            #awful (NET > 200) losses (scale: 1.000 = 0, 0.000 = 1)
+            "awful_loss_score": 1 - totals["awful_losses"],
+            #bad (sub-Q1) losses (scale: 1.000 = 0, 0.000 = 5)
+            "bad_loss_score": 1 - totals["bad_losses"]/5
+        }
+
+    #find the quadrant of many games at once
+    #param opp_NETs: array of opponent NETs
+    #param locations: array of location codes
+    #returns: array of quadrants, 1-4
+    def get_quadrants(self, opp_NETs, locations):
+        quads = numpy.zeros(len(opp_NETs), dtype=numpy.int8)
+        for location_code, cutoffs in enumerate(QUADRANT_CUTOFFS):
+            at_location = locations == location_code
+            quads[at_location] = numpy.searchsorted(cutoffs, opp_NETs[at_location], side="left") + 1
+        return quads
+
+    #count how much each game counts as a Quad 1A win
+    #param opp_NETs: array of opponent NETs
+    #param locations: array of location codes
+    #param full_wins: how much a full Quad 1A win counts for each game
+    #returns: array of partial win counts
+    def get_quad_1A_wins(self, opp_NETs, locations, full_wins):
+        quad_1A_wins = numpy.zeros(len(opp_NETs))
+        for location, cutoff in QUAD_1A_CUTOFFS.items():
+            at_location = locations == LOCATION_CODES[location]
+            quad_1A_wins = numpy.where(at_location & (opp_NETs <= cutoff), full_wins, quad_1A_wins)
+            quad_1A_wins = numpy.where(at_location & (opp_NETs > cutoff) & (opp_NETs <= cutoff + 10), \
+                    full_wins*(cutoff + 10 - opp_NETs)/10, quad_1A_wins)
+        return quad_1A_wins
+
     #calculate resume score for all teams
     def build_scores(self, WEIGHTS, simmed_kenpoms=dict()):
         net_estimates = dict()
@@ -924,34 +486,54 @@ class Scorer:
             for team in self.teams:
                 net_estimates[team] = self.get_NET_estimate(self.teams[team].NET, self.team_kenpoms[team]["rank"], season_days, days_left)
 
+        self.build_game_scores(net_estimates)
         for team in self.teams:
             if self.verbose and not self.monte_carlo:
                 print("Scoring", team)
             team_obj = self.teams[team]
-            score = 0
-            score += WEIGHTS["LOSS_WEIGHT"]*self.get_loss_score(team, team_obj)
-            score += WEIGHTS["NET_WEIGHT"]*self.get_NET_score(team, team_obj, simmed_kenpoms, net_estimates)
-            score += WEIGHTS["POWER_WEIGHT"]*self.get_power_score(team, team_obj, simmed_kenpoms)
-            score += WEIGHTS["Q1_WEIGHT"]*self.get_Q1_score(team, team_obj, simmed_kenpoms, net_estimates)
-            score += WEIGHTS["Q2_WEIGHT"]*self.get_Q2_score(team, team_obj, simmed_kenpoms, net_estimates)
-            score += WEIGHTS["Q3_WEIGHT"]*self.get_Q3_score(team, team_obj, simmed_kenpoms, net_estimates)
-            score += WEIGHTS["RESULTS_BASED_WEIGHT"]*self.get_results_based_score(team, team_obj, season_days, days_left)
-            score += WEIGHTS["Q4_WEIGHT"]*self.get_Q4_score(team, team_obj, simmed_kenpoms, net_estimates)
-            score += WEIGHTS["ROAD_WEIGHT"]*self.get_road_score(team, team_obj, simmed_kenpoms, net_estimates)
-            score += WEIGHTS["NEUTRAL_WEIGHT"]*self.get_neutral_score(team, team_obj, simmed_kenpoms, net_estimates)
-            score += WEIGHTS["TOP_10_WEIGHT"]*self.get_top10_score(team, team_obj, simmed_kenpoms, net_estimates)
-            score += WEIGHTS["TOP_25_WEIGHT"]*self.get_top25_score(team, team_obj, simmed_kenpoms, net_estimates)
-            score += WEIGHTS["SOS_WEIGHT"]*self.get_SOS_score(team, team_obj)
-            score += WEIGHTS["NONCON_SOS_WEIGHT"]*self.get_NCSOS_score(team, team_obj)
-            score += WEIGHTS["AWFUL_LOSS_WEIGHT"]*self.get_awful_loss_score(team, team_obj, simmed_kenpoms, net_estimates)
-            score += WEIGHTS["BAD_LOSS_WEIGHT"]*self.get_bad_loss_score(team, team_obj, simmed_kenpoms, net_estimates)
-            self.teams[team].score = score
+            self.get_NET_score(team, team_obj, simmed_kenpoms, net_estimates)
+            self.get_power_score(team, team_obj, simmed_kenpoms)
+            self.get_results_based_score(team, team_obj, season_days, days_left)
+            self.get_SOS_score(team, team_obj)
+            self.get_NCSOS_score(team, team_obj)
+            self.teams[team].score = self.get_weighted_score(team_obj, WEIGHTS)
+        self.seed_list = SeedList(self.teams)
         if self.future or self.monte_carlo:
             f = open(self.schedule_datadir + SCRAPE_DATE_FILE, "w+")
             today_date = date.today().strftime("%m-%d")    #format: mm-dd
             f.write(today_date)
             f.close()
 
+    #add up a team's category scores
+    #param team_obj: Team object with its category scores already calculated
+    #param weights: weight of each category
+    #param category_scores: dict of category: score to use in place of the one stored on the team
+    def get_weighted_score(self, team_obj, weights, category_scores=dict()):
+        score = 0
+        for weight, category in CATEGORY_WEIGHTS:
+            score += weights[weight]*category_scores.get(category, getattr(team_obj, category))
+        return score
+
+    #rescore two teams as if one more game between them had been played, e.g. "what if X beats Y tonight"
+    #only the two teams' game tallies change, so nobody else needs rescoring. leaves every stored score alone
+    #param winner, loser: names of the teams
+    #param location: 'H', 'A' or 'N', from the winner's point of view
+    #param weights: weight of each category
+    #returns: dict of team: score with the extra game
+    def get_what_if_scores(self, winner, loser, location, weights):
+        store = self.game_store
+        team_ids = [store.team_ids[winner], store.team_ids[loser]]
+        location_code = LOCATION_CODES[location]
+        tallies = self.get_game_tallies(self.scored_NETs[team_ids[::-1]], \
+                numpy.array([location_code, REVERSE_LOCATION_CODES[location_code]]), numpy.array([True, False]), \
+                numpy.full(2, SIMULATED_MONTH), numpy.full(2, SIMULATED_DAY))
+        category_scores = self.get_category_scores({tally: self.game_totals[tally][team_ids] + tallies[tally] for tally in tallies})
+        scores = dict()
+        for index, team in enumerate([winner, loser]):
+            scores[team] = self.get_weighted_score(self.teams[team], weights, \
+                    {category: category_scores[category][index] for category in category_scores})
+        return scores
+
     #write all team scores for each category to specified file
     def output_scores(self):
         with open(self.outputfile, "w") as f:
@@ -989,7 +571,7 @@ class Scorer:
                     "),Awful losses(" + str(round(WEIGHTS["AWFUL_LOSS_WEIGHT"], 5)) + \
                     "),Bad losses(" + str(round(WEIGHTS["BAD_LOSS_WEIGHT"], 5)) + \
                     "),Total Score\n")
-            for team in sorted(self.teams, key=lambda x: self.teams[x].score, reverse=True):
+            for team in self.seed_list.get_order():
                 if self.mens:
                     line = self.teams[team].team_out + "," + \
                         str(round(self.teams[team].loss_score, 5)) + "," + \
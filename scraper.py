@@ -3,23 +3,38 @@
 from datetime import date
 from team import Team
 from game import Game
-from builder import Builder, TEAM_COORDINATES_FILE
+from builder import Builder
 from tracker import Tracker
 from scorer import Scorer
+from httpclient import HTTPClient
+from gamestore import GameStore, LOCATION_CODES
+from conferencetournament import ConferenceTournament
+from sitedistances import SiteDistances, TEAM_COORDINATES_FILE, SITE_DISTANCES_FILE
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty
 import os
+import hashlib
 import sys
 import json
-import requests
 import math
-import random
 import subprocess
+import multiprocessing
 import numpy
 
 SCRAPE_DATE_FILE = "scrapedate.txt"
+FETCH_META_FILE = "fetchmeta.txt"  #not .json, so do_load doesn't mistake it for a team
+SEASON_SNAPSHOT_FILE = "season.json"    #lives next to the resumes dir, not in it
+DEFAULT_SCRAPE_RATE = 8     #max requests per second to any one host
+SIMULATION_BLOCK_SIZE = 100     #number of monte carlo simulations to draw regular seasons for at once
+TOURNAMENT_CHUNK_SIZE = 50000   #number of tournaments to simulate at once in post-selection mode
+WORKER_POLL_SECONDS = 10         #how long to wait on the simulation workers before checking that none have died
+BRACKET_SEED_ORDER = [1, 16, 8, 9, 5, 12, 4, 13, 6, 11, 3, 14, 7, 10, 2, 15]     #top to bottom of a region
+TOURNAMENT_ROUNDS = ['first_round', 'second_round', 'sweet_sixteen', 'elite_eight', 'final_four', 'ncg', 'championship']
 TEAM_MEN_URL_START = "https://www.warrennolan.com/basketball/2026/team-clubhouse?team="
 TEAM_WOMEN_URL_START = "https://www.warrennolan.com/basketballw/2026/team-clubhouse?team="
 
 reverse_team_dict = dict()
+conference_tournaments = dict()     #by (mens, year), filled in by get_conference_tournaments
 
 #for use when outputting resumes in "Q1 Wins" column
 better_team_abbrs = {
@@ -130,26 +145,14 @@ class ComplexEncoder(json.JSONEncoder):
 class Scraper:
     def __init__(self):
         self.teams = dict()
+        self.scrape_workers = 1
+        self.http = HTTPClient(DEFAULT_SCRAPE_RATE, self.scrape_workers)
         return
 
-    #get the order of sites closest to a given set of coordinates (corresponding to a school)
-    #param sites: dict containing names of sites and their coordinates
-    #param latitude: latitude of school
-    #param longitude: longitude of school
-    def get_site_order(self, sites, latitude, longitude):
-        site_distances = dict()
-        for site in sites:
-            distance = math.sqrt((latitude - sites[site][0])**2 + (longitude - sites[site][1])**2)
-            site_distances[site] = distance
-        site_order = list()
-        for site in sorted(site_distances, key=lambda x: site_distances[x]):
-            site_order.append(site)
-        return site_order
-
     #load in team and site coordinates, compute every team's site preferences (closest as the crow flies)
     def load_coordinates(self):
-        first_sites = dict()
-        regional_sites = dict()
+        first_sites = list()
+        regional_sites = list()
         first_weekend_sites = list()
         first_weekend_rankings = dict()
         region_rankings = dict()
@@ -158,37 +161,23 @@ class Scraper:
             SITE_COORDINATES_FILE = "lib/men/" + self.year + "/site_locations.txt"
         else:
             SITE_COORDINATES_FILE = "lib/women/" + self.year + "/site_locations.txt"
-        f = open(SITE_COORDINATES_FILE, "r")
-        for count, line in enumerate(f):
-            site_name = line[:line.find("[")]
-            latitude = float(line[line.find("[")+1:line.find(" N, ")-1])
-            longitude = float(line[line.find(" N, ")+4:line.find(" W]")-1])
-            if self.mens:
-                if count < 8:
-                    first_sites[site_name] = [latitude, longitude]
-                    #two pods at each site, so append each site twice
-                    first_weekend_sites.append(site_name)
-                    first_weekend_sites.append(site_name)
-                else:
-                    regional_sites[site_name] = [latitude, longitude]
+        self.site_distances = SiteDistances(TEAM_COORDINATES_FILE, SITE_COORDINATES_FILE, \
+                os.path.join(os.path.dirname(os.path.normpath(self.datadir)), SITE_DISTANCES_FILE))
+        for count, site_name in enumerate(self.site_distances.site_names):
+            if self.mens and count < 8:
+                first_sites.append(site_name)
+                #two pods at each site, so append each site twice
+                first_weekend_sites.append(site_name)
+                first_weekend_sites.append(site_name)
             else:
-                regional_sites[site_name] = [latitude, longitude]
-        f.close()
+                regional_sites.append(site_name)
         
-        f = open(TEAM_COORDINATES_FILE, "r")
-        for line in f:
-            team = line[:line.find("[")]
-            latitude = float(line[line.find("[")+1:line.find(" N, ")-1])
-            longitude = float(line[line.find(" N, ")+4:line.find(" W]")-1])
-            try:
-                self.teams[team].latitude = latitude
-            except KeyError:    #this team didn't exist this year
+        for team in self.site_distances.team_names:
+            if team not in self.teams:    #this team didn't exist this year
                 continue
-            self.teams[team].longitude = longitude
             if self.mens:
-                first_weekend_rankings[team] = self.get_site_order(first_sites, latitude, longitude)
-            region_rankings[team] = self.get_site_order(regional_sites, latitude, longitude)
-        f.close()
+                first_weekend_rankings[team] = self.site_distances.get_site_order(team, first_sites)
+            region_rankings[team] = self.site_distances.get_site_order(team, regional_sites)
         return first_weekend_sites, first_weekend_rankings, region_rankings
 
     #load ineligible teams, eliminated teams, and conference winners for a specific year
@@ -210,7 +199,8 @@ class Scraper:
     #grab the data from where it's stored on disk or scrape it if necessary
     #param should_scrape: If true, scrape the data from the web if we haven't yet today
     #param force_scrape: If true, scrape the data from the web regardless of if we have or haven't
-    def load_data(self, should_scrape, force_scrape, future, monte_carlo):
+    #param incremental_scrape: If true, refresh the stored data with any teams whose pages have changed, even if we've scraped today
+    def load_data(self, should_scrape, force_scrape, incremental_scrape, future, monte_carlo):
         if not os.path.exists(self.datadir):
             print("creating datadir", self.datadir)
             os.makedirs(self.datadir)
@@ -221,18 +211,71 @@ class Scraper:
         today_date = date.today().strftime("%m-%d")    #format: mm-dd
         saved_date = f.read().strip()
         f.close()
-        if force_scrape or (should_scrape and today_date != saved_date):
-            self.do_scrape(today_date)
+        if force_scrape:
+            self.do_scrape(today_date, False)
+        elif incremental_scrape:
+            self.do_scrape(today_date, True)
+        elif should_scrape and today_date != saved_date:
+            self.do_scrape(today_date, False)
         else:
             self.do_load()
         first_weekend_sites, first_weekend_rankings, region_rankings = self.load_coordinates()
         eliminated_teams, ineligible_teams, conference_winners, ineligible_sites = self.load_special_teams()
         return Builder(self.mens, self.year, self.teams, self.verbose, self.outputfile, first_weekend_sites, \
                 first_weekend_rankings, region_rankings, eliminated_teams, ineligible_sites, \
-                ineligible_teams, conference_winners, reverse_team_dict, future, monte_carlo)
+                ineligible_teams, conference_winners, reverse_team_dict, future, monte_carlo, self.site_distances)
+
+    #read one team's previously scraped data off disk
+    #param filepath: location of the team's json file
+    #returns: Team object holding the stored data
+    def read_team_file(self, filepath):
+        with open(filepath, "r") as f:
+            return self.build_team(json.loads(f.read()))
+
+    #turn one team's stored json back into a Team
+    #param team_obj: dict holding the team's data, as written by ComplexEncoder
+    #returns: Team object holding the data
+    def build_team(self, team_obj):
+        games = set()
+        for game_obj in team_obj["games"]:
+            games.add(Game(game_obj["opponent"], game_obj["location"], game_obj["team_score"], \
+            game_obj["opp_score"], game_obj["date"], game_obj["conference_game"]))
+        curr_team = Team()
+        curr_team.fill_data(team_obj["conference"], team_obj["NET"], team_obj["KenPom"], team_obj["BPI"],
+                team_obj["Sagarin"], team_obj["Trank"], team_obj["KPI"], team_obj["SOR"], team_obj["WAB"],
+                team_obj["NET_SOS"], team_obj["noncon_SOS"], games, team_obj["team_out"])
+        return curr_team
+
+    #location of the file holding the whole season's scraped data at once
+    def get_snapshot_file(self):
+        return os.path.join(os.path.dirname(os.path.normpath(self.datadir)), SEASON_SNAPSHOT_FILE)
+
+    #write every team's data to the season snapshot
+    #param scrape_date: MM-DD date of the scrape the data came from
+    def write_snapshot(self, scrape_date):
+        f = open(self.get_snapshot_file(), "w+")
+        f.write(json.dumps({"date": scrape_date, "teams": self.teams}, cls=ComplexEncoder))
+        f.close()
 
     #load the data that has previously been scraped
+    #reads the season snapshot if it's from the latest scrape, otherwise reads every team's file and rebuilds the snapshot
     def do_load(self):
+        scrape_date = ""
+        if os.path.exists(self.datadir + SCRAPE_DATE_FILE):
+            with open(self.datadir + SCRAPE_DATE_FILE, "r") as f:
+                scrape_date = f.read().strip()
+        snapshot_file = self.get_snapshot_file()
+        if scrape_date and os.path.exists(snapshot_file):
+            with open(snapshot_file, "r") as f:
+                snapshot = json.loads(f.read())
+            if snapshot["date"] == scrape_date:
+                if self.verbose:
+                    print("Loading", snapshot_file)
+                for team, team_obj in snapshot["teams"].items():
+                    self.teams[team] = self.build_team(team_obj)
+                    reverse_team_dict[self.teams[team].team_out] = team
+                return
+
         #loop through datadir
         for root, dirs, files in os.walk(self.datadir):
             for filename in files:
@@ -240,45 +283,111 @@ class Scraper:
                     continue
                 if self.verbose:
                     print("Loading", filename)
-                with open(os.path.join(root, filename), "r") as f:
-                    team_obj = json.loads(f.read())
-                games = set()
-                for game_obj in team_obj["games"]:
-                    games.add(Game(game_obj["opponent"], game_obj["location"], game_obj["team_score"], \
-                    game_obj["opp_score"], game_obj["date"], game_obj["conference_game"]))
-                curr_team = Team()
-                curr_team.fill_data(team_obj["conference"], team_obj["NET"], team_obj["KenPom"], team_obj["BPI"],
-                        team_obj["Sagarin"], team_obj["Trank"], team_obj["KPI"], team_obj["SOR"], team_obj["WAB"],
-                        team_obj["NET_SOS"], team_obj["noncon_SOS"], games, team_obj["team_out"])
+                curr_team = self.read_team_file(os.path.join(root, filename))
                 self.teams[filename[:filename.find(".json")]] = curr_team
                 team = filename[:filename.find(".json")]
                 reverse_team_dict[curr_team.team_out] = team
+        if scrape_date and self.teams:
+            self.write_snapshot(scrape_date)
+
+    #read the ETag/Last-Modified/content hash recorded for each team sheet the last time it was fetched
+    #returns: dict from team name to its fetch metadata
+    def read_fetch_meta(self):
+        if not os.path.exists(self.datadir + FETCH_META_FILE):
+            return dict()
+        with open(self.datadir + FETCH_META_FILE, "r") as f:
+            return json.loads(f.read())
 
     #fetch one team's data from warrennolan.com
-    #team: string indicating which team's data should be scraped
-    def scrape_team_data(self, team):
+    #param team: string indicating which team's data should be scraped
+    #param incremental: if true, ask the site to skip the page if it hasn't changed since we last stored it
+    #returns: Team object holding the new data (None if the stored copy should be kept) and the page's fetch metadata
+    #(None if the page couldn't be fetched)
+    def fetch_team_data(self, team, incremental):
         if self.mens:
             TEAM_NITTY_URL_START = "https://www.warrennolan.com/basketball/" + self.year + "/team-net-sheet?team="
         else:
             TEAM_NITTY_URL_START = "https://www.warrennolan.com/basketballw/" + self.year + "/team-net-sheet?team="
         team_url = TEAM_NITTY_URL_START + team
-        self.teams[team] = Team()
-        self.teams[team].scrape_data(team, team_url, self.year, self.mens)
-        reverse_team_dict[self.teams[team].team_out] = team
+        meta = self.fetch_meta.get(team, dict())
+        headers = dict()
+        if incremental and team in self.teams:
+            if "etag" in meta:
+                headers["If-None-Match"] = meta["etag"]
+            if "last_modified" in meta:
+                headers["If-Modified-Since"] = meta["last_modified"]
+        team_page = self.http.get(team_url, headers=headers)
+        if team_page is None or team_page.status_code not in [200, 304]:
+            print("team problem!", team_url)
+            return None, None
+        if team_page.status_code == 304:
+            return None, meta
+        new_meta = {"hash": hashlib.sha1(team_page.content).hexdigest()}
+        if "ETag" in team_page.headers:
+            new_meta["etag"] = team_page.headers["ETag"]
+        if "Last-Modified" in team_page.headers:
+            new_meta["last_modified"] = team_page.headers["Last-Modified"]
+        if incremental and team in self.teams and meta.get("hash") == new_meta["hash"]:
+            return None, new_meta
+        team_obj = Team()
+        team_obj.parse_data(team, team_page.text, self.year, self.mens, self.http)
+        return team_obj, new_meta
+
+    #record a team's fetched data
+    #param team: string indicating which team's data was fetched
+    #param team_obj: Team object holding the new data, or None if the stored copy should be kept
+    #param meta: fetch metadata for the team's page, or None if it couldn't be fetched
+    def record_team_data(self, team, team_obj, meta):
+        if meta is None:
+            #couldn't get the page even after retrying, so fall back on the last copy we have
+            if team in self.teams:
+                print("using stored data for", team)
+                return
+            if not os.path.exists(self.datadir + team + ".json"):
+                print("no stored data for", team + ", giving up")
+                sys.exit()
+            print("using stored data for", team)
+            self.teams[team] = self.read_team_file(self.datadir + team + ".json")
+            reverse_team_dict[self.teams[team].team_out] = team
+            return
+        self.fetch_meta[team] = meta
+        if team_obj is not None:
+            self.teams[team] = team_obj
+            reverse_team_dict[team_obj.team_out] = team
+            self.changed_teams.append(team)
+            print("scraped", team + "!")
+        else:
+            print(team, "unchanged")
+
+    #fetch many teams' data at once, then record them in NET order so nothing depends on which thread finished first
+    #param team_list: teams to scrape, in the order they appear on the NET page
+    #param incremental: if true, only pick up teams whose pages have changed
+    def scrape_teams_concurrently(self, team_list, incremental):
+        with ThreadPoolExecutor(max_workers=self.scrape_workers) as executor:
+            fetches = [executor.submit(self.fetch_team_data, team, incremental) for team in team_list]
+            for team, fetch in zip(team_list, fetches):
+                self.record_team_data(team, *fetch.result())
 
     #scrape college basketball data from the web
     #param today_date: MM-DD representation of today's date. written to file to record that scraping took place
-    def do_scrape(self, today_date):
+    #param incremental: if true, start from the stored data and only re-parse and rewrite teams whose pages changed
+    def do_scrape(self, today_date, incremental):
+        if incremental:
+            self.do_load()
+        self.fetch_meta = self.read_fetch_meta()
         if self.mens:
             net_url = "https://www.warrennolan.com/basketball/" + self.year + "/net"
         else:
             net_url = "https://www.warrennolan.com/basketballw/" + self.year + "/net"
-        net_page = requests.get(net_url)
-        if net_page.status_code != 200:
-            print('scraper problem!')
-            sys.exit()
+        net_page = self.http.get(net_url)
+        if net_page is None or net_page.status_code != 200:
+            print('scraper problem! using the last scrape instead')
+            if not incremental:
+                self.do_load()
+            return
         print("NET page obtained!")
         table_start = False
+        team_list = list()
         for line in net_page.text.split("\n"):
             if not table_start:
                 if "tbody" in line:
@@ -286,11 +395,20 @@ class Scraper:
                 continue
             if "blue-black" in line:
                 team_start_index = line.find("schedule/")+9
-                team = line[team_start_index:line.find('">', team_start_index)]
-                self.scrape_team_data(team)
-                print("scraped", team + "!")
+                team_list.append(line[team_start_index:line.find('">', team_start_index)])
 
-        for team in self.teams:
+        self.changed_teams = list()
+        if self.scrape_workers > 1:
+            self.scrape_teams_concurrently(team_list, incremental)
+        else:
+            for team in team_list:
+                self.record_team_data(team, *self.fetch_team_data(team, incremental))
+
+        self.http.print_stats()
+        if incremental:
+            print(len(self.changed_teams), "of", len(team_list), "teams changed")
+
+        for team in self.changed_teams:
             #go back through and back-translate
             for game in self.teams[team].games:
                 if "Non Div I" not in game.opponent:
@@ -299,6 +417,10 @@ class Scraper:
             f.write(json.dumps(self.teams[team], cls=ComplexEncoder))
             f.close()
 
+        self.write_snapshot(today_date)
+        f = open(self.datadir + FETCH_META_FILE, "w+")
+        f.write(json.dumps(self.fetch_meta))
+        f.close()
         f = open(self.datadir + SCRAPE_DATE_FILE, "w+")
         f.write(today_date)
         f.close()
@@ -331,7 +453,16 @@ class Scraper:
                 schedule_url = TEAM_MEN_URL_START + team
             else:
                 schedule_url = TEAM_WOMEN_URL_START + team
-            schedule_page = requests.get(schedule_url)
+            schedule_page = self.http.get(schedule_url)
+            if schedule_page is None or schedule_page.status_code != 200:
+                #fall back on the last copy of this team's schedule we have
+                if not os.path.exists(schedule_datadir + team + ".json"):
+                    print("schedule problem!", schedule_url)
+                    sys.exit()
+                print("using stored schedule for", team)
+                with open(schedule_datadir + team + ".json", "r") as f:
+                    self.teams[team].future_games = json.loads(f.read())
+                continue
             
             table_start = False
             schedule_games = list()
@@ -402,6 +533,7 @@ class Scraper:
             f.close()
             print("scraped", team, "schedule!")
             self.teams[team].future_games = schedule_games
+        self.http.print_stats()
         f = open(schedule_datadir + SCRAPE_DATE_FILE, "w+")
         f.write(today_date)
         f.close()
@@ -471,7 +603,7 @@ class Scraper:
     def output_resume(self, scorer, builder):
         f = open(self.resumefile, "w+")
         f.write("Team,Record,NET,PWR,RES,SOS,Q1,Q2,Q3/4,Quality Wins,Q2+ losses\n")
-        for team in sorted(self.teams, key=lambda x: self.teams[x].score, reverse=True):
+        for team in scorer.seed_list.get_order():
             f.write(self.teams[team].team_out + ",")
             f.write("'" + self.teams[team].record + ",")
             f.write(str(self.teams[team].NET) + ",")
@@ -508,7 +640,7 @@ class Scraper:
         f.write('<th>Q1</th><th>Q2</th><th>Q3/4</th><th>Quality Wins</th><th>Q2+ losses</th></tr>\n')
         f.write('    </thead>\n')
         f.write('    <tbody>\n')
-        for index, team in enumerate(sorted(scorer.teams, key=lambda x: scorer.teams[x].score, reverse=True)):
+        for index, team in enumerate(scorer.seed_list.get_order()):
             if not index % 2:
                 f.write('      <tr class="gray_row resume_row">')
             else:
@@ -549,7 +681,7 @@ class Scraper:
         f.write('<div class="schedule_block">\n')
         future_games = dict()
 
-        for team in sorted(scorer.teams, key=lambda x: scorer.teams[x].score, reverse=True):
+        for team in scorer.seed_list.get_order():
             try:
                 team_seed = int(scorer.teams[team].seed)
             except AttributeError:  #team not tourney-relevant
@@ -679,13 +811,20 @@ def process_args():
     mc_outputfile = ""
     mc_output_html = ""
     simulations = 0
+    simulation_jobs = 1
+    simulation_seed = None
+    exact_points = 0
     tournament_selected = False
+    scrape_workers = 1
+    scrape_rate = DEFAULT_SCRAPE_RATE
+    incremental_scrape = False
+    what_if = []
 
     while argindex < len(sys.argv):
         if sys.argv[argindex] == '-h':
             print("Welcome to auto-bracketology!")
             print("Usage:")
-            print("./scraper.py [-h] [-m/-w] [-y year] [-f [-g schedulefile]] [-c <sims> [-d montecarlofile] [-p montecarlohtml] [-x]] [-i weightfile] [-o outputfile] [-r resumefile] [-b webfile] [-u resumewebfile] [-e|-s] [-t] [-v]")
+            print("./scraper.py [-h] [-m/-w] [-y year] [-f [-g schedulefile]] [-c <sims> [-j jobs] [--seed seed] [-d montecarlofile] [-p montecarlohtml] [-x]] [-z points [-p montecarlohtml]] [-i weightfile] [-o outputfile] [-r resumefile] [-b webfile] [-u resumewebfile] [-e|-s|-a [-n threads] [-l rate]] [-k winner,loser,location] [-t] [-v]")
             print("     -h: print this help message")
             print("     -m: men's tournament projection [default]")
             print("     -w: women's tournament projection")
@@ -693,6 +832,8 @@ def process_args():
             print("     -f: future (end-of-season) projection. default is to project the field as if the season ended today.")
             print("     -g: set an html filename where the upcoming schedule will live")
             print("     -c: Monte Carlo simulation. run <sims> number of simulation and report on how often a team made the tournament/got to final four/won championship")
+            print("     -j: split the monte carlo simulations across this many processes [default 1]")
+            print("     --seed: seed the monte carlo simulation with this number, so the run can be repeated exactly")
             print("     -d: set a csv filename where the monte carlo output will live")
             print("     -p: set an html filename where the monte carlo output will live")
             print("     -i: use weights located in given file")
@@ -702,9 +843,14 @@ def process_args():
             print("     -u: set an html filename where the resume page will live")
             print("     -e: override the scraping and use data currently stored")
             print("     -s: scrape data anew regardless of whether data has been scraped today")
+            print("     -a: refresh data, only re-parsing teams whose pages have changed since the last scrape")
+            print("     -n: number of teams to scrape at once [default 1]")
+            print("     -l: maximum requests per second to send to any one website when scraping [default " + str(DEFAULT_SCRAPE_RATE) + "]")
+            print("     -k: what if. show how the given game (e.g. Duke,North-Carolina,H) would change both teams' scores")
             print("     -t: tracker mode. Generate weights and test their effectiveness")
-            print("     -v: verbose. Print team resumes and bracketing procedure")
+            print("     -v: verbose. Print team resumes and bracketing procedure, and every simulated bracket with -x")
             print("     -x: Post-selection mode for monte carlo")
+            print("     -z: Post-selection exact odds, no simulating. average each game over <points> possible ratings [1 for none]")
             sys.exit()
         elif sys.argv[argindex] == '-w':
             mens = False
@@ -737,6 +883,14 @@ def process_args():
             verbose = True
         elif sys.argv[argindex] == '-s':
             force_scrape = True
+        elif sys.argv[argindex] == '-a':
+            incremental_scrape = True
+        elif sys.argv[argindex] == '-n':
+            scrape_workers = int(sys.argv[argindex + 1])
+            argindex += 1
+        elif sys.argv[argindex] == '-l':
+            scrape_rate = float(sys.argv[argindex + 1])
+            argindex += 1
         elif sys.argv[argindex] == '-i':
             weightfile = sys.argv[argindex + 1]
             argindex += 1
@@ -746,8 +900,25 @@ def process_args():
         elif sys.argv[argindex] == '-p':
             mc_output_html = sys.argv[argindex + 1]
             argindex += 1
+        elif sys.argv[argindex] == '-k':
+            what_if = sys.argv[argindex + 1].split(",")
+            if len(what_if) != 3 or what_if[2] not in LOCATION_CODES:
+                print("what if game should look like winner,loser,H/A/N")
+                sys.exit()
+            argindex += 1
         elif sys.argv[argindex] == '-x':
             tournament_selected = True
+        elif sys.argv[argindex] == '-z':
+            monte_carlo = True
+            tournament_selected = True
+            exact_points = int(sys.argv[argindex + 1])
+            argindex += 1
+        elif sys.argv[argindex] == '-j':
+            simulation_jobs = int(sys.argv[argindex + 1])
+            argindex += 1
+        elif sys.argv[argindex] == '--seed':
+            simulation_seed = int(sys.argv[argindex + 1])
+            argindex += 1
         elif sys.argv[argindex] == '-y':
             if int(sys.argv[argindex + 1]) < 2021:
                 print("year not supported, sorry. Try 2021-present.")
@@ -755,6 +926,9 @@ def process_args():
             year = sys.argv[argindex + 1]
             argindex += 1
         argindex += 1
+    if what_if and (monte_carlo or tracker):
+        print("what if only works on a single bracket, not with -c, -z, or -t")
+        sys.exit()
     if mens:
         datadir = "data/men/" + year + "/resumes/"
     else:
@@ -766,7 +940,8 @@ def process_args():
             weightfile = "lib/women/weights.txt"
     return year, mens, outputfile, resumefile, webfile, resumewebfile, upcomingschedulefile, \
             datadir, should_scrape, force_scrape, verbose, tracker, weightfile, future, \
-            monte_carlo, mc_outputfile, simulations, mc_output_html, tournament_selected
+            monte_carlo, mc_outputfile, simulations, simulation_jobs, simulation_seed, mc_output_html, \
+            tournament_selected, exact_points, scrape_workers, scrape_rate, incremental_scrape, what_if
 
 def add_or_increment_key(key, dictionary):
     try:
@@ -781,14 +956,13 @@ def reverse_location(location):
         return "A"
     return "N"
 
-def simulate_one_tournament_game(team1, team2, team_kenpoms, scorer, results):
+def simulate_one_tournament_game(team1, team2, team_kenpoms, scorer, results, rng):
     if "/" in team2:
-        team2 = simulate_one_tournament_game(team2.split("/")[0], team2.split("/")[1], team_kenpoms, scorer, results)
+        team2 = simulate_one_tournament_game(team2.split("/")[0], team2.split("/")[1], team_kenpoms, scorer, results, rng)
         results['teams'][team2]['ncaa_round'] = 1
     win_prob = scorer.get_win_prob(team_kenpoms[team1]["rating"], team_kenpoms[team2]["rating"], 'N')
     #print(round(win_prob*100, 2), end="% ")
-    win_result = random.random()
-    kenpom_change = random.random()
+    win_result = rng.random()
     if win_result < win_prob:
         winner = team1
         #print(team1, "over", team2)
@@ -797,12 +971,12 @@ def simulate_one_tournament_game(team1, team2, team_kenpoms, scorer, results):
         #print(team2, "over", team1)
     return winner
 
-def simulate_tournament(builder, team_kenpoms, scorer, results=dict()):
+def simulate_tournament(builder, team_kenpoms, scorer, rng, results=dict()):
     winners = list()
     for region_num in [0, 3, 1, 2]:
         for seed in [1, 8, 5, 4, 6, 3, 7, 2]:
-            team_1 = builder.regions[region_num][seed]
-            team_2 = builder.regions[region_num][17 - seed]
+            team_1 = builder.state.grid[region_num][seed]
+            team_2 = builder.state.grid[region_num][17 - seed]
             results['teams'][team_1]['ncaa_seed'] = seed
             results['teams'][team_1]['ncaa_round'] = 1
             try:
@@ -815,13 +989,13 @@ def simulate_tournament(builder, team_kenpoms, scorer, results=dict()):
                 results['teams'][team_2.split("/")[1]]['ncaa_round'] = 0
             #if "/" not in team_1 and "/" not in team_2:
                 #print(seed, team_1, team_kenpoms[team_1], 'vs.', 17-seed, team_2, team_kenpoms[team_2], end=": ")
-            winners.append(simulate_one_tournament_game(team_1, team_2, team_kenpoms, scorer, results))
+            winners.append(simulate_one_tournament_game(team_1, team_2, team_kenpoms, scorer, results, rng))
             results['teams'][winners[-1]]['ncaa_round'] = 2
             #print(winners[-1])
     index = 0
     while index + 1 < len(winners):
         #print(winners[index], team_kenpoms[winners[index]], 'vs.', winners[index + 1], team_kenpoms[winners[index + 1]], end=": ")
-        winners.append(simulate_one_tournament_game(winners[index], winners[index + 1], team_kenpoms, scorer, results))
+        winners.append(simulate_one_tournament_game(winners[index], winners[index + 1], team_kenpoms, scorer, results, rng))
         if len(winners) == 63:
             results['teams'][winners[-1]]['ncaa_round'] = 7
         elif len(winners) >= 61:
@@ -836,28 +1010,84 @@ def simulate_tournament(builder, team_kenpoms, scorer, results=dict()):
         index += 2
     return winners
 
-def record_vs_range(team, group):
-    wins = 0
-    losses = 0
-    for game in team.games:
-        if game.opponent in group:
-            if game.win:
-                wins += 1
-            else:
-                losses += 1
-    try:
-        return wins/(wins + losses)
-    except ZeroDivisionError: # shouldn't happen, but need it while data isn't perfect
-        return 0
-
-def break_tie(teams, win_dict, scorer, simmed_kenpoms):
+#simulate many tournaments at once over a fixed bracket
+#param slots: the 64 first round slots, top to bottom in region order 0, 3, 1, 2. each is a list of one team id, or two for a play-in
+#param ratings: simulated ratings, one row per simulation and one column per team id
+#param rng: numpy Generator to draw results from
+#returns: list of arrays of the team ids left in each round, from the first round (64 per simulation) to the champion (1)
+def simulate_tournaments(slots, ratings, scorer, rng):
+    num_sims = len(ratings)
+    sims = numpy.arange(num_sims)[:, numpy.newaxis]
+    alive = numpy.empty((num_sims, len(slots)), dtype=int)
+    for slot, teams in enumerate(slots):
+        if len(teams) == 1:
+            alive[:, slot] = teams[0]
+        else:   #play-in game
+            win_probs = scorer.get_win_probs(ratings[:, teams[0]], ratings[:, teams[1]], LOCATION_CODES["N"])
+            alive[:, slot] = numpy.where(rng.random(num_sims) < win_probs, teams[0], teams[1])
+    rounds = [alive]
+    while alive.shape[1] > 1:
+        team_1 = alive[:, 0::2]
+        team_2 = alive[:, 1::2]
+        win_probs = scorer.get_win_probs(ratings[sims, team_1], ratings[sims, team_2], LOCATION_CODES["N"])
+        alive = numpy.where(rng.random(team_1.shape) < win_probs, team_1, team_2)
+        rounds.append(alive)
+    return rounds
+
+#work out every team's exact odds of reaching each round of a fixed bracket, instead of sampling them
+#each game's win probability is averaged over the rating uncertainty on its own, whereas a simulation keeps one draw of a
+#team's rating for the whole tournament
+#param slots: the 64 first round slots, as in simulate_tournaments
+#param base_ratings: each team's rating, by team id
+#param points: number of Gauss-Hermite points to average each win probability over the N(rating, 0.8) draws the
+#   simulations use. 1 to take the ratings as they are
+#returns: list of arrays of each team's probability of reaching each round, from the first round to the championship
+def get_exact_tournament_odds(slots, base_ratings, points, scorer):
+    nodes, node_weights = numpy.polynomial.hermite_e.hermegauss(points)
+    #the gap between two teams' drawn ratings is N(gap, 0.8*sqrt(2)), so one dimension of quadrature covers it
+    team_ratings = base_ratings[:, numpy.newaxis, numpy.newaxis] + 0.8*math.sqrt(2)*nodes
+    opp_ratings = base_ratings[numpy.newaxis, :, numpy.newaxis]
+    win_probs = scorer.get_win_probs(team_ratings, opp_ratings, LOCATION_CODES["N"]) @ node_weights/math.sqrt(2*math.pi)
+
+    slot_of_team = numpy.zeros(len(base_ratings), dtype=int)
+    reach = numpy.zeros(len(base_ratings))
+    for slot, teams in enumerate(slots):
+        slot_of_team[teams] = slot
+        if len(teams) == 1:
+            reach[teams[0]] = 1
+        else:   #play-in game
+            reach[teams[0]] = win_probs[teams[0], teams[1]]
+            reach[teams[1]] = 1 - win_probs[teams[0], teams[1]]
+    #the team in the higher slot is the one whose win probability decides the game, same as in the simulations
+    win_probs = numpy.where(slot_of_team[:, numpy.newaxis] < slot_of_team[numpy.newaxis, :], win_probs, 1 - win_probs.T)
+    round_odds = [reach]
+    for round_num in range(6):
+        #a team's possible opponents are the ones in the other half of its group of slots
+        groups = slot_of_team >> round_num
+        opponents = groups[numpy.newaxis, :] == (groups ^ 1)[:, numpy.newaxis]
+        reach = reach*((opponents*win_probs) @ reach)
+        round_odds.append(reach)
+    return round_odds
+
+#each team's winning percentage against a group of teams
+#param head_to_head: the conference's wins and losses arrays, row team against column team, from get_head_to_head
+#param teams: teams to get a percentage for, with their conference "index"
+#param group: teams to count games against, with their conference "index"
+#returns: list of winning percentages, in the same order as teams
+def record_vs_range(head_to_head, teams, group):
+    team_indices = [team["index"] for team in teams]
+    group_indices = [team["index"] for team in group]
+    wins = head_to_head[0][numpy.ix_(team_indices, group_indices)].sum(axis=1)
+    losses = head_to_head[1][numpy.ix_(team_indices, group_indices)].sum(axis=1)
+    #0 for a team who hasn't played the group. shouldn't happen, but need it while data isn't perfect
+    return numpy.where(wins + losses > 0, wins/numpy.maximum(wins + losses, 1), 0).tolist()
+
+#param head_to_head: the conference's head-to-head wins and losses, from get_head_to_head
+def break_tie(teams, win_dict, head_to_head, scorer, simmed_kenpoms):
     return_order = list()
 
-    tied_teams = [x["name"] for x in teams]
-
     #try head-to-head tiebreaker first
-    for team in teams:
-        win_pct = record_vs_range(scorer.teams[team["name"]], [x["name"] for x in teams])
+    for team, win_pct in zip(teams, record_vs_range(head_to_head, teams, teams)):
         team["tiebreaker_record"] = win_pct
     win_pcts = sorted([team["tiebreaker_record"] for team in teams], reverse=True)
     sorted_teams = sorted(teams, key = lambda x: x["tiebreaker_record"], reverse=True)
@@ -867,13 +1097,12 @@ def break_tie(teams, win_dict, scorer, simmed_kenpoms):
     if len(win_pcts) == 1:
         return_order.append(sorted_teams[0])
     elif len(win_pcts) != len(teams):
-        return_order += break_tie(sorted_teams, win_dict, scorer, simmed_kenpoms)
+        return_order += break_tie(sorted_teams, win_dict, head_to_head, scorer, simmed_kenpoms)
         sorted_teams = list()
     else:
         teams_needing_tiebreak = sorted_teams
         for win_amount in sorted(win_dict.keys(), reverse=True):
-            for team in sorted_teams:
-                win_pct = record_vs_range(scorer.teams[team["name"]], [x["name"] for x in win_dict[win_amount]])
+            for team, win_pct in zip(sorted_teams, record_vs_range(head_to_head, sorted_teams, win_dict[win_amount])):
                 team["tiebreaker_record"] = win_pct
                 
             win_pcts = sorted([team["tiebreaker_record"] for team in sorted_teams], reverse=True)
@@ -885,104 +1114,25 @@ def break_tie(teams, win_dict, scorer, simmed_kenpoms):
                 return_order.append(sorted_teams[0])
                 break
             elif len(win_pcts) != len(teams_needing_tiebreak):
-                return_order += break_tie(sorted_teams, win_dict, scorer, simmed_kenpoms)
+                return_order += break_tie(sorted_teams, win_dict, head_to_head, scorer, simmed_kenpoms)
                 sorted_teams = list()
                 break
             else:
                 continue
     if len(sorted_teams) > 1: #recursed all the way down the seed list, no way to break tie
-        sorted_teams.sort(key=lambda x: scorer.get_NET_estimate(scorer.teams[x["name"]].NET, simmed_kenpoms[x["name"]]["rank"]), reverse=True)
+        season_days, days_left = scorer.get_season_progress()
+        sorted_teams.sort(key=lambda x: scorer.get_NET_estimate(scorer.teams[x["name"]].NET, simmed_kenpoms[x["name"]]["rank"], \
+                season_days, days_left))
         return_order += sorted_teams
     return return_order
 
-SET_BRACKETS = {
-        "ACC": ["Duke", "Virginia", "Miami-FL", "North-Carolina", "Clemson", "Louisville", "North-Carolina-State", "Florida-State", "California", "Stanford", "SMU", "Virginia-Tech", "Wake-Forest", "Syracuse", "Pittsburgh"],
-        "America East": ["UMBC", "Vermont", "NJIT", "UMass-Lowell", "Albany", "Maine", "Bryant", "New-Hampshire"],
-        "American": ["South-Florida", "Wichita-State", "Tulsa", "UAB", "Charlotte", "North-Texas", "FAU", "Memphis", "Tulane", "Temple"],
-        "ASUN": ["Central-Arkansas", "Austin-Peay", "Queens", "Lipscomb", "FGCU", "West-Georgia", "Eastern-Kentucky", "Bellarmine", "Jacksonville", "Stetson", "North-Florida", "North-Alabama"],
-        "Atlantic 10": ["Saint-Louis", "VCU", "Saint-Josephs", "Dayton", "George-Mason", "Davidson", "Duquesne", "Fordham", "George-Washington", "Rhode-Island", "Richmond", "La-Salle", "Saint-Bonaventure", "Loyola-Chicago"],
-        "Big 12": ["Arizona", "Houston", "Kansas", "Texas-Tech", "Iowa-State", "TCU", "West-Virginia", "UCF", "Cincinnati", "BYU", "Colorado", "Arizona-State", "Baylor", "Oklahoma-State", "Kansas-State", "Utah"],
-        "Big East": ["Saint-Johns", "Connecticut", "Villanova", "Seton-Hall", "Creighton", "DePaul", "Marquette", "Butler", "Providence", "Xavier", "Georgetown"],
-        "Big Sky": ["Portland-State", "Montana-State", "Eastern-Washington", "Montana", "Northern-Colorado", "Weber-State", "Idaho", "Sacramento-State", "Idaho-State", "Northern-Arizona"],
-        "Big South": ["High-Point", "Winthrop", "Radford", "UNC-Asheville", "Longwood", "Presbyterian-College", "Charleston-Southern", "South-Carolina-Upstate", "Gardner-Webb"],
-        "Big Ten": ["Michigan", "Nebraska", "Michigan-State", "Illinois", "Wisconsin", "UCLA", "Purdue", "Ohio-State", "Iowa", "Indiana", "Minnesota", "Washington", "USC", "Rutgers", "Northwestern", "Oregon", "Maryland", "Penn-State"],
-        "Big West": ["UC-Irvine", "Hawaii", "Cal-State-Fullerton", "Cal-State-Northridge", "UC-San-Diego", "UC-Davis", "UC-Santa-Barbara", "Cal-Poly"],
-        "Coastal Athletic": ["UNCW", "Charleston", "Hofstra", "Monmouth", "Drexel", "William-Mary", "Towson", "Stony-Brook", "Campbell", "Hampton", "Elon", "North-Carolina-AT", "Northeastern"],
-        "Conference USA": ["Liberty", "Sam-Houston-State", "Western-Kentucky", "Louisiana-Tech", "Middle-Tennessee", "Kennesaw-State", "Jacksonville-State", "FIU", "Missouri-State", "New-Mexico-State"],
-        "Horizon League": ["Wright-State", "Robert-Morris", "Detroit", "Oakland", "Green-Bay", "Purdue-Fort-Wayne", "Northern-Kentucky", "Milwaukee", "Youngstown-State", "Cleveland-State", "IU-Indianapolis"],
-        "Ivy League": ["Yale", "Harvard", "Penn", "Cornell"],
-        "MAAC": ["Merrimack", "Saint-Peters", "Siena", "Quinnipiac", "Marist", "Mount-Saint-Marys", "Fairfield", "Iona", "Sacred-Heart", "Manhattan"],
-        "MEAC": ["Howard", "Morgan-State", "North-Carolina-Central", "Norfolk-State", "South-Carolina-State", "Maryland-Eastern-Shore", "Delaware-State"],
-        "Mid-American": ["Miami-OH", "Akron", "Kent-State", "Toledo", "Bowling-Green", "Ohio", "Buffalo", "UMass"],
-        "Missouri Valley": ["Belmont", "Bradley", "Illinois-State", "Murray-State", "UIC", "Northern-Iowa", "Valparaiso", "Southern-Illinois", "Drake", "Indiana-State", "Evansville"],
-        "Mountain West": ["Utah-State", "San-Diego-State", "New-Mexico", "Grand-Canyon", "Nevada", "Boise-State", "Colorado-State", "UNLV", "Wyoming", "Fresno-State", "San-Jose-State", "Air-Force"],
-        "NEC": ["Long-Island", "Central-Connecticut", "Mercyhurst", "Le-Moyne", "Stonehill", "Fairleigh-Dickinson", "Wagner", "Chicago-State"],
-        "Ohio Valley": ["Tennessee-State", "Morehead-State", "Southeast-Missouri", "Tennessee-Martin", "SIUE", "Lindenwood", "Little-Rock", "Eastern-Illinois"],
-        "Patriot League": ["Navy", "Lehigh", "Colgate", "Boston-University", "American", "Loyola-Maryland", "Lafayette", "Bucknell", "Army", "Holy-Cross"],
-        "SEC": ["Florida", "Alabama", "Arkansas", "Vanderbilt", "Tennessee", "Texas-AM", "Georgia", "Missouri", "Kentucky", "Texas", "Oklahoma", "Auburn", "Mississippi-State", "South-Carolina", "Ole-Miss", "LSU"],
-        "Southern": ["East-Tennessee-State", "Wofford", "Samford", "Mercer", "Western-Carolina", "Furman", "UNCG", "Chattanooga", "The-Citadel", "VMI"],
-        "Southland": ["Stephen-F-Austin", "McNeese", "UTRGV", "Texas-AM-Corpus-Christi", "New-Orleans", "Nicholls", "Northwestern-State", "Houston-Christian"],
-        "Sun Belt": ["Troy", "Marshall", "Coastal-Carolina", "Appalachian-State", "Texas-State", "South-Alabama", "Arkansas-State", "Southern-Miss", "James-Madison", "Georgia-Southern", "Old-Dominion", "Louisiana", "Georgia-State", "ULM"],
-        "SWAC": ["Bethune-Cookman", "Florida-AM", "Southern", "Texas-Southern", "Alabama-AM", "Arkansas-Pine-Bluff", "Jackson-State", "Prairie-View-AM", "Grambling-State", "Alabama-State", "Alcorn-State", "Mississippi-Valley-State"],
-        "The Summit League": ["North-Dakota-State", "Saint-Thomas", "North-Dakota", "South-Dakota", "Omaha", "Denver", "South-Dakota-State", "Oral-Roberts", "UMKC"],
-        "West Coast": ["Gonzaga", "Saint-Marys-College", "Santa-Clara", "Oregon-State", "San-Francisco", "Pacific", "Seattle-University", "Washington-State", "Portland", "Loyola-Marymount", "San-Diego", "Pepperdine"],
-        "Western Athletic": ["Utah-Valley", "California-Baptist", "Utah-Tech", "UTA", "Southern-Utah", "Abilene-Christian", "Tarleton-State"]
-    }
-
-SET_BRACKETS_W = {
-        "ACC": ["Duke", "Louisville", "North-Carolina", "North-Carolina-State", "Notre-Dame", "Virginia-Tech", "Syracuse", "Virginia", "Clemson", "California", "Georgia-Tech", "Miami-FL", "Stanford", "Florida-State", "Wake-Forest"],
-        "America East": ["Vermont", "Maine", "Binghamton", "UMBC", "NJIT", "Bryant", "New-Hampshire", "Albany"],
-        "American": ["Rice", "East-Carolina", "South-Florida", "Tulsa", "North-Texas", "UTSA", "Temple", "Charlotte", "FAU", "Tulane"],
-        "ASUN": ["Eastern-Kentucky", "Jacksonville", "Central-Arkansas", "Stetson", "FGCU", "North-Alabama", "West-Georgia", "Austin-Peay", "Lipscomb", "North-Florida", "Queens", "Bellarmine"],
-        "Atlantic 10": ["Rhode-Island", "George-Mason", "Richmond", "Davidson", "Saint-Josephs", "La-Salle", "Dayton", "Loyola-Chicago", "Saint-Bonaventure", "George-Washington", "Saint-Louis", "Duquesne", "VCU", "Fordham"],
-        "Big 12": ["TCU", "West-Virginia", "Baylor", "Oklahoma-State", "Texas-Tech", "Colorado", "Iowa-State", "Utah", "BYU", "Arizona-State", "Kansas", "Kansas-State", "Cincinnati", "UCF", "Arizona", "Houston"],
-        "Big East": ["Connecticut", "Villanova", "Seton-Hall", "Marquette", "Creighton", "Saint-Johns", "Providence", "Butler", "Georgetown", "DePaul", "Xavier"],
-        "Big Sky": ["Idaho", "Montana-State", "Northern-Colorado", "Idaho-State", "Sacramento-State", "Eastern-Washington", "Northern-Arizona", "Montana", "Weber-State", "Portland-State"],
-        "Big South": ["High-Point", "Radford", "Longwood", "Gardner-Webb", "Winthrop", "UNC-Asheville", "Charleston-Southern", "South-Carolina-Upstate", "Presbyterian-College"],
-        "Big Ten": ["UCLA", "Iowa", "Michigan", "Minnesota", "Ohio-State", "Maryland", "Michigan-State", "Washington", "USC", "Illinois", "Oregon", "Nebraska", "Indiana", "Purdue", "Wisconsin"],
-        "Big West": ["UC-Irvine", "UC-San-Diego", "UC-Davis", "Hawaii", "Cal-State-Fullerton", "UC-Santa-Barbara", "UC-Riverside", "Cal-State-Northridge"],
-        "Coastal Athletic": ["Charleston", "Campbell", "Drexel", "Stony-Brook", "Monmouth", "Elon", "Towson", "William-Mary", "North-Carolina-AT", "Hofstra", "Hampton", "Northeastern", "UNCW" ],
-        "Conference USA": ["Louisiana-Tech", "FIU", "Middle-Tennessee", "Sam-Houston-State", "Liberty", "Missouri-State", "Jacksonville-State", "Delaware", "Kennesaw-State", "UTEP"],
-        "Horizon League": ["Green-Bay", "Youngstown-State", "Cleveland-State", "Northern-Kentucky", "Purdue-Fort-Wayne", "Robert-Morris", "IU-Indianapolis", "Oakland", "Wright-State", "Milwaukee", "Detroit"],
-        "Ivy League": ["Princeton", "Columbia", "Harvard", "Brown"],
-        "MAAC": ["Quinnipiac", "Fairfield", "Merrimack", "Iona", "Siena", "Mount-Saint-Marys", "Sacred-Heart", "Manhattan", "Marist", "Saint-Peters"],
-        "MEAC": ["Howard", "Maryland-Eastern-Shore", "Norfolk-State", "Coppin-State", "North-Carolina-Central", "Morgan-State", "Delaware-State", "South-Carolina-State"],
-        "Mid-American": ["Miami-OH", "Ball-State", "UMass", "Central-Michigan", "Ohio", "Toledo", "Bowling-Green", "Kent-State"],
-        "Missouri Valley": ["Murray-State", "Belmont", "Illinois-State", "Northern-Iowa", "Bradley", "Drake", "UIC", "Southern-Illinois", "Indiana-State", "Evansville", "Valparaiso"],
-        "Mountain West": ["San-Diego-State", "UNLV", "Colorado-State", "New-Mexico", "Boise-State", "Grand-Canyon", "Fresno-State", "Wyoming", "Air-Force", "Nevada", "Utah-State", "San-Jose-State"],
-        "NEC": ["Fairleigh-Dickinson", "Mercyhurst", "Long-Island", "Wagner", "Le-Moyne", "Chicago-State", "Stonehill", "Saint-Francis-PA"],
-        "Ohio Valley": ["Western-Illinois", "Lindenwood", "Southern-Indiana", "Morehead-State", "Little-Rock", "Tennessee-Martin", "SIUE", "Southeast-Missouri"],
-        "Patriot League": ["Navy", "Holy-Cross", "Army", "Lehigh", "Loyola-Maryland", "Lafayette", "Bucknell", "Boston-University", "American", "Colgate"],
-        "SEC": ["South-Carolina", "Vanderbilt", "Texas", "LSU", "Oklahoma", "Tennessee", "Ole-Miss", "Georgia", "Kentucky", "Texas-AM", "Alabama", "Florida", "Mississippi-State", "Missouri", "Auburn", "Arkansas"],
-        "Southern": ["Chattanooga", "East-Tennessee-State", "Wofford", "Furman", "Mercer", "Samford", "UNCG", "Western-Carolina"],
-        "Southland": ["McNeese", "Lamar", "Stephen-F-Austin", "UTRGV", "Northwestern-State", "Incarnate-Word", "Nicholls", "East-Texas-AM"],
-        "Sun Belt": ["Georgia-Southern", "Troy", "Arkansas-State", "James-Madison", "Marshall", "Old-Dominion", "Southern-Miss", "Texas-State", "Coastal-Carolina", "ULM", "Georgia-State", "South-Alabama", "Appalachian-State", "Louisiana" ],
-        "SWAC": ["Alabama-AM", "Alcorn-State", "Alabama-State", "Southern", "Jackson-State", "Grambling-State", "Arkansas-Pine-Bluff", "Florida-AM", "Mississippi-Valley-State", "Texas-Southern", "Bethune-Cookman", "Prairie-View-AM"],
-        "The Summit League": ["North-Dakota-State", "South-Dakota-State", "South-Dakota", "Oral-Roberts", "Saint-Thomas", "Denver", "UMKC", "Omaha", "North-Dakota"],
-        "West Coast": ["Loyola-Marymount", "Gonzaga", "Santa-Clara", "Oregon-State", "Portland", "Pepperdine", "San-Francisco", "Pacific", "Washington-State", "Saint-Marys-College", "San-Diego", "Seattle-University"],
-        "Western Athletic": ["California-Baptist", "Abilene-Christian", "Southern-Utah", "Utah-Valley", "Tarleton-State", "UTA", "Utah-Tech"]
-}
-
+#param set_bracket: dict of team: position in the conference's announced bracket, or None if it isn't set yet
+#param head_to_head: the conference's head-to-head wins and losses, from get_head_to_head
+def get_seeds(set_bracket, teams, head_to_head, scorer, simmed_kenpoms):
+    if set_bracket is not None:
+        return sorted([team for team in teams if team["name"] in set_bracket], key=lambda x: set_bracket[x["name"]])
 
-def get_seeds(mens, conference, teams, scorer, simmed_kenpoms):
     seed_list = list()
-    if mens:
-        if conference in SET_BRACKETS:
-            for bracket_team in SET_BRACKETS[conference]:
-                for team in teams:
-                    if bracket_team == team["name"]:
-                        seed_list.append(team)
-                        continue
-            return seed_list
-    else:
-        if conference in SET_BRACKETS_W:
-            for bracket_team in SET_BRACKETS_W[conference]:
-                for team in teams:
-                    if bracket_team == team["name"]:
-                        seed_list.append(team)
-                        continue
-            return seed_list
-        
     win_dict = dict()
     for team in teams:
         if team["conference_wins"] in win_dict:
@@ -993,7 +1143,7 @@ def get_seeds(mens, conference, teams, scorer, simmed_kenpoms):
         if len(win_dict[win_amount]) == 1:
             seed_list.append(win_dict[win_amount][0])
         else:
-            broken_tie_order = break_tie(win_dict[win_amount], win_dict, scorer, simmed_kenpoms)
+            broken_tie_order = break_tie(win_dict[win_amount], win_dict, head_to_head, scorer, simmed_kenpoms)
             for team in broken_tie_order:
                 seed_list.append(team)
     return seed_list
@@ -1066,237 +1216,127 @@ BRACKET_RESULTS_W = {
         "Western Athletic": {0: ["UTA"], 1: ["Tarleton-State", "UTA"], 2: ["California-Baptist", "Abilene-Christian"], 3: ["California-Baptist"]}
 }
 
-def simulate_conference_tournaments(scorer, builder, simmed_kenpoms, results):
-    conference_teams = dict()
-    if builder.mens:
-        bracket_results = BRACKET_RESULTS
-        with open("lib/ctourn_formats.json", "r") as f:
-            formats = json.loads(f.read())
+#load the conference tournament brackets that have already been announced for a year
+#returns: dict of conference: list of teams in seed order, empty if there's no set_brackets.json for the year
+def load_set_brackets(mens, year):
+    if mens:
+        set_brackets_file = "lib/men/" + year + "/set_brackets.json"
     else:
-        bracket_results = BRACKET_RESULTS_W
-        with open("lib/ctourn_formatsw.json", "r") as f:
+        set_brackets_file = "lib/women/" + year + "/set_brackets.json"
+    if not os.path.exists(set_brackets_file):
+        return dict()
+    with open(set_brackets_file, "r") as f:
+        return json.loads(f.read())
+
+#read every conference's tournament format and set bracket the first time a simulation needs them, and keep the brackets for
+#the rest of the run
+#returns: dict of conference: ConferenceTournament
+def get_conference_tournaments(mens, year):
+    if (mens, year) not in conference_tournaments:
+        if mens:
+            bracket_results = BRACKET_RESULTS
+            formats_file = "lib/ctourn_formats.json"
+        else:
+            bracket_results = BRACKET_RESULTS_W
+            formats_file = "lib/ctourn_formatsw.json"
+        with open(formats_file, "r") as f:
             formats = json.loads(f.read())
-    for conference in builder.conference_winners:
+        set_brackets = load_set_brackets(mens, year)
+        conference_tournaments[(mens, year)] = dict()
+        for conference in formats:
+            conference_tournaments[(mens, year)][conference] = ConferenceTournament(formats[conference]["format"], \
+                    formats[conference]["ineligible_winners"], bracket_results.get(conference, dict()), set_brackets.get(conference))
+    return conference_tournaments[(mens, year)]
+
+def simulate_conference_tournaments(scorer, builder, simmed_kenpoms, results, rng):
+    conference_teams = dict()
+    tournaments = get_conference_tournaments(builder.mens, builder.year)
+    for conference in builder.state.conference_winners:
         conference_teams[conference] = list()
     for team in scorer.teams:
         conference_teams[scorer.teams[team].conference].append(
                 {"name": team,
+                 "index": len(conference_teams[scorer.teams[team].conference]),
                  "conference_wins": scorer.teams[team].conference_wins,
                  "conference_losses": scorer.teams[team].conference_losses}
                 )
+    #built once for the whole league, then cut down to each conference for its tiebreakers
+    store = scorer.game_store
+    head_to_head_wins, head_to_head_losses = store.get_head_to_head()
     conf_reg_winners = dict()
     for conference in conference_teams:
-        #BUILD BRACKET FORMAT
-        tourn_format = formats[conference]["format"]
-        ineligible_teams = formats[conference]["ineligible_winners"]
-        reseed = tourn_format[0] == "R"
-        if tourn_format[0] == "R":
-            tourn_format = tourn_format[1:]
-        rounds = []
-        while tourn_format:
-            rounds.append(tourn_format[0:2])
-            tourn_format = tourn_format[2:]
-        num_teams = 1
-        for rnd in reversed(rounds):
-            matchups = []
-            if rnd[0] == "T":
-                cur_round_teams = 10
-            else:
-                cur_round_teams = int(rnd[0])
-            if cur_round_teams == num_teams * 2:
-                num_teams *= 2
-                if not reseed:
-                    higher_seed = 1
-                    lower_seed = num_teams
-                    for _ in range(cur_round_teams//2):
-                        matchups.append([higher_seed, lower_seed])
-                        higher_seed += 1
-                        lower_seed -= 1
-            else:
-                num_teams += cur_round_teams//2
-                if not reseed:
-                    higher_seed = num_teams - (cur_round_teams - 1)
-                    lower_seed = num_teams
-                    for _ in range(cur_round_teams//2):
-                        matchups.append([higher_seed, lower_seed])
-                        higher_seed += 1
-                        lower_seed -= 1
+        tournament = tournaments[conference]
+        team_ids = [store.team_ids[team["name"]] for team in conference_teams[conference]]
+        head_to_head = (head_to_head_wins[numpy.ix_(team_ids, team_ids)], head_to_head_losses[numpy.ix_(team_ids, team_ids)])
 
         #SET UP BRACKET WITH TEAMS
         seeds = []
         
-        seeded_teams = get_seeds(builder.mens, conference, conference_teams[conference], scorer, simmed_kenpoms)
+        seeded_teams = get_seeds(tournament.set_bracket, conference_teams[conference], head_to_head, scorer, simmed_kenpoms)
         # Uncomment below to test for missing/extra games, etc
         #print(conference)
         for index, team in enumerate(seeded_teams):
             results['teams'][team["name"]]["conference_seed"] = index + 1
             results['teams'][team["name"]]["conference_wins"] = team["conference_wins"]
             results['teams'][team["name"]]["conference_losses"] = team["conference_losses"]
-            if len(seeds) < num_teams:
+            if len(seeds) < tournament.num_teams:
                 seeds.append(team["name"])
             #print(team["name"], "(" + str(team["conference_wins"]) + "-" + str(team["conference_losses"]) + ")")
         #print()
         conf_reg_winners[conference] = seeds[0]
-        seed_to_team = dict()
-        for index, team in enumerate(seeds):
-            seed_to_team[index + 1] = team
-        seeds_to_use = list(seeds)
-        previous_winners = []
-        num_eliminated_teams = 0
-        for round_index, rnd in enumerate(rounds):
-            if rnd[0] == "T":
-                cur_round_teams = 10
-            else:
-                cur_round_teams = int(rnd[0])
-            round_location = rnd[1]
-            higher_seed = num_teams - (cur_round_teams - 1) - num_eliminated_teams
-            lower_seed = num_teams - num_eliminated_teams
-            matchups = []
-            for _ in range(cur_round_teams//2):
-                if reseed:
-                    matchups.append([seeds_to_use[higher_seed-1], seeds_to_use[lower_seed-1]])
-                else:
-                    matchups.append([seed_to_team[higher_seed], seed_to_team[lower_seed]])
-                higher_seed += 1
-                lower_seed -= 1
-            higher_seed = num_teams - (cur_round_teams - 1) - num_eliminated_teams
-            lower_seed = num_teams - num_eliminated_teams
-            #print(matchups)
-            for matchup in matchups:
-                if conference in bracket_results:
-                    if round_index in bracket_results[conference]:
-                        if matchup[0] in bracket_results[conference][round_index]:
-                            if reseed:
-                                seeds_to_use.remove(matchup[1])
-                            num_eliminated_teams += 1
-                            higher_seed += 1
-                            lower_seed -= 1
-                            continue
-                        elif matchup[1] in bracket_results[conference][round_index]:
-                            if reseed:
-                                seeds_to_use.remove(matchup[0])
-                            else:
-                                seed_to_team[higher_seed] = matchup[1]
-                            num_eliminated_teams += 1
-                            higher_seed += 1
-                            lower_seed -= 1
-                            continue
-                win_prob = scorer.get_win_prob(simmed_kenpoms[matchup[0]]["rating"], simmed_kenpoms[matchup[1]]["rating"], round_location)
-                win_result = random.random()
-                if reseed:
-                    if win_result < win_prob:
-                        seeds_to_use.remove(matchup[1])
-                    else:
-                        seeds_to_use.remove(matchup[0])
-                else:
-                    if win_result >= win_prob:
-                        seed_to_team[higher_seed] = matchup[1]
-                num_eliminated_teams += 1
-                higher_seed += 1
-                lower_seed -= 1
-        if reseed:
-            #print(seeds_to_use[0])
-            if len(seeds_to_use) == 1:
-                if seeds_to_use[0] not in ineligible_teams:
-                    builder.conference_winners[conference] = seeds_to_use[0]
-                else:
-                    index = 0
-                    while seeds[index] in ineligible_teams:
-                        index += 1
-                    builder.conference_winners[conference] = seeds[index]
-            else:
-                print("wuh oh")
-                sys.exit()
-        else:
-            #print(seed_to_team[1])
-            if seed_to_team[1] not in ineligible_teams:
-                builder.conference_winners[conference] = seed_to_team[1]
-            else:
-                index = 0
-                while seeds[index] in ineligible_teams:
-                    index += 1
-                builder.conference_winners[conference] = seeds[index]
-        results['teams'][builder.conference_winners[conference]]["ctourn_winner"] = True
+        auto_bid_odds = tournament.get_auto_bid_odds(seeds, simmed_kenpoms, scorer)
+        for team in auto_bid_odds:
+            results['teams'][team]["auto_bid_odds"] = auto_bid_odds[team]
+        builder.state.conference_winners[conference] = tournament.simulate(seeds, simmed_kenpoms, scorer, rng)
+        results['teams'][builder.state.conference_winners[conference]]["ctourn_winner"] = True
     return conf_reg_winners
 
+#simulate the rest of the regular season for a block of simulations at once
+#param ratings: simulated ratings, one row per simulation and one column per team id
+#param rngs: numpy Generator for each simulation
+#returns: boolean array with one row per simulation and one column per matchup, true if the matchup's first team won
+def simulate_regular_seasons(scorer, ratings, rngs):
+    store = scorer.game_store
+    win_probs = scorer.get_win_probs(ratings[:, store.matchup_team], ratings[:, store.matchup_opponent], store.matchup_location)
+    draws = numpy.array([rng.random(len(store.matchup_row)) for rng in rngs])
+    return draws < win_probs
+
 #run one simulation of the rest of the college basketball season
-def simulate_games(scorer, builder, weights, simmed_kenpoms):
+#param regular_season: this simulation's row of simulate_regular_seasons
+#param records: this simulation's rows of GameStore.get_simulated_records
+def simulate_games(scorer, builder, weights, simmed_kenpoms, rng, regular_season, records):
     results = {'tournament': list(), 'final_four': list(), 'champion': list(), 'conference': dict(), 'teams': dict()}
-    for conference in builder.conference_winners:
+    for conference in builder.state.conference_winners:
         results['conference'][conference] = list()
-    teams = list(scorer.teams.keys())
-    random.shuffle(teams)
-    for team in teams:
-        team_kenpom = simmed_kenpoms[team]
-        for game in scorer.teams[team].games:
-            if game.date == "10-10":   #previously simulated game
-                continue
-            opponent = game.opponent
-            if game.conference_game:
-                if game.win:
-                    scorer.teams[team].conference_wins += 1
-                else:
-                    scorer.teams[team].conference_losses += 1
-        for game in scorer.teams[team].future_games:
-            game_exists = False
-            for existing_game in scorer.teams[team].games:
-                if existing_game.date != "10-10":   #previously simulated game
-                    break
-                if existing_game.opponent == game['opponent'] and \
-                        existing_game.location == game['location']:
-                    game_exists = True
-                    break
-            if game_exists: 
-                continue
-            opponent = game['opponent']
-            opp_kenpom = simmed_kenpoms[opponent]
-            win_prob = scorer.get_win_prob(team_kenpom['rating'], opp_kenpom['rating'], game['location'])
-            new_game = Game(opponent, game['location'], 75, 0, '10-10', game['conference_game'])
-            opp_game = Game(team, reverse_location(game['location']), 0, 75, '10-10', game['conference_game'])
-            win_result = random.random()
-            if win_result < win_prob:
-                new_game.opp_score = 70
-                opp_game.team_score = 70
-                if game['conference_game']:
-                    scorer.teams[team].conference_wins += 1
-                    scorer.teams[opponent].conference_losses += 1
-            else:
-                new_game.opp_score = 80
-                opp_game.team_score = 80
-                if game['conference_game']:
-                    scorer.teams[team].conference_losses += 1
-                    scorer.teams[opponent].conference_wins += 1
-            scorer.teams[team].games.add(new_game)
-            scorer.teams[opponent].games.add(opp_game)
-            for index, future_game in enumerate(scorer.teams[opponent].future_games):
-                if future_game['opponent'] == team and future_game['location'] == opp_game.location:
-                    break
-            try:
-                scorer.teams[opponent].future_games = scorer.teams[opponent].future_games[:index] + \
-                    scorer.teams[opponent].future_games[index+1:]
-            except IndexError:
-                scorer.teams[opponent].future_games = scorer.teams[opponent].future_games[:index]
-        simmed_kenpoms[team] = team_kenpom
+    store = scorer.game_store
+    store.record_simulated_season(regular_season)
+    wins, losses, conference_wins, conference_losses = records
+    for team_id, team in enumerate(store.team_names):
+        scorer.teams[team].conference_wins = int(conference_wins[team_id])
+        scorer.teams[team].conference_losses = int(conference_losses[team_id])
+        scorer.teams[team].simulated_wins = int(wins[team_id] - store.played_wins[team_id])
+        scorer.teams[team].simulated_losses = int(losses[team_id] - store.played_losses[team_id])
         results['teams'][team] = {
-                "wins": len(list(filter(lambda x: x.win, scorer.teams[team].games))),
-                "losses": len(list(filter(lambda x: not x.win, scorer.teams[team].games))),
+                "wins": int(wins[team_id]),
+                "losses": int(losses[team_id]),
                 "conference_wins": 0,
                 "conference_losses": 0,
                 "conference_seed": 0,
                 "ctourn_winner": False,
+                "auto_bid_odds": 0,
                 "ncaa_seed": -1,
                 "ncaa_round": -1
             }
     
-    conf_reg_winners = simulate_conference_tournaments(scorer, builder, simmed_kenpoms, results)
+    conf_reg_winners = simulate_conference_tournaments(scorer, builder, simmed_kenpoms, results, rng)
     #print_Illinois(scorer, simmed_kenpoms)
     scorer.build_scores(weights, simmed_kenpoms)
-    builder.select_seed_and_print_field()
+    builder.select_seed_and_print_field(scorer.seed_list)
     builder.build_bracket()
     for team in scorer.teams:
-        if scorer.teams[team].auto_bid or scorer.teams[team].at_large_bid:
-            results['tournament'].append([team, scorer.teams[team].seed])
-    winners = simulate_tournament(builder, simmed_kenpoms, scorer, results)
+        if builder.state.has_auto_bid(team) or builder.state.has_at_large_bid(team):
+            results['tournament'].append([team, builder.state.get_seed(team)])
+    winners = simulate_tournament(builder, simmed_kenpoms, scorer, rng, results)
     results['final_four'] += winners[-7:-3]
     results['champion'].append(winners[-1])
     for conference in conf_reg_winners:
@@ -1497,6 +1537,7 @@ def scrape_initial_kenpom(year, scorer):
         #   conference_losses: X
         #   conference_seed: X
         #   ctourn_winner: T/F
+        #   auto_bid_odds: X
         #   ncaa_seed: X/-1
         #   ncaa_round: -1/0/1/2/3/4/5/6/7
         #}
@@ -1505,7 +1546,7 @@ def output_team_html(mens, team, team_out, record, conference_record, team_resul
     total_runs = len(team_results)
     win_conference = len(list(filter(lambda x: x['conference_seed'] == 1, team_results)))
     make_tournament = len(list(filter(lambda x: x['ncaa_seed'] > 0, team_results)))
-    auto_bid = len(list(filter(lambda x: x['ctourn_winner'], team_results)))
+    auto_bid = sum(x['auto_bid_odds'] for x in team_results)
     final_four = len(list(filter(lambda x: x['ncaa_round'] >= 5, team_results)))
     national_championship = len(list(filter(lambda x: x['ncaa_round'] == 7, team_results)))
 
@@ -1806,9 +1847,200 @@ def print_bracket(winners, old_regions):
     print(regions[1][15].ljust(space) + myfirst + regions[3][15].rjust(space))
     print()
 
+#run a batch of simulations of the rest of the season and count up how they turned out
+#param first_sim: number of the first simulation in the batch, for printing
+#param sim_seeds: list of numpy SeedSequences, one per simulation to run. every random number in a simulation comes from its own
+#   seed, so a simulation turns out the same no matter which batch or process it's run in
+#returns: dict of counts of each outcome, plus each team's result in every simulation
+def run_simulations(first_sim, sim_seeds, scorer, builder, base_weights, season_days, days_left):
+    counts = {
+        "made_tournament": dict(),
+        "team_seeds": dict(),
+        "final_fours": dict(),
+        "national_champion": dict(),
+        "final_conference_winners": dict(),
+        "team_results": dict(),
+        "successful_runs": 0
+    }
+    for conference in builder.state.conference_winners:
+        counts["final_conference_winners"][conference] = dict()
+    for team in scorer.teams:
+        #each object in list:
+        #{
+        #   wins: X
+        #   losses: X
+        #   conference_wins: X
+        #   conference_losses: X
+        #   conference_seed: X
+        #   ctourn_winner: T/F
+        #   auto_bid_odds: X
+        #   ncaa_seed: X/-1
+        #   ncaa_round: -1/0/1/2/3/4/5/6/7
+        #}
+        counts["team_results"][team] = list()
+    #every simulation builds its bracket from scratch
+    empty_state = builder.state.copy()
+    store = scorer.game_store
+    kenpom_ratings = numpy.array([scorer.team_kenpoms[team]["rating"] for team in store.team_names])
+    for block_start in range(0, len(sim_seeds), SIMULATION_BLOCK_SIZE):
+        rngs = [numpy.random.default_rng(sim_seed) for sim_seed in sim_seeds[block_start:block_start + SIMULATION_BLOCK_SIZE]]
+        ratings = numpy.array([rng.normal(kenpom_ratings, 5.8639*days_left/season_days) for rng in rngs])
+        block_weights = list()
+        for rng in rngs:
+            # vary weights a little bit
+            block_weights.append({weight: rng.uniform(0.8, 1.2)*base_weights[weight] for weight in base_weights})
+        regular_seasons = simulate_regular_seasons(scorer, ratings, rngs)
+        records = store.get_simulated_records(regular_seasons)
+        for sim, rng in enumerate(rngs):
+            print("Running sim", first_sim + block_start + sim)
+            store.reset_simulation()
+            builder.state.restore(empty_state)
+            simmed_kenpoms = {team: {"rating": rating} for team, rating in zip(store.team_names, ratings[sim].tolist())}
+            rank_counter = 1
+            for team in sorted(simmed_kenpoms, key=lambda x: simmed_kenpoms[x]["rating"], reverse=True):
+                simmed_kenpoms[team]["rank"] = rank_counter
+                rank_counter += 1
+            try:
+                results = simulate_games(scorer, builder, block_weights[sim], simmed_kenpoms, rng, regular_seasons[sim], \
+                        [record[sim] for record in records])
+            except Exception as e:
+                print(e)
+                print("big ol failure, bummer boy")
+                continue
+            #scores and resumes written after the run show the last simulation
+            if block_start + sim == len(sim_seeds) - 1:
+                builder.publish_bracket()
+            for team in results['tournament']:
+                add_or_increment_key(team[0], counts["made_tournament"])
+                if team[0] in counts["team_seeds"]:
+                    counts["team_seeds"][team[0]].append(team[1])
+                else:
+                    counts["team_seeds"][team[0]] = [team[1]]
+            for team in results['final_four']:
+                add_or_increment_key(team, counts["final_fours"])
+            for team in results['champion']:
+                add_or_increment_key(team, counts["national_champion"])
+            for team in results['teams']:
+                counts["team_results"][team].append(results['teams'][team])
+            for conference in results['conference']:
+                add_or_increment_key(results['conference'][conference][0], counts["final_conference_winners"][conference])
+            counts["successful_runs"] += 1
+    
+    return counts
+
+#run one worker's share of the simulations and send back its counts
+#runs in a forked process, so it has its own copy of the scorer and builder to mess with
+#param queue: multiprocessing Queue to put (worker number, counts) on
+#param worker: number of this worker
+#param sim_seeds: numpy SeedSequences for this worker's simulations
+def run_simulation_worker(queue, worker, first_sim, sim_seeds, scorer, builder, base_weights, season_days, days_left):
+    counts = None
+    try:
+        counts = run_simulations(first_sim, sim_seeds, scorer, builder, base_weights, season_days, days_left)
+    finally:
+        queue.put((worker, counts))
+
+#split the simulations across several processes, then add their counts back together
+#the last simulation runs here rather than in a worker, so its bracket and scores are left behind for the outputs
+#param sim_seeds: numpy SeedSequences, one per simulation to run
+#param jobs: number of processes to run them in
+#returns: the combined counts, in the same form as run_simulations
+def run_parallel_simulations(sim_seeds, jobs, scorer, builder, base_weights, season_days, days_left):
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    simulations = len(sim_seeds) - 1
+    workers = list()
+    first_sim = 0
+    for worker in range(jobs):
+        num_sims = simulations//jobs + (1 if worker < simulations % jobs else 0)
+        workers.append(context.Process(target=run_simulation_worker, args=(queue, worker, first_sim, \
+                sim_seeds[first_sim:first_sim + num_sims], scorer, builder, base_weights, season_days, days_left)))
+        first_sim += num_sims
+    for process in workers:
+        process.start()
+    last_counts = run_simulations(simulations, sim_seeds[simulations:], scorer, builder, base_weights, season_days, days_left)
+    worker_counts = dict()
+    while len(worker_counts) < jobs:
+        finished = [worker for worker, process in enumerate(workers) if process.exitcode is not None]
+        try:
+            worker, counts = queue.get(timeout=WORKER_POLL_SECONDS)
+            worker_counts[worker] = counts
+        except Empty:
+            #a worker that was killed never sends anything back, so stop waiting on it
+            #anything a worker sent before it exited was already waiting in the queue
+            for worker in finished:
+                if worker not in worker_counts:
+                    worker_counts[worker] = None
+    if None in worker_counts.values():
+        for process in workers:
+            if process.is_alive():
+                process.terminate()
+        print("a simulation worker failed, bummer boy")
+        sys.exit()
+    for process in workers:
+        process.join()
+
+    #merge in worker order so the combined results list sims in order
+    counts = worker_counts[0]
+    for worker_count in [worker_counts[worker] for worker in range(1, jobs)] + [last_counts]:
+        for outcome in ["made_tournament", "final_fours", "national_champion"]:
+            for team, count in worker_count[outcome].items():
+                counts[outcome][team] = counts[outcome].get(team, 0) + count
+        for conference, conference_counts in worker_count["final_conference_winners"].items():
+            for team, count in conference_counts.items():
+                counts["final_conference_winners"][conference][team] = \
+                        counts["final_conference_winners"][conference].get(team, 0) + count
+        for team, seeds in worker_count["team_seeds"].items():
+            counts["team_seeds"][team] = counts["team_seeds"].get(team, list()) + seeds
+        for team, team_results in worker_count["team_results"].items():
+            counts["team_results"][team] += team_results
+        counts["successful_runs"] += worker_count["successful_runs"]
+    return counts
+
+#write the page of each team's odds of reaching each round of a set bracket
+#param results: dict with each team's ncaa_seed under ["teams"][team]
+#param all_results: dict of each team's count of reaching each round
+#param total: what the counts are out of (the number of simulations, or 1 if they're already probabilities)
+def output_tournament_odds_html(mc_output_html, builder, scorer, results, all_results, total):
+    f = open(mc_output_html, "w")
+    builder.output_meta(f)
+    builder.output_link_row(f, "")
+    f.write('<body>\n')
+    f.write('<div class="table_container">\n')
+    f.write('  <table class="outcomes_table">\n')
+    f.write('    <colgroup><col class="teamcol"><col class="confcol"><col class="autocol"><col class="tourncol">')
+    f.write('<col class="srcol"><col class="sscol"><col class="eecol">')
+    f.write('<col class="ffcol"><col class="ncgcol"><col class="nccol"></colgroup>\n')
+    f.write('    <thead>\n')
+    f.write('      <tr class="header_row"><th>Team</th><th>Seed</th><th>1st Round</th>')
+    f.write('<th>2nd Round</th><th>Sweet 16</th><th>Elite 8</th><th>Final Four</th>')
+    f.write('<th>Champ game</th><th>Win champ</th>')
+    f.write('</tr>')
+    f.write('    </thead>\n')
+    f.write('    <tbody>\n')
+
+    for team in sorted(all_results, key=lambda x: all_results[x]['championship'], reverse=True):
+        if builder.mens:
+            f.write('    <tr><td><img class="tiny_logo" src="assets/' + team + '.png"/><a href="team_pages/' + team + '.html">' + scorer.teams[team].team_out + '</a></td>')
+        else:
+            f.write('    <tr><td><img class="tiny_logo" src="assets/' + team + '.png"/><a href="team_pagesw/' + team + '.html">' + scorer.teams[team].team_out + '</a></td>')
+        f.write('<td>' + str(results["teams"][team]["ncaa_seed"]) + '</td>')
+        for outcome_string in TOURNAMENT_ROUNDS:
+            outcome_percentage = round(all_results[team][outcome_string]*100/total, 2)
+            color_percentage = str(-outcome_percentage / 2 + 100)
+            f.write('<td class="pct_col" style="background-color: hsl(120, 50%, ' + color_percentage + '%)">' + str(outcome_percentage) + '%</td>')
+        f.write('</tr>\n')
+    f.close()
+
 #run a monte carlo simulation of the remaining college basketball season
-def run_monte_carlo(simulations, scorer, builder, mens, weightfile, mc_outputfile, mc_output_html, tournament_selected):
-    rng = numpy.random.default_rng()
+#param seed: number to seed the simulations with, so a run can be repeated exactly. None to pick one at random
+#param exact_points: if nonzero, work out exact odds for the set bracket with this many quadrature points instead of simulating
+#param verbose: print every simulated bracket in post-selection mode
+def run_monte_carlo(simulations, jobs, seed, scorer, builder, mens, weightfile, mc_outputfile, mc_output_html, \
+        tournament_selected, exact_points, verbose):
+    seed_seq = numpy.random.SeedSequence(seed)
+    if seed is None and not exact_points:
+        print("monte carlo seed:", seed_seq.entropy)
     today_date = date.today()
     selection_sunday = date(2026, 3, 15)
     season_start = date(2025, 11, 3)
@@ -1818,16 +2050,6 @@ def run_monte_carlo(simulations, scorer, builder, mens, weightfile, mc_outputfil
     else:
         days_left = (selection_sunday - today_date).days
 
-    made_tournament = dict()
-    final_fours = dict()
-    national_champion = dict()
-    team_seeds = dict()
-    final_conference_winners = dict()
-    team_results = dict()
-    for conference in builder.conference_winners:
-        final_conference_winners[conference] = dict()
-    first_weekend_sites = list(builder.first_weekend_sites)
-    conference_winners = dict(builder.conference_winners)
     scorer.team_kenpoms = scrape_initial_kenpom(builder.year, scorer)
     base_weights = scorer.get_weights(weightfile)
     if os.path.exists("./my_bets.json"):
@@ -1836,44 +2058,26 @@ def run_monte_carlo(simulations, scorer, builder, mens, weightfile, mc_outputfil
     else:
         my_bets = {}
 
-    for team in scorer.teams:
-        scorer.teams[team].saved_games = set(scorer.teams[team].games)
-        scorer.teams[team].saved_future_games = list([dict(x) for x in scorer.teams[team].future_games])
-
-        #each object in list:
-        #{
-        #   wins: X
-        #   losses: X
-        #   conference_wins: X
-        #   conference_losses: X
-        #   conference_seed: X
-        #   ctourn_winner: T/F
-        #   ncaa_seed: X/-1
-        #   ncaa_round: -1/0/1/2/3/4/5/6/7
-        #}
-        team_results[team] = list()
-    successful_runs = 0
     if tournament_selected:
-        simmed_kenpoms = dict()
         results = {"teams": dict()}
         all_results = dict()
         if builder.mens:
-            builder.regions = {
+            regions = {
                     0: {1: "Duke", 2: "Connecticut", 3: "Michigan-State", 4: "Kansas", 5: "Saint-Johns", 6: "Louisville", 7: "UCLA", 8: "Ohio-State", 9: "TCU", 10: "UCF", 11: "South-Florida", 12: "Northern-Iowa", 13: "California-Baptist", 14: "North-Dakota-State", 15: "Furman", 16: "Siena"},
                     1: {1: "Arizona", 2: "Purdue", 3: "Gonzaga", 4: "Arkansas", 5: "Wisconsin", 6: "BYU", 7: "Miami-FL", 8: "Villanova", 9: "Utah-State", 10: "Missouri", 11: "Texas/North-Carolina-State", 12: "High-Point", 13: "Hawaii", 14: "Kennesaw-State", 15: "Queens", 16: "Long-Island"},
                     2: {1: "Michigan", 2: "Iowa-State", 3: "Virginia", 4: "Alabama", 5: "Texas-Tech", 6: "Tennessee", 7: "Kentucky", 8: "Georgia", 9: "Saint-Louis", 10: "Santa-Clara", 11: "Miami-OH/SMU", 12: "Akron", 13: "Hofstra", 14: "Wright-State", 15: "Tennessee-State", 16: "UMBC/Howard"},
                     3: {1: "Florida", 2: "Houston", 3: "Illinois", 4: "Nebraska", 5: "Vanderbilt", 6: "North-Carolina", 7: "Saint-Marys-College", 8: "Clemson", 9: "Iowa", 10: "Texas-AM", 11: "VCU", 12: "McNeese", 13: "Troy", 14: "Penn", 15: "Idaho", 16: "Prairie-View-AM/Lehigh"},
             }
         else:
-            builder.regions = {
+            regions = {
                 0: {1: "Connecticut", 2: "Vanderbilt", 3: "Ohio-State", 4: "North-Carolina", 5: "Maryland", 6: "Notre-Dame", 7: "Illinois", 8: "Iowa-State", 9: "Syracuse", 10: "Colorado", 11: "Fairfield", 12: "Murray-State", 13: "Western-Illinois", 14: "Howard", 15: "High-Point", 16: "UTSA"},
                 1: {1: "UCLA", 2: "LSU", 3: "Duke", 4: "Minnesota", 5: "Ole-Miss", 6: "Baylor", 7: "Texas-Tech", 8: "Oklahoma-State", 9: "Princeton", 10: "Villanova", 11: "Nebraska/Richmond", 12: "Gonzaga", 13: "Green-Bay", 14: "Charleston", 15: "Jacksonville", 16: "California-Baptist"},
                 2: {1: "Texas", 2: "Michigan", 3: "Louisville", 4: "West-Virginia", 5: "Kentucky", 6: "Alabama", 7: "North-Carolina-State", 8: "Oregon", 9: "Virginia-Tech", 10: "Tennessee", 11: "Rhode-Island", 12: "James-Madison", 13: "Miami-OH", 14: "Vermont", 15: "Holy-Cross", 16: "Missouri-State/Stephen-F-Austin"},
                 3: {1: "South-Carolina", 2: "Iowa", 3: "TCU", 4: "Oklahoma", 5: "Michigan-State", 6: "Washington", 7: "Georgia", 8: "Clemson", 9: "USC", 10: "Virginia/Arizona-State", 11: "South-Dakota-State", 12: "Colorado-State", 13: "Idaho", 14: "UC-San-Diego", 15: "Fairleigh-Dickinson", 16: "Southern/Samford"},
             }
-        for region in builder.regions:
-            for seed in builder.regions[region]:
-                team = builder.regions[region][seed]
+        for region in regions:
+            for seed in regions[region]:
+                team = regions[region][seed]
                 if "/" not in team:
                     results["teams"][team] = dict()
                     all_results[team] = {
@@ -1897,101 +2101,64 @@ def run_monte_carlo(simulations, scorer, builder, mens, weightfile, mc_outputfil
                             'ncg': 0,
                             'championship': 0
                         }
-        for i in range(simulations):
-            print("Running sim", i)
-            for team in results["teams"]:
-                simmed_kenpoms[team] = {"rating": rng.normal(scorer.team_kenpoms[team]["rating"], 0.8)}
-            winners = simulate_tournament(builder, simmed_kenpoms, scorer, results)
-            print_bracket(winners, builder.regions)
-            for team in results["teams"]:
-                team_result = results["teams"][team]
-                for tourney_round in [('first_round', 1), ('second_round', 2), ('sweet_sixteen', 3), ('elite_eight', 4), ('final_four', 5), ('ncg', 6), ('championship', 7)]:
-                    if team_result["ncaa_round"] >= tourney_round[1]:
-                        all_results[team][tourney_round[0]] += 1
-        
+        tournament_teams = list(results["teams"])
+        team_ids = {team: index for index, team in enumerate(tournament_teams)}
+        slots = list()
+        for region_num in [0, 3, 1, 2]:
+            for seed in BRACKET_SEED_ORDER:
+                slots.append([team_ids[team] for team in regions[region_num][seed].split("/")])
+                for team in regions[region_num][seed].split("/"):
+                    results["teams"][team]["ncaa_seed"] = seed
+        base_ratings = numpy.array([scorer.team_kenpoms[team]["rating"] for team in tournament_teams])
+        if exact_points:
+            round_odds = get_exact_tournament_odds(slots, base_ratings, exact_points, scorer)
+            for tourney_round, odds in zip(TOURNAMENT_ROUNDS, round_odds):
+                for team, odd in zip(tournament_teams, odds.tolist()):
+                    all_results[team][tourney_round] = odd
+            total = 1
+        else:
+            #one random stream per chunk of tournaments, rather than per tournament, so millions of them stay cheap
+            chunk_starts = range(0, simulations, TOURNAMENT_CHUNK_SIZE)
+            for chunk_start, chunk_seed in zip(chunk_starts, seed_seq.spawn(len(chunk_starts))):
+                num_sims = min(TOURNAMENT_CHUNK_SIZE, simulations - chunk_start)
+                print("Running sims", chunk_start, "to", chunk_start + num_sims - 1)
+                rng = numpy.random.default_rng(chunk_seed)
+                ratings = rng.normal(base_ratings, 0.8, size=(num_sims, len(base_ratings)))
+                rounds = simulate_tournaments(slots, ratings, scorer, rng)
+                for tourney_round, alive in zip(TOURNAMENT_ROUNDS, rounds):
+                    round_counts = numpy.bincount(alive.ravel(), minlength=len(tournament_teams))
+                    for team, count in zip(tournament_teams, round_counts.tolist()):
+                        all_results[team][tourney_round] += count
+                if verbose:
+                    for sim in range(num_sims):
+                        print_bracket([tournament_teams[team] for alive in rounds[1:] for team in alive[sim]], regions)
+            total = simulations
         if mc_output_html:
-            f = open(mc_output_html, "w")
-            builder.output_meta(f)
-            builder.output_link_row(f, "")
-            f.write('<body>\n')
-            f.write('<div class="table_container">\n')
-            f.write('  <table class="outcomes_table">\n')
-            f.write('    <colgroup><col class="teamcol"><col class="confcol"><col class="autocol"><col class="tourncol">')
-            f.write('<col class="srcol"><col class="sscol"><col class="eecol">')
-            f.write('<col class="ffcol"><col class="ncgcol"><col class="nccol"></colgroup>\n')
-            f.write('    <thead>\n')
-            f.write('      <tr class="header_row"><th>Team</th><th>Seed</th><th>1st Round</th>')
-            f.write('<th>2nd Round</th><th>Sweet 16</th><th>Elite 8</th><th>Final Four</th>')
-            f.write('<th>Champ game</th><th>Win champ</th>')
-            f.write('</tr>')
-            f.write('    </thead>\n')
-            f.write('    <tbody>\n')
-
-            for team in sorted(all_results, key=lambda x: all_results[x]['championship'], reverse=True):
-                if builder.mens:
-                    f.write('    <tr><td><img class="tiny_logo" src="assets/' + team + '.png"/><a href="team_pages/' + team + '.html">' + scorer.teams[team].team_out + '</a></td>')
-                else:
-                    f.write('    <tr><td><img class="tiny_logo" src="assets/' + team + '.png"/><a href="team_pagesw/' + team + '.html">' + scorer.teams[team].team_out + '</a></td>')
-                f.write('<td>' + str(results["teams"][team]["ncaa_seed"]) + '</td>')
-                for outcome_string in ['first_round', 'second_round', 'sweet_sixteen', 'elite_eight', 'final_four', 'ncg', 'championship']:
-                    outcome_percentage = round(all_results[team][outcome_string]*100/simulations, 2)
-                    color_percentage = str(-outcome_percentage / 2 + 100)
-                    f.write('<td class="pct_col" style="background-color: hsl(120, 50%, ' + color_percentage + '%)">' + str(outcome_percentage) + '%</td>')
-                f.write('</tr>\n')
-
+            output_tournament_odds_html(mc_output_html, builder, scorer, results, all_results, total)
         return
 
-    for i in range(simulations):
-        print("Running sim", i)
-        for team in scorer.teams:
-            scorer.teams[team].games = set(scorer.teams[team].saved_games)
-            scorer.teams[team].future_games = list(scorer.teams[team].saved_future_games)
-            scorer.teams[team].at_large_bid = False
-            scorer.teams[team].auto_bid = False
-            scorer.teams[team].region = -1
-            scorer.teams[team].seed = -1
-            scorer.teams[team].conference_wins = 0
-            scorer.teams[team].conference_losses = 0
-            simmed_kenpoms[team] = {"rating": rng.normal(scorer.team_kenpoms[team]["rating"], 5.8639*days_left/season_days)}
-        rank_counter = 1
-        for team in sorted(simmed_kenpoms, key=lambda x: simmed_kenpoms[x]["rating"], reverse=True):
-            simmed_kenpoms[team]["rank"] = rank_counter
-            rank_counter += 1
-        builder.first_weekend_sites = list(first_weekend_sites)
-        builder.conference_winners = dict(conference_winners)
-        weights = dict()
-        # vary weights a little bit
-        for weight in base_weights:
-            weights[weight] = random.uniform(0.8, 1.2)*base_weights[weight]
-        try:
-            results = simulate_games(scorer, builder, weights, simmed_kenpoms)
-        except Exception as e:
-            print(e)
-            print("big ol failure, bummer boy")
-            continue
-        for team in results['tournament']:
-            add_or_increment_key(team[0], made_tournament)
-            if team[0] in team_seeds:
-                team_seeds[team[0]].append(team[1])
-            else:
-                team_seeds[team[0]] = [team[1]]
-        for team in results['final_four']:
-            add_or_increment_key(team, final_fours)
-        for team in results['champion']:
-            add_or_increment_key(team, national_champion)
-        for team in results['teams']:
-            team_results[team].append(results['teams'][team])
-        for conference in results['conference']:
-            add_or_increment_key(results['conference'][conference][0], final_conference_winners[conference])
-        successful_runs += 1
-    
+    sim_seeds = seed_seq.spawn(simulations)
+    if jobs > 1:
+        counts = run_parallel_simulations(sim_seeds, jobs, scorer, builder, base_weights, season_days, days_left)
+    else:
+        counts = run_simulations(0, sim_seeds, scorer, builder, base_weights, season_days, days_left)
+    made_tournament = counts["made_tournament"]
+    team_seeds = counts["team_seeds"]
+    final_fours = counts["final_fours"]
+    national_champion = counts["national_champion"]
+    final_conference_winners = counts["final_conference_winners"]
+    team_results = counts["team_results"]
+    successful_runs = counts["successful_runs"]
+
     conference_results = dict()
     for conference in final_conference_winners:
         conference_results[conference] = dict()
 
+    scorer.game_store.reset_simulation()
+    scorer.clear_score_cache()  #the cached scores came from simulated seasons
     for team in scorer.teams: #do this so that the output has the correct current record
-        scorer.teams[team].games = set(scorer.teams[team].saved_games)
-        scorer.teams[team].future_games = list(scorer.teams[team].saved_future_games)
+        scorer.teams[team].simulated_wins = 0
+        scorer.teams[team].simulated_losses = 0
         conference_results[builder.teams[team].conference][team] = {
             'conference_wins': sum(x['conference_wins'] for x in team_results[team])/len(team_results[team]),
             'conference_losses': sum(x['conference_losses'] for x in team_results[team])/len(team_results[team])
@@ -2147,7 +2314,7 @@ def run_monte_carlo(simulations, scorer, builder, mens, weightfile, mc_outputfil
             write_odds_margin(f, team, odds, current_odds, 'championship', my_bets)
 
     for team in made_tournament:
-        result_percents[team]['auto_bid'] = len(list(filter(lambda x: x['ctourn_winner'], team_results[team])))/successful_runs
+        result_percents[team]['auto_bid'] = sum(x['auto_bid_odds'] for x in team_results[team])/successful_runs
         for tourney_round in [('second_round', 2), ('sweet_sixteen', 3), ('elite_eight', 4), ('ncg', 6)]:
             result_percents[team][tourney_round[0]] = len(list(filter(lambda x: x['ncaa_round'] >= tourney_round[1], team_results[team])))/successful_runs
 
@@ -2218,10 +2385,21 @@ def main():
     scraper = Scraper()
     scraper.year, scraper.mens, scraper.outputfile, scraper.resumefile, scraper.webfile, resumewebfile, \
             upcomingschedulefile, scraper.datadir, should_scrape, force_scrape, scraper.verbose, \
-            scraper.tracker, weightfile, future, monte_carlo, mc_outputfile, simulations, mc_output_html, \
-            tournament_selected = process_args()
-    builder = scraper.load_data(should_scrape, force_scrape, future, monte_carlo)
+            scraper.tracker, weightfile, future, monte_carlo, mc_outputfile, simulations, simulation_jobs, \
+            simulation_seed, mc_output_html, tournament_selected, exact_points, scraper.scrape_workers, scrape_rate, incremental_scrape, \
+            what_if = process_args()
+    scraper.http = HTTPClient(scrape_rate, scraper.scrape_workers)
+    builder = scraper.load_data(should_scrape, force_scrape, incremental_scrape, future, monte_carlo)
+    if what_if and (what_if[0] not in scraper.teams or what_if[1] not in scraper.teams):
+        print("what if game should look like winner,loser,H/A/N")
+        sys.exit()
+    if (future or monte_carlo) and not scraper.tracker:
+        scraper.load_schedule_data(should_scrape, force_scrape)
     scorer = Scorer(builder, future, scraper.mens, scraper.tracker, monte_carlo)
+    scorer.game_store = GameStore(scraper.teams)
+    if scraper.verbose:
+        print("game store:", len(scorer.game_store.opponent), "games,", len(scorer.game_store.future_opponent), \
+                "future games,", scorer.game_store.get_nbytes(), "bytes")
     if scraper.tracker:
         tracker = Tracker(builder, scorer, scraper.year, scraper.verbose, scraper.mens)
         tracker.load_results()
@@ -2238,9 +2416,8 @@ def main():
         print([str(round(x/51, 3)).ljust(5) for x in summed_weights])
         return
     elif monte_carlo:
-        scraper.load_schedule_data(should_scrape, force_scrape)
-        run_monte_carlo(simulations, scorer, builder, scraper.mens, weightfile, \
-                mc_outputfile, mc_output_html, tournament_selected)
+        run_monte_carlo(simulations, simulation_jobs, simulation_seed, scorer, builder, scraper.mens, weightfile, \
+                mc_outputfile, mc_output_html, tournament_selected, exact_points, scraper.verbose)
         if scraper.outputfile:
             scorer.outputfile = scraper.outputfile
             scorer.output_scores()
@@ -2248,11 +2425,16 @@ def main():
             scraper.output_resume(scorer, builder)
     else:
         if future:
-            scraper.load_schedule_data(should_scrape, force_scrape)
             scorer.team_kenpoms = scrape_initial_kenpom(builder.year, scorer)
         weights = scorer.get_weights(weightfile)
         scorer.build_scores(weights)
-        builder.select_seed_and_print_field()
+        if what_if:
+            winner, loser, location = what_if
+            what_if_scores = scorer.get_what_if_scores(winner, loser, location, weights)
+            print("What if", winner, "beats", loser, "(" + location + ")?")
+            for team in [winner, loser]:
+                print(team.ljust(20), round(scraper.teams[team].score, 5), "->", round(what_if_scores[team], 5))
+        builder.select_seed_and_print_field(scorer.seed_list)
         builder.build_bracket()
         if scraper.outputfile:
             scorer.outputfile = scraper.outputfile
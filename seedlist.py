@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+import heapq
+
+SEED_LIST_SIZE = 80     #teams ranked up front. the field and the bubble come from about this far down the list
+
+#class to hold the teams in score order after a scoring pass, so nobody has to sort the whole league again
+#only the top of the list is ranked up front. the rest is only sorted if something needs all of it
+#the builder fills in the field and the bubble as it selects them
+class SeedList:
+
+    #param teams: dict of team names to Team objects, already scored
+    #param size: number of teams to rank up front
+    def __init__(self, teams, size=SEED_LIST_SIZE):
+        self.teams = teams
+        self.top = heapq.nlargest(size, teams, key=lambda team: teams[team].score)    #same order sorted() would give
+        self.top_teams = set(self.top)
+        self.order = None
+        self.field = list()     #teams in the tournament, best first
+        self.bubble = list()    #first four out, then next four out
+        return
+
+    #every team, best first. sorts the rest of the league the first time it's asked for
+    def get_order(self):
+        if self.order is None:
+            self.order = self.top + self.get_rest()
+        return self.order
+
+    #the teams below the top of the list, best first
+    #param keep: if given, only the teams this returns true for
+    def get_rest(self, keep=None):
+        if self.order is not None and keep is None:
+            return self.order[len(self.top):]
+        rest = [team for team in self.teams if team not in self.top_teams and (keep is None or keep(team))]
+        return sorted(rest, key=lambda team: self.teams[team].score, reverse=True)
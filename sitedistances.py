@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+import hashlib
+import numpy
+import os
+
+TEAM_COORDINATES_FILE = "lib/team_locations.txt"
+SITE_DISTANCES_FILE = "site_distances.npz"     #lives next to the resumes dir
+EARTH_RADIUS = 3958.8   #miles
+
+#read a coordinates file, one "Name[lat° N, long° W]" per line
+#param filename: file to read
+#returns: list of names, array of [latitude, longitude] in degrees, one row per name
+def read_coordinates(filename):
+    names = list()
+    coordinates = list()
+    with open(filename, "r") as f:
+        for line in f:
+            if "[" not in line:
+                continue
+            names.append(line[:line.find("[")])
+            coordinates.append([float(line[line.find("[")+1:line.find(" N, ")-1]), \
+                    float(line[line.find(" N, ")+4:line.find(" W]")-1])])
+    return names, numpy.array(coordinates, dtype=float).reshape(-1, 2)
+
+#great-circle distance from every point in one list to every point in another
+#param from_coordinates: array of [latitude, longitude] in degrees
+#param to_coordinates: array of [latitude, longitude] in degrees
+#returns: array of distances in miles, one row per from point and one column per to point
+def get_haversine_distances(from_coordinates, to_coordinates):
+    from_lat, from_long = numpy.radians(from_coordinates).T[:, :, None]
+    to_lat, to_long = numpy.radians(to_coordinates).T[:, None, :]
+    a = numpy.sin((to_lat - from_lat)/2)**2 + numpy.cos(from_lat)*numpy.cos(to_lat)*numpy.sin((to_long - from_long)/2)**2
+    return 2*EARTH_RADIUS*numpy.arcsin(numpy.sqrt(a))
+
+#class to hold how far every school is from every site, and from every other school for the women's first weekend
+#worked out once per season from the coordinates files and kept on disk until one of them changes
+class SiteDistances:
+
+    #param team_file: file of school coordinates
+    #param site_file: file of this season's site coordinates
+    #param cache_file: where to keep the distances between runs
+    def __init__(self, team_file, site_file, cache_file):
+        sources = hashlib.sha1()
+        for filename in [team_file, site_file]:
+            with open(filename, "rb") as f:
+                sources.update(f.read())
+        self.sources = sources.hexdigest()
+        self.team_names, self.team_coordinates = read_coordinates(team_file)
+        self.site_names, site_coordinates = read_coordinates(site_file)
+        self.team_ids = {team: index for index, team in enumerate(self.team_names)}
+        if not self.load(cache_file):
+            self.site_distances = get_haversine_distances(self.team_coordinates, site_coordinates)
+            self.team_distances = get_haversine_distances(self.team_coordinates, self.team_coordinates)
+            self.save(cache_file)
+        #each school's sites, closest first. ties stay in file order
+        self.site_orders = numpy.argsort(self.site_distances, axis=1, kind="stable")
+        return
+
+    #read the distances from the last run, if they came from the same coordinates
+    #param cache_file: where the distances are kept
+    #returns: whether they could be used
+    def load(self, cache_file):
+        if not os.path.exists(cache_file):
+            return False
+        with numpy.load(cache_file) as cached:
+            if str(cached["sources"]) != self.sources:
+                return False
+            self.site_distances = cached["site_distances"]
+            self.team_distances = cached["team_distances"]
+        return True
+
+    #keep the distances around for the next run
+    #param cache_file: where to keep the distances
+    def save(self, cache_file):
+        if os.path.dirname(cache_file) and not os.path.exists(os.path.dirname(cache_file)):
+            return
+        with open(cache_file, "wb") as f:
+            numpy.savez(f, sources=self.sources, site_distances=self.site_distances, team_distances=self.team_distances)
+
+    #get a school's sites, closest first
+    #param team: name of school
+    #param sites: names of the sites to order, from the site file
+    def get_site_order(self, team, sites):
+        return [self.site_names[site_id] for site_id in self.site_orders[self.team_ids[team]] if self.site_names[site_id] in sites]
+
+    #get a school's distance to another school's home court
+    #param team: name of school
+    #param host: name of the school hosting
+    def get_host_distance(self, team, host):
+        return self.team_distances[self.team_ids[team], self.team_ids[host]]
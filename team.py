@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 
 from game import Game
-import requests
-import sys
 import os
 
 SELECTION_SUNDAY_DATES = {"2026": 15, "2025": 16, "2024": 17, "2023": 12, "2022": 13, "2021": 14}
@@ -27,6 +25,8 @@ class Team:
         self.NET_SOS = 0
         self.noncon_SOS = 0
         self.games = set()
+        self.simulated_wins = 0      #monte carlo games, which live in the game store instead of games
+        self.simulated_losses = 0
         self.auto_bid = False
         self.at_large_bid = False
         self.play_in = False
@@ -46,11 +46,10 @@ class Team:
         self.noncon_SOS = ncsos
         self.games = gms
 
-    def scrape_data(self, team, url, year, mens):
-        team_page = requests.get(url)
-        if team_page.status_code != 200:
-            print("team problem!", url)
-            sys.exit()
+    #fill in this team's data from its warrennolan.com team sheet
+    #param page_text: html of the team sheet
+    #param http: HTTPClient to fetch the team's logo with if we don't have it yet
+    def parse_data(self, team, page_text, year, mens, http):
         SOS_line = 0
         KPI_line = 0
         BPI_line = 0
@@ -59,16 +58,17 @@ class Team:
         game_line = 0
         self.games = set()
         non_di = False
-        for line in team_page.text.split("\n"):
+        for line in page_text.split("\n"):
             if "Non-Division I Games" in line:
                 non_di = True
                 continue
             if "team-menu__image\"" in line and not os.path.exists("./assets/" + team + ".png"):
                 image_url = "http://www.warrennolan.com" + line[line.find("src=")+5:line.find(" />")-1]
-                team_image = requests.get(image_url, stream=True)
-                with open("./assets/" + team + ".png", "xb") as f:
-                    for chunk in team_image:
-                        f.write(chunk)
+                team_image = http.get(image_url, stream=True)
+                if team_image is not None and team_image.status_code == 200:
+                    with open("./assets/" + team + ".png", "xb") as f:
+                        for chunk in team_image:
+                            f.write(chunk)
             if "team-menu__name\"" in line:
                 self.team_out = line[line.find(">")+1:line.find(" <span")]
             if "team-menu__conference" in line:
@@ -213,8 +213,8 @@ class Team:
         return str(wins) + "-" + str(losses)
 
     def get_record(self):
-        wins = 0
-        losses = 0
+        wins = self.simulated_wins
+        losses = self.simulated_losses
         for game in self.games:
             if game.margin > 0:
                 wins += 1
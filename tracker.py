@@ -247,7 +247,7 @@ class Tracker:
         result_score = 0
         bid_count = 0
         actual_count = 0
-        for team in sorted(self.teams, key=lambda x: self.teams[x].score, reverse=True):
+        for team in self.scorer.seed_list.get_order():
             if team in self.ineligible_teams or self.teams[team].record_pct < 0.5:
                 continue
             try: